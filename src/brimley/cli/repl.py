@@ -5,7 +5,7 @@ import json
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 import sys
 from prompt_toolkit import PromptSession
 
@@ -24,6 +24,7 @@ from brimley.runtime.reload_contracts import (
     ReloadSummary,
     format_reload_command_message,
 )
+from brimley.runtime.native_watcher import create_watcher
 from brimley.runtime.polling_watcher import PollingWatcher
 from brimley.runtime.reload_engine import PartitionedReloadEngine
 
@@ -73,6 +74,10 @@ class BrimleyREPL:
         self.mcp_server = None
         self.mcp_server_thread = None
         self._mcp_tool_schema_signatures: dict[str, str] = {}
+        # Per-tool (description, function type) as last registered on the embedded server
+        self._mcp_tool_metadata: dict[str, tuple[str, str]] = {}
+        # Reused across reloads so its model/schema/tool caches persist; dropped on `reset`
+        self._mcp_adapter: Optional[Any] = None
         self.auto_reload_watcher: Optional[PollingWatcher] = None
         self.auto_reload_thread: Optional[threading.Thread] = None
         self._auto_reload_stop_event = threading.Event()
@@ -108,6 +113,21 @@ class BrimleyREPL:
 
         self._initialize_mcp_server()
 
+    def _get_mcp_adapter(self) -> Any:
+        """Return the embedded MCP adapter, rebinding it to the current registry after reloads."""
+        adapter = self._mcp_adapter
+        if adapter is not None:
+            adapter.registry = self.context.functions
+            return adapter
+
+        adapter = BrimleyMCPAdapter(registry=self.context.functions, context=self.context)
+        self._mcp_adapter = adapter
+        return adapter
+
+    def _reset_mcp_adapter(self) -> None:
+        """Drop the cached MCP adapter so the next lookup builds a fresh one."""
+        self._mcp_adapter = None
+
     def _initialize_mcp_server(self) -> None:
         """
         Start embedded MCP server in background when enabled and tools are present.
@@ -115,7 +135,7 @@ class BrimleyREPL:
         if not self.mcp_embedded_enabled:
             return
 
-        adapter = BrimleyMCPAdapter(registry=self.context.functions, context=self.context)
+        adapter = self._get_mcp_adapter()
         tools = adapter.discover_tools()
         schema_signatures_getter = getattr(adapter, "get_tool_schema_signatures", None)
         schema_signatures = (
@@ -142,6 +162,7 @@ class BrimleyREPL:
 
         self.mcp_server = server
         self._mcp_tool_schema_signatures = schema_signatures
+        self._mcp_tool_metadata = self._get_tool_metadata(adapter, tools) or {}
 
         if hasattr(server, "run"):
             host = self.context.mcp.host
@@ -213,6 +234,8 @@ class BrimleyREPL:
                     config_data = load_config(config_path)
                     self.context = BrimleyContext(config_dict=config_data)
                     self.context.app["root_dir"] = str(self.root_dir.expanduser().resolve())
+                    # The cached adapter is bound to the old context
+                    self._reset_mcp_adapter()
 
                     # Keep CLI override precedence after reset
                     self.mcp_embedded_enabled = (
@@ -292,8 +315,9 @@ class BrimleyREPL:
         if self.auto_reload_thread and self.auto_reload_thread.is_alive():
             return
 
-        self.auto_reload_watcher = PollingWatcher(
+        self.auto_reload_watcher = create_watcher(
             root_dir=self.root_dir,
+            backend=self.context.auto_reload.backend,
             interval_ms=self.context.auto_reload.interval_ms,
             debounce_ms=self.context.auto_reload.debounce_ms,
             include_patterns=self.context.auto_reload.include_patterns,
@@ -477,7 +501,7 @@ class BrimleyREPL:
         if not self.mcp_embedded_enabled:
             return
 
-        adapter = BrimleyMCPAdapter(registry=self.context.functions, context=self.context)
+        adapter = self._get_mcp_adapter()
         tools = adapter.discover_tools()
         schema_signatures_getter = getattr(adapter, "get_tool_schema_signatures", None)
         schema_signatures = (
@@ -490,6 +514,7 @@ class BrimleyREPL:
             if self.mcp_server is not None or self.mcp_server_thread is not None:
                 self._shutdown_mcp_server()
             self._mcp_tool_schema_signatures = {}
+            self._mcp_tool_metadata = {}
             return
 
         if not adapter.is_fastmcp_available():
@@ -503,6 +528,18 @@ class BrimleyREPL:
             self._initialize_mcp_server()
             return
 
+        tool_metadata = self._get_tool_metadata(adapter, tools)
+        if (
+            self.mcp_server is not None
+            and tool_metadata is not None
+            and schema_signatures
+            and schema_signatures == self._mcp_tool_schema_signatures
+            and tool_metadata == self._mcp_tool_metadata
+        ):
+            # Registered wrappers resolve functions by name at call time, so identical
+            # schemas, descriptions and types leave nothing to re-register
+            return
+
         schema_changed = (
             bool(self._mcp_tool_schema_signatures)
             and schema_signatures != self._mcp_tool_schema_signatures
@@ -521,6 +558,7 @@ class BrimleyREPL:
                 self._clear_server_tools(self.mcp_server)
                 adapter.register_tools(mcp_server=self.mcp_server)
                 self._mcp_tool_schema_signatures = schema_signatures
+                self._mcp_tool_metadata = tool_metadata or {}
                 OutputFormatter.log("Embedded MCP tools refreshed.", severity="success")
             except Exception as exc:
                 OutputFormatter.log(f"Unable to refresh embedded MCP tools in place: {exc}", severity="warning")
@@ -536,6 +574,13 @@ class BrimleyREPL:
             severity="warning",
         )
 
+    def _get_tool_metadata(self, adapter: Any, tools: list) -> Optional[dict[str, tuple[str, str]]]:
+        """Return per-tool (description, type), or None when the adapter cannot describe tools."""
+        get_description = getattr(adapter, "get_tool_description", None)
+        if not callable(get_description):
+            return None
+        return {func.name: (get_description(func), func.type) for func in tools}
+
     def _supports_tool_reset(self, server: object) -> bool:
         return callable(getattr(server, "clear_tools", None)) or callable(getattr(server, "reset_tools", None))
 
@@ -9,6 +9,8 @@ class AppState:
     Marker for Dependency Injection to request a value from context.app.
     Usage: Annotated[T, AppState("key")]
     """
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         self.key = key
 
@@ -26,6 +28,8 @@ class Config:
     Marker for Dependency Injection to request a value from context.config.
     Usage: Annotated[T, Config("key")]
     """
+    __slots__ = ("key",)
+
     def __init__(self, key: str):
         self.key = key
         
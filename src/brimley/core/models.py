@@ -1,6 +1,8 @@
+import functools
 import re
+import sys
 from typing import Any, Dict, List, Literal, Optional, Union
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from brimley.core.entity import Entity as BaseEntity, PromptMessage
 
@@ -9,6 +11,7 @@ _GENERIC_LIST_PATTERN = re.compile(r"^(?:typing\.)?(?:list|List)\[(.+)\]$")
 _IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
+@functools.lru_cache(maxsize=512)
 def normalize_type_expression(
     type_expr: str,
     *,
@@ -33,7 +36,7 @@ def normalize_type_expression(
         )
         if inner.endswith("[]"):
             raise ValueError(f"Only one-dimensional lists are supported in v0.4: '{type_expr}'")
-        return f"{inner}[]"
+        return sys.intern(f"{inner}[]")
 
     if normalized.endswith("[]"):
         inner = normalize_type_expression(
@@ -43,7 +46,7 @@ def normalize_type_expression(
         )
         if inner.endswith("[]"):
             raise ValueError(f"Only one-dimensional lists are supported in v0.4: '{type_expr}'")
-        return f"{inner}[]"
+        return sys.intern(f"{inner}[]")
 
     canonical: dict[str, str] = {
         "str": "string",
@@ -84,7 +87,8 @@ def normalize_type_expression(
     if not _IDENTIFIER_PATTERN.fullmatch(entity_candidate):
         raise ValueError(f"Unsupported type expression in v0.4: '{type_expr}'")
 
-    return entity_candidate
+    # Interned so downstream registry/primitive lookups compare by identity first
+    return sys.intern(entity_candidate)
 
 class FrameworkSettings(BaseSettings):
     """
@@ -122,6 +126,8 @@ class AutoReloadSettings(BaseModel):
     model_config = ConfigDict(extra='ignore')
 
     enabled: bool = False
+    # 'native' uses OS file events via the optional watchdog package, falling back to polling
+    backend: Literal["polling", "native"] = "polling"
     interval_ms: int = Field(default=1000, ge=100)
     debounce_ms: int = Field(default=300, ge=0)
     include_patterns: List[str] = Field(default_factory=lambda: ["*.py", "*.sql", "*.md", "*.yaml"])
@@ -169,6 +175,21 @@ class BrimleyFunction(BaseEntity):
     timeout_seconds: Optional[float] = Field(default=None, gt=0)
     return_shape: Union[str, Dict[str, Any]]
 
+    # Compiled return-shape plan, populated lazily by ResultMapper.compile_return_shape
+    _return_plan: Any = PrivateAttr(default=None)
+
+    @property
+    def is_mcp_tool(self) -> bool:
+        """Whether this function is exposed as an MCP tool."""
+        # MCPConfig.type only admits "tool", so presence of the block is sufficient
+        return self.mcp is not None
+
+    @property
+    def mcp_description(self) -> Optional[str]:
+        """The MCP-specific description, if one is configured."""
+        mcp = self.mcp
+        return mcp.description if mcp is not None else None
+
 class PythonFunction(BrimleyFunction):
     """
     A function backed by native Python code.
@@ -194,6 +215,9 @@ class SqlFunction(BrimleyFunction):
     connection: str = "default"
     sql_body: str
 
+    # (sql_body, TextClause) compiled lazily by SqlRunner
+    _compiled_stmt: Any = PrivateAttr(default=None)
+
 class TemplateFunction(BrimleyFunction):
     """
     A function backed by a template (Markdown/Jinja).
@@ -202,3 +226,6 @@ class TemplateFunction(BrimleyFunction):
     template_engine: str = "jinja2"
     template_body: Optional[str] = None
     messages: Optional[List[PromptMessage]] = None
+
+    # (template_body, Environment, literal str or Template) compiled lazily by JinjaRunner
+    _compiled_template: Any = PrivateAttr(default=None)
@@ -13,6 +13,8 @@ class Registry(Generic[T]):
         self._items: Dict[str, T] = {}
         self._aliases: Dict[str, str] = {}
         self._quarantined: Dict[str, str] = {}
+        # Bumped on every mutation (items, aliases, quarantine), so derived views can be cached
+        self.generation = 0
 
     def register(self, item: T) -> None:
         """
@@ -23,11 +25,13 @@ class Registry(Generic[T]):
 
         if item.name in self._quarantined:
             del self._quarantined[item.name]
+            self.generation += 1
 
         if item.name in self._items:
             raise ValueError(f"Item with name '{item.name}' is already registered.")
         
         self._items[item.name] = item
+        self.generation += 1
 
     def register_all(self, items: List[T]) -> None:
         for item in items:
@@ -72,10 +76,12 @@ class Registry(Generic[T]):
             raise ValueError("Alias and target cannot be the same.")
 
         self._aliases[alias] = target
+        self.generation += 1
 
     def mark_quarantined(self, name: str, reason: str) -> None:
         """Mark a canonical name as quarantined for fail-closed reload behavior."""
         self._quarantined[name] = reason
+        self.generation += 1
 
     def is_quarantined(self, name: str) -> bool:
         """Return whether a canonical or alias name is quarantined."""
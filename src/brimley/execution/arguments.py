@@ -12,6 +12,14 @@ class ArgumentDef(BaseModel):
     default: Any = None
     from_context: Optional[str] = None
 
+class ResolvedArgs(dict):
+    """
+    Marker dict returned by ArgumentResolver.resolve.
+    Passing it back into resolve (e.g. from SqlRunner after the caller already
+    resolved) returns it unchanged instead of merging and casting a second time.
+    """
+
+
 class ArgumentResolver:
     """
     Handles parsing, merging, and validation of function arguments.
@@ -25,11 +33,14 @@ class ArgumentResolver:
         context: BrimleyContext
     ) -> Dict[str, Any]:
         
+        if isinstance(user_input, ResolvedArgs):
+            return user_input
+
         if not func.arguments:
-            return {}
+            return ResolvedArgs()
 
         defs = cls._parse_definitions(func.arguments)
-        resolved = {}
+        resolved = ResolvedArgs()
 
         for arg_def in defs:
             value = None
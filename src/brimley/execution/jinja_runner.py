@@ -1,9 +1,12 @@
-from typing import Any, Dict
-from jinja2 import Environment, BaseLoader
+from typing import Any, Dict, Union
+from jinja2 import Environment, BaseLoader, Template
 
 from brimley.core.models import TemplateFunction
 from brimley.core.context import BrimleyContext
 
+# Markers that start Jinja syntax; bodies without any of them render verbatim
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
 class JinjaRunner:
     """
     Executes TemplateFunctions using Jinja2.
@@ -22,7 +25,9 @@ class JinjaRunner:
         if not func.template_body:
             return ""
 
-        template = self.env.from_string(func.template_body)
+        template = self._compile(func)
+        if isinstance(template, str):
+            return template
         
         # We inject:
         # 1. 'args': The resolved arguments dict
@@ -30,4 +35,24 @@ class JinjaRunner:
             "args": resolved_args
         }
         
-        return template.render(**render_context)
\ No newline at end of file
+        return template.render(render_context)
+
+    def _compile(self, func: TemplateFunction) -> Union[str, Template]:
+        """
+        Returns the function's compiled template, compiling only when template_body changes.
+        Static bodies (no Jinja syntax) become a literal string matching Jinja's own output,
+        so rendering can be skipped entirely.
+        """
+        body = func.template_body
+        cached = func._compiled_template
+        if cached is not None and cached[0] is body and cached[1] is self.env:
+            return cached[2]
+
+        if "\r" not in body and not any(marker in body for marker in _JINJA_MARKERS):
+            # Jinja drops a single trailing newline unless keep_trailing_newline is set
+            compiled = body[:-1] if body.endswith("\n") and not self.env.keep_trailing_newline else body
+        else:
+            compiled = self.env.from_string(body)
+
+        func._compiled_template = (body, self.env, compiled)
+        return compiled
@@ -1,20 +1,226 @@
+import functools
 import importlib
 import inspect
+import os
 import asyncio
 import sys
+import threading
+import weakref
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Dict, Optional, get_args, get_origin, Annotated
 from brimley.core.models import PythonFunction
 from brimley.core.context import BrimleyContext
 from brimley.core.di import AppState, Config, Connection
 from brimley.execution.result_mapper import ResultMapper
 
+
+def _resolved_hints(handler) -> Dict[str, Any]:
+    """
+    Evaluates handler annotations; only called while building a handler's SigPlan.
+    Falls back to an empty mapping when evaluation fails (e.g. missing imports in scope);
+    inspect.signature still carries the raw annotation objects in that case.
+    """
+    try:
+        return inspect.get_annotations(handler, eval_str=True)
+    except Exception:
+        return {}
+
+
+@functools.lru_cache(maxsize=64)
+def _loader_accepts_runtime_kwargs(loader) -> bool:
+    """
+    Checks once per loader function whether it takes the context/runtime_injections kwargs.
+    Overridden loaders (e.g. test doubles) may only accept the handler path.
+    """
+    try:
+        parameters = inspect.signature(loader).parameters
+    except (TypeError, ValueError):
+        return False
+
+    if "context" in parameters and "runtime_injections" in parameters:
+        return True
+    return any(param.kind is inspect.Parameter.VAR_KEYWORD for param in parameters.values())
+
+
+# Serializes sys.path mutation across concurrent handler imports
+_SYS_PATH_LOCK = threading.RLock()
+
+# Import root -> module file stem -> directories containing it, shared by every runner.
+# Misses are answered from the index without rescanning; reload cycles drop it through
+# invalidate_module_index() so moved, added or deleted files are picked up.
+_MODULE_INDEX: Dict[str, Dict[str, list[str]]] = {}
+
+
+def invalidate_module_index() -> None:
+    """Drop the cached module-file index so the next discovery rescans the roots."""
+    with _SYS_PATH_LOCK:
+        _MODULE_INDEX.clear()
+
+# Injection tags recorded per parameter in a SigPlan
+_TAG_PLAIN = 0
+_TAG_BRIMLEY_CONTEXT = 1
+_TAG_FASTMCP_CONTEXT = 2
+_TAG_APP_STATE = 3
+_TAG_CONFIG = 4
+_TAG_CONNECTION = 5
+
+_NO_DEFAULT = inspect.Parameter.empty
+
+_FASTMCP_CONTEXT_INJECTION_KEYS = (
+    "mcp_context",
+    "mcp",
+    "ctx",
+    "context",
+    "fastmcp_context",
+    "mcp.server.fastmcp.Context",
+)
+
+
+# String annotation forms recognised for context injection (compared with spaces removed)
+_NO_SPACE = str.maketrans("", "", " ")
+_BRIMLEY_CTX_STRS = frozenset({"BrimleyContext", "brimley.core.context.BrimleyContext"})
+_FASTMCP_CTX_STRS = frozenset({
+    "Context",
+    "mcp.server.fastmcp.Context",
+    "fastmcp.Context",
+    "fastmcp.server.context.Context",
+})
+_FASTMCP_CTX_MODULES = frozenset({"mcp.server.fastmcp", "fastmcp.server.context"})
+
+
+@dataclass(frozen=True, slots=True)
+class SigPlan:
+    """
+    Precomputed parameter layout for one handler.
+    Stored as parallel tuples so the per-call loop indexes plain values
+    instead of walking inspect.Parameter objects.
+    """
+    names: tuple[str, ...]
+    tags: tuple[int, ...]
+    keys: tuple[Optional[str], ...]
+    defaults: tuple[Any, ...]
+    is_coro: bool
+
+
+# Handler -> SigPlan. Weak keys let a plan (and any failed annotation evaluation) die with
+# the callable, so pre-reload handlers and their module globals are not kept alive
+_SIG_PLANS: "weakref.WeakKeyDictionary[Any, SigPlan]" = weakref.WeakKeyDictionary()
+
+
+def _sig_plan_for(handler) -> SigPlan:
+    """Returns the handler's SigPlan, building it once per callable; unhashable or
+    non-weak-referenceable callables get a fresh plan on every call."""
+    try:
+        return _SIG_PLANS[handler]
+    except KeyError:
+        pass
+    except TypeError:
+        return _build_sig_plan(handler)
+
+    plan = _build_sig_plan(handler)
+    try:
+        _SIG_PLANS[handler] = plan
+    except TypeError:
+        pass
+    return plan
+
+
+def _build_sig_plan(handler) -> SigPlan:
+    """
+    Inspects the handler signature and classifies each parameter's DI request.
+    """
+    sig = inspect.signature(handler)
+    type_hints = _resolved_hints(handler)
+
+    names: list[str] = []
+    tags: list[int] = []
+    keys: list[Optional[str]] = []
+    defaults: list[Any] = []
+
+    for param_name, param in sig.parameters.items():
+        annotation = type_hints.get(param_name, param.annotation)
+        tag, key = _classify_annotation(annotation)
+        names.append(param_name)
+        tags.append(tag)
+        keys.append(key)
+        defaults.append(param.default)
+
+    return SigPlan(
+        names=tuple(names),
+        tags=tuple(tags),
+        keys=tuple(keys),
+        defaults=tuple(defaults),
+        is_coro=inspect.iscoroutinefunction(handler),
+    )
+
+
+def _classify_annotation(annotation: Any) -> tuple[int, Optional[str]]:
+    """
+    Parses an annotation to see if it requests a dependency.
+    Returns the injection tag and, for keyed markers, the lookup key.
+    """
+    if (
+        annotation is BrimleyContext
+        or (isinstance(annotation, type) and _issubclass_safe(annotation, BrimleyContext))
+        or (isinstance(annotation, str) and annotation.translate(_NO_SPACE) in _BRIMLEY_CTX_STRS)
+    ):
+        return _TAG_BRIMLEY_CONTEXT, None
+
+    if _is_fastmcp_context_annotation(annotation):
+        return _TAG_FASTMCP_CONTEXT, None
+
+    if get_origin(annotation) is Annotated:
+        args = get_args(annotation)
+        # args[0] is the type, args[1:] are metadata
+        is_connection = args[0] is Connection or getattr(args[0], "__name__", None) == "Connection"
+
+        for meta in args[1:]:
+            # Annotated[T, AppState("key")]
+            if isinstance(meta, AppState):
+                return _TAG_APP_STATE, meta.key
+
+            # Annotated[T, Config("key")]
+            if isinstance(meta, Config):
+                return _TAG_CONFIG, meta.key
+
+            # Annotated[Connection, "name"]
+            if is_connection and isinstance(meta, str):
+                return _TAG_CONNECTION, meta
+
+    return _TAG_PLAIN, None
+
+
+def _issubclass_safe(candidate: type, parent: type) -> bool:
+    """issubclass() that treats exotic types (e.g. typing generics) as non-matches."""
+    try:
+        return issubclass(candidate, parent)
+    except TypeError:
+        return False
+
+
+def _is_fastmcp_context_annotation(annotation: Any) -> bool:
+    """
+    Determine whether an annotation targets FastMCP Context injection.
+    """
+    if isinstance(annotation, str):
+        return annotation.translate(_NO_SPACE) in _FASTMCP_CTX_STRS
+
+    annotation_name = getattr(annotation, "__name__", None)
+    annotation_module = getattr(annotation, "__module__", None)
+    return annotation_name == "Context" and annotation_module in _FASTMCP_CTX_MODULES
+
+
 class PythonRunner:
     """
     Executes a PythonFunction with robust Dependency Injection.
     """
 
+    def __init__(self):
+        self._resolved_module_cache: Dict[str, ModuleType] = {}
+
     def run(
         self,
         func: PythonFunction,
@@ -29,19 +235,22 @@ class PythonRunner:
         3. Merges explicit args with injected args.
         4. Calls the function.
         """
-        try:
-            handler = self._load_handler(func.handler, context=context, runtime_injections=runtime_injections)
-        except TypeError as exc:
-            if "unexpected keyword argument" not in str(exc):
-                raise
-            handler = self._load_handler(func.handler)
+        load_handler = self._load_handler
+        if _loader_accepts_runtime_kwargs(getattr(load_handler, "__func__", load_handler)):
+            handler = load_handler(func.handler, context=context, runtime_injections=runtime_injections)
+        else:
+            handler = load_handler(func.handler)
         
-        # Prepare arguments
-        final_args = self._resolve_dependencies(handler, args, context, runtime_injections=runtime_injections)
+        # Prepare arguments; the plan is looked up once and reused for the coroutine check below
+        plan = _sig_plan_for(handler)
+        final_args = self._resolve_dependencies(
+            handler, args, context, runtime_injections=runtime_injections, plan=plan
+        )
         
         raw_result = handler(**final_args)
 
-        if inspect.isawaitable(raw_result):
+        # Coroutine functions are known statically; other callables may still return awaitables
+        if plan.is_coro or inspect.isawaitable(raw_result):
             async def _await_and_map() -> Any:
                 awaited_result = await raw_result
                 return ResultMapper.map_result(awaited_result, func, context)
@@ -85,24 +294,40 @@ class PythonRunner:
         context: Optional[BrimleyContext] = None,
         runtime_injections: Optional[Dict[str, Any]] = None,
     ):
-        """Import module, retrying with candidate root directories on sys.path."""
+        """
+        Import module, retrying with candidate root directories on sys.path.
+        Resolved modules are cached per runner, and the roots that made them importable
+        stay on sys.path so later loads skip path manipulation entirely.
+        """
+        cached_module = self._resolved_module_cache.get(module_name)
+        if cached_module is not None and sys.modules.get(module_name) is cached_module:
+            return cached_module
+
         try:
-            return importlib.import_module(module_name)
+            module = importlib.import_module(module_name)
         except ModuleNotFoundError as first_error:
             roots = self._collect_import_roots(context=context, runtime_injections=runtime_injections)
             if not roots:
                 raise first_error
 
-            with self._temporary_sys_path(roots):
+            with _SYS_PATH_LOCK:
                 try:
-                    return importlib.import_module(module_name)
+                    with self._temporary_sys_path(roots):
+                        module = importlib.import_module(module_name)
+                    resolved_roots = roots
                 except ModuleNotFoundError:
                     discovered_roots = self._discover_module_roots(module_name, roots)
                     if not discovered_roots:
                         raise first_error
 
-            with self._temporary_sys_path(discovered_roots):
-                return importlib.import_module(module_name)
+                    with self._temporary_sys_path(discovered_roots):
+                        module = importlib.import_module(module_name)
+                    resolved_roots = discovered_roots
+
+                self._pin_sys_path(resolved_roots)
+
+        self._resolved_module_cache[module_name] = module
+        return module
 
     def _collect_import_roots(
         self,
@@ -154,13 +379,36 @@ class PythonRunner:
                     discovered.append(root)
                 continue
 
-            for match in root_path.rglob(f"{terminal_name}.py"):
-                match_parent = str(match.parent.resolve())
+            root_index = _MODULE_INDEX.get(root)
+            if root_index is None:
+                root_index = self._build_module_index(root)
+                _MODULE_INDEX[root] = root_index
+
+            for match_parent in root_index.get(terminal_name, ()):
                 if match_parent not in discovered:
                     discovered.append(match_parent)
 
         return discovered
 
+    def _build_module_index(self, root: str) -> dict[str, list[str]]:
+        """Walk a root once and map each module file stem to the directories containing it."""
+        index: dict[str, list[str]] = {}
+        for dirpath, _dirnames, filenames in os.walk(root):
+            resolved_dir: Optional[str] = None
+            for filename in filenames:
+                if not filename.endswith(".py"):
+                    continue
+                if resolved_dir is None:
+                    resolved_dir = str(Path(dirpath).resolve())
+                index.setdefault(filename[:-3], []).append(resolved_dir)
+        return index
+
+    def _pin_sys_path(self, roots: list[str]) -> None:
+        """Permanently prepend resolved import roots to sys.path (caller holds _SYS_PATH_LOCK)."""
+        for root in reversed(roots):
+            if root not in sys.path:
+                sys.path.insert(0, root)
+
     @contextmanager
     def _temporary_sys_path(self, roots: list[str]):
         """Temporarily prepend import roots to sys.path."""
@@ -185,143 +433,51 @@ class PythonRunner:
         resolved_args: Dict[str, Any],
         context: BrimleyContext,
         runtime_injections: Optional[Dict[str, Any]] = None,
+        plan: Optional[SigPlan] = None,
     ) -> Dict[str, Any]:
         """
-        Inspects the handler signature and injects dependencies.
+        Walks the handler's cached SigPlan and injects dependencies.
+        Explicit args take precedence, then DI, then parameter defaults.
+        Raises KeyError/AttributeError if a dependency is requested but missing in context.
         """
-        # We use inspect.signature to get parameter names and defaults
-        sig = inspect.signature(handler)
-        # We use get_type_hints to correctly resolve forward references and get Annotated objects
-        type_hints = {}
-        try:
-            type_hints = inspect.get_annotations(handler, eval_str=True)
-        except Exception:
-             # Fallback if evaluation fails (e.g. missing imports in scope), 
-             # though get_annotations usually handles this if globals/locals are correct.
-             # For simpler cases, inspect.signature contains annotation objects too.
-             pass
+        if plan is None:
+            plan = _sig_plan_for(handler)
+        tags = plan.tags
+        keys = plan.keys
+        defaults = plan.defaults
 
         final_kwargs = {}
 
-        for param_name, param in sig.parameters.items():
-            # If the user supplied it explicitly (via args), that takes precedence
-            # EXCEPT for system internals which likely shouldn't be overridden by user?
-            # Actually, typically DI overrides or conflicts. 
-            # In Brimley logic, 'args' contains validated user/context inputs.
-            # If 'args' has it, we use it. If not, we try DI.
-            
-            if param_name in resolved_args:
-                final_kwargs[param_name] = resolved_args[param_name]
+        for i, name in enumerate(plan.names):
+            if name in resolved_args:
+                final_kwargs[name] = resolved_args[name]
                 continue
-            
-            # Check for Dependency Injection via Annotation
-            annotation = type_hints.get(param_name, param.annotation)
-            
-            injected_value, is_injected = self._get_dependency(
-                annotation,
-                context,
-                runtime_injections=runtime_injections,
-            )
-            
-            if is_injected:
-                final_kwargs[param_name] = injected_value
-            elif param.default is not inspect.Parameter.empty:
-                # Use default if no injection and no user input
-                final_kwargs[param_name] = param.default
-            else:
-                # If required and missing, we let the call fail naturally (or raise better error)
-                pass
 
-        return final_kwargs
-
-    def _get_dependency(
-        self,
-        annotation,
-        context: BrimleyContext,
-        runtime_injections: Optional[Dict[str, Any]] = None,
-    ) -> tuple[Any, bool]:
-        """
-        Parses an annotation to see if it requests a dependency.
-        Returns (value, True) if injected, or (None, False) if not.
-        Raises KeyError/AttributeError if dependency is found but missing in context.
-        """
-        if self._is_brimley_context_annotation(annotation):
-            return context, True
-
-        if self._is_fastmcp_context_annotation(annotation):
-            if runtime_injections:
-                for key in (
-                    "mcp_context",
-                    "mcp",
-                    "ctx",
-                    "context",
-                    "fastmcp_context",
-                    "mcp.server.fastmcp.Context",
-                ):
-                    if key in runtime_injections:
-                        return runtime_injections[key], True
-
-            return None, False
-
-        if get_origin(annotation) is Annotated:
-            args = get_args(annotation)
-            # args[0] is the type, args[1:] are metadata
-            
-            for meta in args[1:]:
-                # Check for AppState("key")
-                if isinstance(meta, AppState):
-                    # Strict: Raise KeyError if missing
-                    return context.app[meta.key], True
-                
-                # Check for Config("key")
-                if isinstance(meta, Config):
-                    # Strict: Raise AttributeError if missing
-                    val = getattr(context.config, meta.key)
-                    return val, True
-
-                # Check for Connection string
-                if args[0] is Connection or (hasattr(args[0], "__name__") and args[0].__name__ == "Connection"):
-                    if isinstance(meta, str):
-                        # Strict: Raise KeyError if missing
-                        return context.databases[meta], True
-        
-        return None, False
-
-    def _is_brimley_context_annotation(self, annotation: Any) -> bool:
-        """
-        Determine whether an annotation targets BrimleyContext injection.
-        """
-        if annotation is BrimleyContext:
-            return True
-
-        if isinstance(annotation, type):
-            try:
-                return issubclass(annotation, BrimleyContext)
-            except TypeError:
-                return False
-
-        if isinstance(annotation, str):
-            normalized = annotation.replace(" ", "")
-            return normalized in {"BrimleyContext", "brimley.core.context.BrimleyContext"}
+            tag = tags[i]
+            if tag == _TAG_BRIMLEY_CONTEXT:
+                final_kwargs[name] = context
+                continue
+            if tag == _TAG_APP_STATE:
+                final_kwargs[name] = context.app[keys[i]]
+                continue
+            if tag == _TAG_CONFIG:
+                final_kwargs[name] = getattr(context.config, keys[i])
+                continue
+            if tag == _TAG_CONNECTION:
+                final_kwargs[name] = context.databases[keys[i]]
+                continue
+            if tag == _TAG_FASTMCP_CONTEXT and runtime_injections:
+                injected_key = next(
+                    (key for key in _FASTMCP_CONTEXT_INJECTION_KEYS if key in runtime_injections),
+                    None,
+                )
+                if injected_key is not None:
+                    final_kwargs[name] = runtime_injections[injected_key]
+                    continue
 
-        return False
+            default = defaults[i]
+            if default is not _NO_DEFAULT:
+                final_kwargs[name] = default
+            # If required and missing, we let the call fail naturally
 
-    def _is_fastmcp_context_annotation(self, annotation: Any) -> bool:
-        """
-        Determine whether an annotation targets FastMCP Context injection.
-        """
-        if isinstance(annotation, str):
-            normalized = annotation.replace(" ", "")
-            return normalized in {
-                "Context",
-                "mcp.server.fastmcp.Context",
-                "fastmcp.Context",
-                "fastmcp.server.context.Context",
-            }
-
-        annotation_name = getattr(annotation, "__name__", None)
-        annotation_module = getattr(annotation, "__module__", None)
-        return annotation_name == "Context" and annotation_module in {
-            "mcp.server.fastmcp",
-            "fastmcp.server.context",
-        }
+        return final_kwargs
@@ -1,18 +1,19 @@
-import importlib
-from typing import Any, Dict, List, Optional, Union, Type, get_args
+import functools
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, Type
 import pydantic
 from pydantic import TypeAdapter, ValidationError
 from brimley.core.context import BrimleyContext
 from brimley.core.models import BrimleyFunction, DiscoveredEntity, normalize_type_expression
-from brimley.core.entity import Entity
 from brimley.utils.diagnostics import BrimleyExecutionError
 
-class ResultMapper:
-    """
-    Marshals raw function output into the structure defined by return_shape.
-    """
-
-    PRIMITIVE_MAP = {
+# Keys are lowercase for case-insensitive shorthand lookups; interned like the
+# names produced by normalize_type_expression so lookups hit the identity fast path
+_PRIMITIVE_MAP = {
+    sys.intern(type_name): python_type
+    for type_name, python_type in {
         "string": str,
         "int": int,
         "float": float,
@@ -22,189 +23,331 @@ class ResultMapper:
         "dict": dict,
         "list": list,
         "any": Any,
-    }
+    }.items()
+}
+
+_SCALAR_TYPES = (int, str, float, bool)
+
+
+@dataclass(frozen=True, slots=True)
+class _ReturnPlan:
+    """
+    Return-shape work compiled once per function.
+    `shape` and `entities` record what the plan was built from so it can be
+    rebuilt when the function's shape or the context's entity registry changes.
+    """
+    shape: Any
+    entities: Any
+    kind: str  # "shorthand", "inline" or "raw"
+    shape_str: Optional[str] = None
+    is_list: bool = False
+    target_type: Any = None
+    adapter: Optional[TypeAdapter] = None
+    # Set for single scalar primitives; values already of exactly this type skip validation
+    scalar_type: Optional[type] = None
+    dynamic_model: Optional[Type[pydantic.BaseModel]] = None
+    # Inline models with nested model fields still need model_dump to yield plain dicts
+    dump_required: bool = False
+
+
+@functools.lru_cache(maxsize=256)
+def _get_adapter(target_type: Any, is_list: bool) -> TypeAdapter:
+    """Returns a cached TypeAdapter; building the core schema is far costlier than validating."""
+    if is_list:
+        return TypeAdapter(List[target_type])  # type: ignore
+    return TypeAdapter(target_type)
+
+
+def _cached_import(module_name: str) -> ModuleType:
+    """
+    Returns an already-initialized module straight from sys.modules, importing otherwise.
+    Not memoized beyond sys.modules so reloaded entity modules are picked up.
+    """
+    module = sys.modules.get(module_name)
+    spec = getattr(module, "__spec__", None)
+    if module is None or getattr(spec, "_initializing", False):
+        # Deferred: only python-entity resolution on a cold plan reaches here
+        import importlib
+
+        module = importlib.import_module(module_name)
+    return module
+
+
+def _format_validation_errors(exc: ValidationError) -> str:
+    """Formats Pydantic errors for a cleaner CLI output ("loc: msg; ...")."""
+    # URLs and context are never shown, so skip building them per error
+    return "; ".join(
+        f"{'.'.join(map(str, err['loc']))}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in exc.errors(include_url=False, include_context=False)
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_shorthand(shape_str: str) -> Tuple[str, bool, str]:
+    """Normalizes a shorthand shape once into (normalized, is_list, base_type_str)."""
+    normalized = normalize_type_expression(
+        shape_str,
+        allow_void=True,
+        allow_legacy_containers=True,
+    )
+    if normalized.endswith("[]"):
+        return normalized, True, normalized[:-2]
+    return normalized, False, normalized
 
-    @classmethod
-    def map_result(cls, raw_data: Any, func: BrimleyFunction, context: BrimleyContext) -> Any:
-        shape = func.return_shape
-        
-        if not shape or shape == "void":
-            return None
 
-        if isinstance(shape, str):
-            return cls._map_by_shorthand(raw_data, shape, context, func)
-        
-        if isinstance(shape, dict):
-            return cls._map_by_structured_shape(raw_data, shape, context, func)
-        
+def map_result(raw_data: Any, func: BrimleyFunction, context: BrimleyContext) -> Any:
+    shape = func.return_shape
+
+    if not shape or shape == "void":
+        return None
+
+    if not isinstance(shape, (str, dict)):
         return raw_data
 
-    @classmethod
-    def _map_by_shorthand(cls, data: Any, shape_str: str, context: BrimleyContext, func: BrimleyFunction) -> Any:
-        try:
-            shape_str = normalize_type_expression(
-                shape_str,
-                allow_void=True,
-                allow_legacy_containers=True,
-            )
-        except ValueError as e:
-            raise BrimleyExecutionError(str(e), func_name=func.name) from e
+    # An empty row set for a single-object shorthand maps to None before the target type
+    # is resolved, so an unresolvable shape only fails once there is a row to map
+    if isinstance(raw_data, (list, tuple)) and not raw_data and _is_single_shorthand(shape, func):
+        return None
+
+    plan = compile_return_shape(func, context)
+
+    if plan.kind == "shorthand":
+        return _map_by_shorthand(raw_data, plan, func)
+
+    if plan.kind == "inline":
+        return _map_by_structured_shape(raw_data, plan, func)
+
+    return raw_data
+
+
+def _is_single_shorthand(shape: Any, func: BrimleyFunction) -> bool:
+    """Whether the shape is a non-list shorthand (or entity_ref); parse errors still surface."""
+    if isinstance(shape, dict):
+        if "entity_ref" not in shape:
+            return False
+        shape = shape["entity_ref"]
+
+    try:
+        return not _parse_shorthand(shape)[1]
+    except ValueError as e:
+        raise BrimleyExecutionError(str(e), func_name=func.name) from e
+
+
+def maps_to_list(func: BrimleyFunction, context: BrimleyContext) -> bool:
+    """
+    Whether the return shape is a list shorthand, so row batches can be mapped independently.
+    """
+    shape = func.return_shape
+    if not shape or shape == "void" or not isinstance(shape, (str, dict)):
+        return False
+
+    plan = compile_return_shape(func, context)
+    return plan.kind == "shorthand" and plan.is_list
+
+
+def compile_return_shape(func: BrimleyFunction, context: BrimleyContext) -> _ReturnPlan:
+    """
+    Returns the function's compiled return plan, building it on first use.
+    Parsing, type resolution and adapter construction happen here rather than per call.
+    """
+    plan = func._return_plan
+    if plan is not None and plan.shape is func.return_shape and plan.entities is context.entities:
+        return plan
+
+    plan = _build_return_plan(func, context)
+    func._return_plan = plan
+    return plan
+
 
-        is_list = False
-        base_type_str = shape_str
-        
-        if shape_str.endswith("[]"):
-            is_list = True
-            base_type_str = shape_str[:-2]
-
-        # Handle list wrapping if we got a single item but expected a list
-        if is_list and not isinstance(data, (list, tuple)):
-            data = [data]
-        # Handle unwrapping if we got a list and expected single item
-        elif not is_list and isinstance(data, (list, tuple)):
-            if len(data) == 0:
-                return None
-            if len(data) > 1:
-                raise BrimleyExecutionError(
-                    f"Expected single row for return shape '{shape_str}', but got {len(data)} rows.",
-                    func_name=func.name
-                )
-            data = data[0]
+def _build_return_plan(func: BrimleyFunction, context: BrimleyContext) -> _ReturnPlan:
+    shape = func.return_shape
 
+    if isinstance(shape, dict):
+        # Structured shapes can have 'entity_ref' or 'inline'
+        if "entity_ref" in shape:
+            shorthand = shape["entity_ref"]
+        elif "inline" in shape:
+            return _build_inline_plan(shape, func, context)
+        else:
+            return _ReturnPlan(shape=shape, entities=context.entities, kind="raw")
+    else:
+        shorthand = shape
+
+    try:
+        shape_str, is_list, base_type_str = _parse_shorthand(shorthand)
+        target_type = _resolve_type(base_type_str, context)
+    except ValueError as e:
+        raise BrimleyExecutionError(str(e), func_name=func.name) from e
+
+    return _ReturnPlan(
+        shape=shape,
+        entities=context.entities,
+        kind="shorthand",
+        shape_str=shape_str,
+        is_list=is_list,
+        target_type=target_type,
+        adapter=_get_adapter(target_type, is_list),
+        scalar_type=target_type if not is_list and target_type in _SCALAR_TYPES else None,
+    )
+
+
+def _build_inline_plan(shape: Dict[str, Any], func: BrimleyFunction, context: BrimleyContext) -> _ReturnPlan:
+    # Design doc trigger: if values are strings, it's shorthand
+    # If values are dicts, it's complex metadata.
+    fields = {}
+    for field_name, field_def in shape["inline"].items():
         try:
-            target_type = cls._resolve_type(base_type_str, context)
+            if isinstance(field_def, str):
+                field_type = _resolve_type(field_def, context)
+                fields[field_name] = (field_type, ...)
+            elif isinstance(field_def, dict):
+                type_str = field_def.get("type", "string")
+                field_type = _resolve_type(type_str, context)
+                fields[field_name] = (field_type, ...)
         except ValueError as e:
             raise BrimleyExecutionError(str(e), func_name=func.name) from e
-        
-        # Explicit coercion for primitives if Pydantic is too strict
-        if not is_list:
-            if target_type is str and data is not None:
-                data = str(data)
-            elif target_type is int and isinstance(data, str):
-                try: data = int(data)
-                except: pass
-            elif target_type is float and isinstance(data, str):
-                try: data = float(data)
-                except: pass
-
-        if is_list:
-            adapter = TypeAdapter(List[target_type]) # type: ignore
-        else:
-            adapter = TypeAdapter(target_type)
 
-        try:
-            return adapter.validate_python(data)
-        except ValidationError as e:
-            # Format Pydantic errors for a cleaner CLI output
-            errors = []
-            for err in e.errors():
-                loc = ".".join(str(l) for l in err["loc"])
-                msg = err["msg"]
-                errors.append(f"{loc}: {msg}" if loc else msg)
-            
-            error_details = "; ".join(errors)
+    # Built once per plan; create_model constructs a full core schema
+    return _ReturnPlan(
+        shape=shape,
+        entities=context.entities,
+        kind="inline",
+        dynamic_model=pydantic.create_model("InlineResult", **fields),
+        dump_required=any(
+            isinstance(field_type, type) and issubclass(field_type, pydantic.BaseModel)
+            for field_type, _ in fields.values()
+        ),
+    )
+
+
+def _map_by_shorthand(data: Any, plan: _ReturnPlan, func: BrimleyFunction) -> Any:
+    is_list = plan.is_list
+    shape_str = plan.shape_str
+    target_type = plan.target_type
+
+    # Handle list wrapping if we got a single item but expected a list
+    if is_list and not isinstance(data, (list, tuple)):
+        data = [data]
+    # Handle unwrapping if we got a list and expected single item
+    elif not is_list and isinstance(data, (list, tuple)):
+        if len(data) == 0:
+            return None
+        if len(data) > 1:
             raise BrimleyExecutionError(
-                f"Result validation failed for shape '{shape_str}'. Details: {error_details}",
+                f"Expected single row for return shape '{shape_str}', but got {len(data)} rows.",
                 func_name=func.name
-            ) from e
+            )
+        data = data[0]
 
-    @classmethod
-    def _map_by_structured_shape(cls, data: Any, shape: Dict[str, Any], context: BrimleyContext, func: BrimleyFunction) -> Any:
-        # Structured shapes can have 'entity_ref' or 'inline'
-        if "entity_ref" in shape:
-            return cls._map_by_shorthand(data, shape["entity_ref"], context, func)
-        
-        if "inline" in shape:
-            inline_spec = shape["inline"]
-            # Design doc trigger: if values are strings, it's shorthand
-            # If values are dicts, it's complex metadata.
-            
-            # For simplicity, let's create a dynamic Pydantic model for validation
-            fields = {}
-            for field_name, field_def in inline_spec.items():
-                try:
-                    if isinstance(field_def, str):
-                        field_type = cls._resolve_type(field_def, context)
-                        fields[field_name] = (field_type, ...)
-                    elif isinstance(field_def, dict):
-                        type_str = field_def.get("type", "string")
-                        field_type = cls._resolve_type(type_str, context)
-                        fields[field_name] = (field_type, ...)
-                except ValueError as e:
-                    raise BrimleyExecutionError(str(e), func_name=func.name) from e
-            
-            DynamicModel = pydantic.create_model("InlineResult", **fields)
-            
-            if isinstance(data, (list, tuple)):
-                # If we have a list of rows for an inline shape, we probably should return a list of models
-                # But typically inline shapes without [] suffix are single objects.
-                # If return_shape itself doesn't support [] for structured dicts in spec yet,
-                # we'll assume single object unless we see otherwise.
-                if len(data) == 0: return None
-                data = data[0]
-            
-            try:
-                return DynamicModel(**data).model_dump()
-            except ValidationError as e:
-                errors = []
-                for err in e.errors():
-                    loc = ".".join(str(l) for l in err["loc"])
-                    msg = err["msg"]
-                    errors.append(f"{loc}: {msg}" if loc else msg)
-                
-                error_details = "; ".join(errors)
-                raise BrimleyExecutionError(
-                    f"Result validation failed for inline shape. Details: {error_details}",
-                    func_name=func.name
-                ) from e
+    # Explicit coercion for primitives if Pydantic is too strict
+    if not is_list:
+        if target_type is str and data is not None:
+            data = str(data)
+        elif target_type is int and isinstance(data, str):
+            try: data = int(data)
+            except: pass
+        elif target_type is float and isinstance(data, str):
+            try: data = float(data)
+            except: pass
 
+    # Exact primitive matches validate to themselves; skip pydantic-core entirely
+    if plan.scalar_type is not None and type(data) is plan.scalar_type:
         return data
 
-    @classmethod
-    def _resolve_type(cls, type_name: str, context: BrimleyContext) -> Type:
-        # Lowercase for case-insensitivity in shorthand strings
-        tn = type_name.lower()
-
-        # 1. Check Primitives
-        if tn in cls.PRIMITIVE_MAP:
-            return cls.PRIMITIVE_MAP[tn]
-        
-        # 2. Check Entities (Keep original casing for entities)
-        entity_class = context.entities.get(type_name)
-        if entity_class:
-            if isinstance(entity_class, DiscoveredEntity) and entity_class.type == "python_entity":
-                return cls._resolve_python_entity_class(entity_class)
-            return entity_class
-        
-        # 3. Handle Python built-ins like list[dict] where user might use literal python typing
-        # If it contains '[', it's handled by _map_by_shorthand usually, 
-        # but if the user passed 'list' or 'dict' it should map to the primitives.
-        
-        # 4. Default to Any or raise? Let's raise for clarity in this engine.
-        raise ValueError(f"Unknown return type or entity: '{type_name}'")
-
-    @classmethod
-    def _resolve_python_entity_class(cls, entity: DiscoveredEntity) -> Type:
-        handler = entity.handler
-        if not handler or "." not in handler:
-            raise ValueError(
-                f"Python entity '{entity.name}' is missing a valid handler path."
+    try:
+        return plan.adapter.validate_python(data)
+    except ValidationError as e:
+        error_details = _format_validation_errors(e)
+        raise BrimleyExecutionError(
+            f"Result validation failed for shape '{shape_str}'. Details: {error_details}",
+            func_name=func.name
+        ) from e
+
+
+def _map_by_structured_shape(data: Any, plan: _ReturnPlan, func: BrimleyFunction) -> Any:
+    DynamicModel = plan.dynamic_model
+
+    if isinstance(data, (list, tuple)):
+        # Inline shapes describe one object, like a non-list shorthand: a single row unwraps
+        # to it, and extra rows are an error rather than silently dropped or turned into a list
+        if len(data) == 0:
+            return None
+        if len(data) > 1:
+            raise BrimleyExecutionError(
+                f"Expected single row for inline return shape, but got {len(data)} rows.",
+                func_name=func.name
             )
+        data = data[0]
 
-        module_name, class_name = handler.rsplit(".", 1)
+    try:
+        # Core validator directly: skips the model_validate classmethod dispatch
+        validated = DynamicModel.__pydantic_validator__.validate_python(data)
+        if plan.dump_required:
+            return validated.model_dump()
+        return dict(validated.__dict__)
+    except ValidationError as e:
+        error_details = _format_validation_errors(e)
+        raise BrimleyExecutionError(
+            f"Result validation failed for inline shape. Details: {error_details}",
+            func_name=func.name
+        ) from e
 
-        try:
-            module = importlib.import_module(module_name)
-        except Exception as e:
-            raise ValueError(
-                f"Could not import module '{module_name}' for python entity '{entity.name}': {e}"
-            ) from e
 
-        try:
-            entity_class = getattr(module, class_name)
-        except AttributeError as e:
-            raise ValueError(
-                f"Could not find class '{class_name}' in module '{module_name}' for python entity '{entity.name}'."
-            ) from e
+def _resolve_type(type_name: str, context: BrimleyContext) -> Type:
+    # 1. Check Primitives (keys are lowercase for case-insensitive shorthand)
+    primitive = _PRIMITIVE_MAP.get(type_name.lower())
+    if primitive is not None:
+        return primitive
 
+    # 2. Check Entities
+    entity_class = context.entities.get(type_name)
+    if entity_class:
+        if isinstance(entity_class, DiscoveredEntity) and entity_class.type == "python_entity":
+            return _resolve_python_entity_class(entity_class)
         return entity_class
+
+    # 3. Handle Python built-ins like list[dict] where user might use literal python typing
+    # If it contains '[', it's handled by _map_by_shorthand usually, 
+    # but if the user passed 'list' or 'dict' it should map to the primitives.
+
+    # 4. Default to Any or raise? Let's raise for clarity in this engine.
+    raise ValueError(f"Unknown return type or entity: '{type_name}'")
+
+
+def _resolve_python_entity_class(entity: DiscoveredEntity) -> Type:
+    handler = entity.handler
+    if not handler or "." not in handler:
+        raise ValueError(
+            f"Python entity '{entity.name}' is missing a valid handler path."
+        )
+
+    module_name, class_name = handler.rsplit(".", 1)
+
+    try:
+        module = _cached_import(module_name)
+    except Exception as e:
+        raise ValueError(
+            f"Could not import module '{module_name}' for python entity '{entity.name}': {e}"
+        ) from e
+
+    try:
+        entity_class = getattr(module, class_name)
+    except AttributeError as e:
+        raise ValueError(
+            f"Could not find class '{class_name}' in module '{module_name}' for python entity '{entity.name}'."
+        ) from e
+
+    return entity_class
+
+
+class ResultMapper:
+    """
+    Marshals raw function output into the structure defined by return_shape.
+    Thin facade over the module-level functions, kept for API compatibility.
+    """
+
+    PRIMITIVE_MAP = _PRIMITIVE_MAP
+
+    map_result = staticmethod(map_result)
+    maps_to_list = staticmethod(maps_to_list)
+    compile_return_shape = staticmethod(compile_return_shape)
@@ -1,10 +1,19 @@
-import sys
+import re
 from typing import Any, Dict
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from brimley.core.models import SqlFunction
 from brimley.core.context import BrimleyContext
 from brimley.execution.arguments import ArgumentResolver
-from brimley.execution.result_mapper import ResultMapper
+from brimley.execution.result_mapper import map_result, maps_to_list
+
+# Rows fetched and validated per round trip for streamed SELECTs
+STREAM_BATCH_SIZE = 1000
+
+# First keyword of a statement, skipping leading whitespace and SQL comments
+_LEADING_KEYWORD = re.compile(r"(?:\s+|--[^\n]*|/\*.*?\*/)*(\w+)", re.DOTALL)
+
+# Statements a server-side cursor can be declared over
+_STREAMABLE_KEYWORDS = frozenset({"select", "with"})
 
 class SqlRunner:
     """
@@ -26,21 +35,56 @@ class SqlRunner:
             avail = list(context.databases.keys())
             raise RuntimeError(f"Database connection '{connection_name}' not found. Available: {avail}")
 
-        # 3. Execute
+        # 3. Execute (server-side cursor for list-shaped queries where the driver supports it)
         with engine.connect() as conn:
-            stmt = text(func.sql_body)
-            result = conn.execute(stmt, resolved_params)
+            stmt = self._compiled_statement(func)
+            streamed = maps_to_list(func, context) and self._is_row_query(func.sql_body)
+            if streamed:
+                result = conn.execution_options(
+                    stream_results=True,
+                    yield_per=STREAM_BATCH_SIZE,
+                ).execute(stmt, resolved_params)
+            else:
+                result = conn.execute(stmt, resolved_params)
         
             # Check if it returns rows
             if result.returns_rows:
-                # Return list of dicts
-                raw_rows = [dict(row) for row in result.mappings()]
-                return ResultMapper.map_result(raw_rows, func, context)
+                # List shapes are validated batch by batch so raw rows never pile up
+                if streamed:
+                    mapped_rows = []
+                    for partition in result.mappings().partitions(STREAM_BATCH_SIZE):
+                        mapped_rows.extend(map_result(list(map(dict, partition)), func, context))
+                    return mapped_rows
+
+                # Return list of plain dicts (RowMapping would leak through 'any'/'list' shapes)
+                raw_rows = list(map(dict, result.mappings()))
+                return map_result(raw_rows, func, context)
             else:
                 # Commit for INSERT/UPDATE/DELETE if auto-commit isn't on by default
                 conn.commit()
-                # If the shape is void, we return None as per ResultMapper logic
-                if func.return_shape == "void" or not func.return_shape:
-                    return ResultMapper.map_result(None, func, context)
+                # Void/omitted shape: nothing to map
+                return_shape = func.return_shape
+                if not return_shape or return_shape == "void":
+                    return None
                 # Otherwise, if they expected something else (like dict), return the rowcount
-                return ResultMapper.map_result({"rows_affected": result.rowcount}, func, context)
+                return map_result({"rows_affected": result.rowcount}, func, context)
+
+    def _is_row_query(self, sql_body: str) -> bool:
+        """
+        Whether the statement is a SELECT/WITH query. Drivers such as psycopg2 declare
+        a named cursor for stream_results, which rejects INSERT/UPDATE/DELETE.
+        """
+        match = _LEADING_KEYWORD.match(sql_body)
+        return match is not None and match.group(1).lower() in _STREAMABLE_KEYWORDS
+
+    def _compiled_statement(self, func: SqlFunction) -> TextClause:
+        """
+        Returns the function's text() clause, parsing bind names only when sql_body changes.
+        """
+        compiled = func._compiled_stmt
+        if compiled is not None and compiled[0] is func.sql_body:
+            return compiled[1]
+
+        stmt = text(func.sql_body)
+        func._compiled_stmt = (func.sql_body, stmt)
+        return stmt
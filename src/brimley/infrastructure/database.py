@@ -1,11 +1,16 @@
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional
 from sqlalchemy import create_engine, Engine
 from sqlalchemy.engine import make_url
 
 
+@functools.lru_cache(maxsize=64)
 def _resolve_database_url(url: str, base_dir: Optional[Path]) -> str:
-    """Resolve relative SQLite database URLs against a configured base directory."""
+    """
+    Resolve relative SQLite database URLs against a configured base directory.
+    Memoized: reloads re-initialize databases with the same (url, base_dir) pairs.
+    """
     if base_dir is None:
         return url
 
@@ -36,6 +41,8 @@ def initialize_databases(db_configs: Dict[str, Any], base_dir: Optional[Path] =
     Args:
         db_configs: A dictionary mapping connection names to their configurations.
                    Expected structure per connection: {'url': '...', 'connect_args': {...}}
+                   'connect_args' entries are forwarded to create_engine as keyword arguments;
+                   SQLAlchemy's defaults (compiled cache, insertmanyvalues) are left in place.
         base_dir: Optional root directory used to resolve relative SQLite file URLs.
 
     Returns:
@@ -1,8 +1,11 @@
+import functools
 import importlib
 import importlib.util
 import inspect
 import json
-from typing import Any, Dict, Tuple, Type
+import operator
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple, Type
 
 from pydantic import BaseModel, Field, create_model
 from pydantic.fields import PydanticUndefined
@@ -14,6 +17,35 @@ from brimley.execution.arguments import ArgumentResolver
 from brimley.execution.dispatcher import Dispatcher
 
 
+# Brimley argument type names (lowercase) to the Python types used in MCP input models
+_MCP_TYPE_MAP: Mapping[str, Any] = MappingProxyType({
+    "string": str,
+    "str": str,
+    "int": int,
+    "integer": int,
+    "float": float,
+    "number": float,
+    "bool": bool,
+    "boolean": bool,
+    "dict": dict,
+    "object": dict,
+    "list": list,
+    "array": list,
+    "any": Any,
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _input_model_name(tool_name: str) -> str:
+    """CamelCase input-model name for a tool; also the JSON schema title, so keep str.title() semantics."""
+    return f"{tool_name.title().replace('_', '')}MCPInput"
+
+
+def _canonical_json(payload: Dict[str, Any]) -> str:
+    """Dump payload with sorted keys and compact separators; signatures are only compared within one process."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
 class BrimleyProvider:
     """Provider-first integration surface for exposing Brimley functions via FastMCP."""
 
@@ -22,14 +54,42 @@ class BrimleyProvider:
         self.registry = registry
         self.context = context
         self.dispatcher = Dispatcher()
+        # Tool name -> (function, arguments, arguments key, input model). Identity is checked
+        # first; the canonical arguments key lets reloaded but unchanged definitions reuse the model
+        self._input_models: Dict[str, Tuple[BrimleyFunction, Any, str, Type[BaseModel]]] = {}
+        # Tool name -> (input model, canonical schema signature); valid while the model is unchanged
+        self._schema_signatures: Dict[str, Tuple[Type[BaseModel], str]] = {}
+        # (registry, registry generation, mcp block of every function, MCP tools) from the last
+        # discovery; mcp blocks are compared by identity since they can be reassigned after registration
+        self._discovered_tools: Tuple[Any, int, Tuple[Any, ...], list[BrimleyFunction]] | None = None
+        # Tool name -> ((schema signature, description, function type), Tool). Wrappers resolve the
+        # function by name at call time, so a Tool stays valid until its MCP-facing shape changes
+        self._tool_objects: Dict[str, Tuple[Tuple[str, str, str], Any]] = {}
+        # fastmcp stays an optional, lazily imported dependency; resolved classes are kept per provider
+        self._fastmcp_cls: Any = None
+        self._tool_cls: Any = None
+        self._context_type: Any = None
 
     def discover_tools(self) -> list[BrimleyFunction]:
         """Return only functions explicitly marked for MCP exposure."""
-        return [
-            func
-            for func in self.registry
-            if getattr(func, "mcp", None) is not None and func.mcp.type == "tool"
-        ]
+        registry = self.registry
+        generation = getattr(registry, "generation", None)
+        mcp_blocks = tuple(func.mcp for func in registry)
+        cached = self._discovered_tools
+        if (
+            generation is not None
+            and cached is not None
+            and cached[0] is registry
+            and cached[1] == generation
+            and len(cached[2]) == len(mcp_blocks)
+            and all(map(operator.is_, cached[2], mcp_blocks))
+        ):
+            return list(cached[3])
+
+        tools = [func for func in registry if func.is_mcp_tool]
+        if generation is not None:
+            self._discovered_tools = (registry, generation, mcp_blocks, tools)
+        return list(tools)
 
     def get_tool_schema_signatures(self, tools: list[BrimleyFunction] | None = None) -> Dict[str, str]:
         """Return deterministic MCP tool schema signatures keyed by tool name."""
@@ -38,121 +98,127 @@ class BrimleyProvider:
 
         for func in selected_tools:
             input_model = self.build_tool_input_model(func)
+            cached = self._schema_signatures.get(func.name)
+            if cached is not None and cached[0] is input_model:
+                signatures[func.name] = cached[1]
+                continue
+
             schema_payload = {
                 "tool": func.name,
                 "input_schema": input_model.model_json_schema(),
             }
-            signatures[func.name] = json.dumps(schema_payload, sort_keys=True)
+            signature = _canonical_json(schema_payload)
+            self._schema_signatures[func.name] = (input_model, signature)
+            signatures[func.name] = signature
 
         return signatures
 
+    def get_tool_description(self, func: BrimleyFunction) -> str:
+        """Return the MCP-facing description for a tool, preferring the mcp block's description."""
+        return func.mcp_description or func.description or ""
+
     def build_tool_input_model(self, func: BrimleyFunction) -> Type[BaseModel]:
+        """Return the Pydantic input model for a tool, building it once per argument definition."""
+        cached = self._input_models.get(func.name)
+        if cached is not None and cached[0] is func and cached[1] is func.arguments:
+            return cached[3]
+
+        arguments_key = json.dumps(func.arguments or {}, sort_keys=True, default=repr)
+        if cached is not None and cached[2] == arguments_key:
+            input_model = cached[3]
+        else:
+            input_model = self._create_tool_input_model(func)
+        self._input_models[func.name] = (func, func.arguments, arguments_key, input_model)
+        return input_model
+
+    def _create_tool_input_model(self, func: BrimleyFunction) -> Type[BaseModel]:
         """Build a Pydantic input model for a tool, excluding from_context arguments."""
         inline_arguments = (func.arguments or {}).get("inline", {})
         field_definitions: Dict[str, Tuple[Any, Any]] = {}
+        map_type = _MCP_TYPE_MAP.get
 
         for arg_name, arg_spec in inline_arguments.items():
-            if isinstance(arg_spec, str):
-                field_definitions[arg_name] = (self._map_type(arg_spec), ...)
+            # Exact type checks first; parsed frontmatter yields plain str/dict, subclasses fall back to isinstance
+            spec_type = type(arg_spec)
+            if spec_type is str or (spec_type is not dict and isinstance(arg_spec, str)):
+                field_definitions[arg_name] = (map_type(arg_spec.lower(), Any), ...)
                 continue
 
-            if not isinstance(arg_spec, dict):
+            if spec_type is not dict and not isinstance(arg_spec, dict):
                 continue
 
             if arg_spec.get("from_context"):
                 continue
 
-            arg_type = self._map_type(arg_spec.get("type", "string"))
-            description = arg_spec.get("description")
-
-            if "default" in arg_spec:
-                default_value = arg_spec.get("default")
-            else:
-                default_value = ...
+            arg_type = map_type(arg_spec.get("type", "string").lower(), Any)
+            default_value = arg_spec.get("default", ...)
 
+            description = arg_spec.get("description")
             if description:
                 default_value = Field(default_value, description=description)
 
             field_definitions[arg_name] = (arg_type, default_value)
 
-        model_name = f"{func.name.title().replace('_', '')}MCPInput"
-        return create_model(model_name, **field_definitions)
+        return create_model(_input_model_name(func.name), **field_definitions)
 
     def _map_type(self, type_name: str) -> type[Any]:
         """Map Brimley argument type names to Python types."""
-        normalized = type_name.lower()
-        mapping: Dict[str, type[Any]] = {
-            "string": str,
-            "str": str,
-            "int": int,
-            "integer": int,
-            "float": float,
-            "number": float,
-            "bool": bool,
-            "boolean": bool,
-            "dict": dict,
-            "object": dict,
-            "list": list,
-            "array": list,
-            "any": Any,
-        }
-        return mapping.get(normalized, Any)
+        return _MCP_TYPE_MAP.get(type_name.lower(), Any)
 
     def create_tool_wrapper(self, func: BrimleyFunction):
         """Create a callable wrapper that resolves args and dispatches execution."""
         input_model = self.build_tool_input_model(func)
         func_name = func.name
-
-        field_names = list(input_model.model_fields.keys())
-
-        params = []
         context_type = self._resolve_fastmcp_context_type()
-        for field_name in field_names:
-            field_info = input_model.model_fields[field_name]
-            annotation = field_info.annotation
+
+        # FastMCP introspects the wrapper signature, so describe the model fields on a
+        # plain closure rather than compiling generated source for every tool
+        parameters = []
+        defaults: Dict[str, Any] = {}
+        for field_name, field_info in input_model.model_fields.items():
             if field_info.default is not PydanticUndefined:
-                params.append(f"{field_name}: {annotation.__name__} = {repr(field_info.default)}")
+                defaults[field_name] = field_info.default
+                default = field_info.default
             else:
-                params.append(f"{field_name}: {annotation.__name__}")
-
-        param_list = ", ".join(params)
-        arg_dict_items = [f'"{name}": {name}' for name in field_names]
-        arg_dict = "{" + ", ".join(arg_dict_items) + "}"
+                default = inspect.Parameter.empty
+            parameters.append(
+                inspect.Parameter(
+                    field_name,
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=default,
+                    annotation=field_info.annotation,
+                )
+            )
+        parameters.append(
+            inspect.Parameter("ctx", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=context_type)
+        )
+        field_names = frozenset(input_model.model_fields)
 
-        if param_list:
-            wrapper_params = f"{param_list}, *, ctx: ContextType = None"
-        else:
-            wrapper_params = "*, ctx: ContextType = None"
+        def build_call(kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any] | None]:
+            ctx = kwargs.pop("ctx", None)
+            if not field_names.issuperset(kwargs):
+                unexpected = ", ".join(sorted(set(kwargs) - field_names))
+                raise TypeError(f"{func_name}() got unexpected keyword argument(s): {unexpected}")
+            tool_args = {**defaults, **kwargs}
+            return tool_args, {"mcp_context": ctx} if ctx is not None else None
 
         if func.type == "python_function":
-            func_code = f"""
-async def wrapper({wrapper_params}):
-    result = self.execute_tool_by_name(func_name, {arg_dict}, runtime_injections={{"mcp_context": ctx}} if ctx is not None else None)
-    if inspect.isawaitable(result):
-        return await result
-    return result
-"""
+            async def wrapper(**kwargs: Any) -> Any:
+                tool_args, runtime_injections = build_call(kwargs)
+                result = self.execute_tool_by_name(func_name, tool_args, runtime_injections=runtime_injections)
+                if inspect.isawaitable(result):
+                    return await result
+                return result
         else:
-            func_code = f"""
-def wrapper({wrapper_params}):
-    return self.execute_tool_by_name(func_name, {arg_dict}, runtime_injections={{"mcp_context": ctx}} if ctx is not None else None)
-"""
-
-        local_vars = {"self": self, "func_name": func_name, "PydanticUndefined": PydanticUndefined}
-        exec(
-            func_code,
-            {
-                "self": self,
-                "func_name": func_name,
-                "ContextType": context_type,
-                "inspect": inspect,
-            },
-            local_vars,
-        )
-        wrapper = local_vars["wrapper"]
+            def wrapper(**kwargs: Any) -> Any:
+                tool_args, runtime_injections = build_call(kwargs)
+                return self.execute_tool_by_name(func_name, tool_args, runtime_injections=runtime_injections)
 
+        wrapper.__signature__ = inspect.Signature(parameters)  # type: ignore[attr-defined]
+        wrapper.__annotations__ = {parameter.name: parameter.annotation for parameter in parameters}
         wrapper.__name__ = func.name
-        wrapper.__doc__ = (func.mcp.description if getattr(func, "mcp", None) and func.mcp.description else func.description) or ""
+        wrapper.__qualname__ = func.name
+        wrapper.__doc__ = self.get_tool_description(func)
         return wrapper
 
     def execute_tool_by_name(
@@ -173,15 +239,20 @@ def wrapper({wrapper_params}):
 
     def _resolve_fastmcp_context_type(self) -> type[Any]:
         """Resolve FastMCP Context type when available; fall back to Any for local/non-MCP execution."""
+        if self._context_type is not None:
+            return self._context_type
+
+        resolved: Any = Any
         try:
             context_module = importlib.import_module("fastmcp.server.context")
             context_type = getattr(context_module, "Context", None)
             if isinstance(context_type, type):
-                return context_type
+                resolved = context_type
         except Exception:
             pass
 
-        return Any
+        self._context_type = resolved
+        return resolved
 
     def execute_tool(
         self,
@@ -194,28 +265,39 @@ def wrapper({wrapper_params}):
         return self.dispatcher.run(func, resolved_args, self.context, runtime_injections=runtime_injections)
 
     def create_tool_object(self, func: BrimleyFunction) -> Any:
-        """Create a FastMCP Tool object for the given function."""
+        """Create a FastMCP Tool object for the given function, reusing it while its shape is unchanged."""
+        tool_key = (
+            self.get_tool_schema_signatures([func])[func.name],
+            self.get_tool_description(func),
+            func.type,
+        )
+        cached = self._tool_objects.get(func.name)
+        if cached is not None and cached[0] == tool_key:
+            return cached[1]
+
         input_model = self.build_tool_input_model(func)
         wrapper = self.create_tool_wrapper(func)
 
-        fastmcp_module = importlib.import_module("fastmcp")
-        tools_module = getattr(fastmcp_module, "tools", None)
-        if tools_module:
-            tool_cls = getattr(tools_module, "Tool", None)
-        else:
-            tool_cls = None
-
+        tool_cls = self._tool_cls
         if tool_cls is None:
-            raise RuntimeError("FastMCP Tool class not found")
+            fastmcp_module = importlib.import_module("fastmcp")
+            tools_module = getattr(fastmcp_module, "tools", None)
+            if tools_module:
+                tool_cls = getattr(tools_module, "Tool", None)
+
+            if tool_cls is None:
+                raise RuntimeError("FastMCP Tool class not found")
+            self._tool_cls = tool_cls
 
         tool = tool_cls.from_function(
             fn=wrapper,
             name=func.name,
-            description=(func.mcp.description if getattr(func, "mcp", None) and func.mcp.description else func.description) or "",
+            description=self.get_tool_description(func),
         )
 
         tool.parameters = input_model.model_json_schema()
 
+        self._tool_objects[func.name] = (tool_key, tool)
         return tool
 
     def is_fastmcp_available(self) -> bool:
@@ -224,15 +306,25 @@ def wrapper({wrapper_params}):
 
     def require_fastmcp(self) -> Any:
         """Resolve and return the FastMCP class, raising a clear error if unavailable."""
+        if self._fastmcp_cls is not None:
+            return self._fastmcp_cls
+
         if not self.is_fastmcp_available():
             raise RuntimeError("MCP tools found but 'fastmcp' is not installed. Install with: pip install fastmcp")
 
         module = importlib.import_module("fastmcp")
-        return module.FastMCP
+        self._fastmcp_cls = module.FastMCP
+        return self._fastmcp_cls
 
     def register_tools(self, mcp_server: Any = None) -> Any:
         """Register discovered MCP tools on the provided (or newly created) MCP server."""
         tools = self.discover_tools()
+
+        # Drop cached Tool objects for functions that are no longer exposed
+        tool_names = {func.name for func in tools}
+        for stale_name in self._tool_objects.keys() - tool_names:
+            del self._tool_objects[stale_name]
+
         if not tools:
             return mcp_server
 
@@ -0,0 +1,6 @@
+"""Constants shared by runtime components."""
+
+# Same idea as git's racy-entry check: a file or directory modified within this window of
+# being stamped may change again without its mtime visibly moving, so such stamps are not
+# trusted for change detection
+RACY_WINDOW_NS = 2_000_000_000
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import os
+import sys
 import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
+
+from pydantic import BaseModel
 
 from brimley.config.loader import load_config
 from brimley.core.context import BrimleyContext
 from brimley.discovery.scanner import BrimleyScanResult, Scanner
+from brimley.runtime.constants import RACY_WINDOW_NS
+from brimley.runtime.native_watcher import create_watcher
 from brimley.runtime.polling_watcher import PollingWatcher
 from brimley.runtime.reload_contracts import ReloadCommandResult, ReloadCommandStatus
 from brimley.runtime.reload_engine import PartitionedReloadEngine
 
 
+# (serialized functions/entities/diagnostics, (source, mtime_ns, size) per project Python module)
+_ScanFingerprint = Tuple[Tuple[str, ...], Tuple[Tuple[str, int, int], ...]]
+
+
 @dataclass(frozen=True)
 class ReloadLifecycleEvent:
     """Host-facing reload lifecycle event payload."""
@@ -31,19 +41,23 @@ class BrimleyRuntimeController:
         on_reload_failure: Optional[Callable[[ReloadLifecycleEvent], None]] = None,
         mcp_refresh: Optional[Callable[[], object | None]] = None,
     ) -> None:
-        self.root_dir = root_dir
+        # Resolved once; scans, the watcher and config loading all reuse this path
+        self.root_dir = root_dir.expanduser().resolve()
         self.on_reload_success = on_reload_success
         self.on_reload_failure = on_reload_failure
         self.mcp_refresh = mcp_refresh
 
         config_data = load_config(self.root_dir / "brimley.yaml")
         self.context = BrimleyContext(config_dict=config_data)
-        self.context.app["root_dir"] = str(self.root_dir.expanduser().resolve())
+        self.context.app["root_dir"] = str(self.root_dir)
 
         self.reload_engine = PartitionedReloadEngine()
         self.auto_reload_watcher: Optional[PollingWatcher] = None
         self.auto_reload_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Fingerprint, result and registries of the last successful cycle, for no-op reload detection
+        self._last_scan_fingerprint: _ScanFingerprint | None = None
+        self._last_success: tuple[ReloadCommandResult, object, object] | None = None
 
     def load_initial(self) -> ReloadCommandResult:
         """Load initial discovery state into the runtime context."""
@@ -52,6 +66,16 @@ class BrimleyRuntimeController:
     def run_reload_cycle(self) -> ReloadCommandResult:
         """Run one reload cycle using partitioned policy-based semantics."""
         scan_result = self._scan()
+        fingerprint = self._scan_fingerprint(scan_result)
+
+        cached_result = self._unchanged_reload_result(fingerprint)
+        if cached_result is not None:
+            # Nothing Brimley-visible changed (e.g. an unrelated watched file was touched):
+            # registries and MCP tools are already current, so only report the success
+            if self.on_reload_success is not None:
+                self.on_reload_success(ReloadLifecycleEvent(result=cached_result))
+            return cached_result
+
         application_result = self.reload_engine.apply_reload_with_policy(self.context, scan_result)
 
         status = (
@@ -69,6 +93,13 @@ class BrimleyRuntimeController:
             diagnostics=application_result.diagnostics,
         )
 
+        if status == ReloadCommandStatus.SUCCESS and fingerprint is not None:
+            self._last_scan_fingerprint = fingerprint
+            self._last_success = (result, self.context.entities, self.context.functions)
+        else:
+            self._last_scan_fingerprint = None
+            self._last_success = None
+
         event = ReloadLifecycleEvent(result=result)
         if result.status == ReloadCommandStatus.SUCCESS and self.on_reload_success is not None:
             self.on_reload_success(event)
@@ -85,8 +116,9 @@ class BrimleyRuntimeController:
         if self.auto_reload_watcher is not None:
             return
 
-        self.auto_reload_watcher = PollingWatcher(
+        self.auto_reload_watcher = create_watcher(
             root_dir=self.root_dir,
+            backend=self.context.auto_reload.backend,
             interval_ms=self.context.auto_reload.interval_ms,
             debounce_ms=self.context.auto_reload.debounce_ms,
             include_patterns=self.context.auto_reload.include_patterns,
@@ -130,9 +162,78 @@ class BrimleyRuntimeController:
             return
 
         interval_seconds = max(self.context.auto_reload.interval_ms / 1000.0, 0.05)
+        # Deadline-based cadence: a slow poll shortens the next wait instead of drifting,
+        # and an overrun skips the missed ticks rather than polling back-to-back
+        next_tick = time.monotonic()
         while not self._stop_event.is_set():
             self.poll_once(now=time.monotonic())
-            self._stop_event.wait(interval_seconds)
+            next_tick += interval_seconds
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for <= 0:
+                next_tick = time.monotonic() + interval_seconds
+                sleep_for = interval_seconds
+            self._stop_event.wait(sleep_for)
+
+    def _unchanged_reload_result(
+        self, fingerprint: _ScanFingerprint | None
+    ) -> ReloadCommandResult | None:
+        """Return the last successful result when this scan is identical and registries are untouched."""
+        if fingerprint is None or self._last_success is None or fingerprint != self._last_scan_fingerprint:
+            return None
+
+        result, entities, functions = self._last_success
+        if self.context.entities is not entities or self.context.functions is not functions:
+            return None
+        return result
+
+    def _scan_fingerprint(
+        self, scan_result: BrimleyScanResult
+    ) -> _ScanFingerprint | None:
+        """Fingerprint a scan: its serialized definitions plus the stat of every project Python module.
+
+        Handler bodies are not part of the scan result, so the sources of reloadable handler modules
+        and of the loaded project modules they may import are stat'ed; returns None (never skip)
+        when a reloadable module's source cannot be located or was modified too recently to trust.
+        """
+        source_files: set[str] = set()
+        for func in scan_result.functions:
+            if func.type != "python_function" or not getattr(func, "reload", True):
+                continue
+
+            handler = getattr(func, "handler", None)
+            if not isinstance(handler, str) or "." not in handler:
+                continue
+
+            module = sys.modules.get(handler.rsplit(".", 1)[0])
+            source_file = getattr(module, "__file__", None)
+            if not isinstance(source_file, str):
+                return None
+            source_files.add(source_file)
+
+        if source_files:
+            # An edited helper only reaches its handlers through the engine's module rehydration
+            source_files.update(self.reload_engine.project_module_sources(self.context))
+
+        module_stamps: list[tuple[str, int, int]] = []
+        # A same-size edit within one timestamp tick leaves (mtime, size) unchanged; like the watcher
+        # and reload engine, never trust stamps that recent
+        trusted_before_ns = time.time_ns() - RACY_WINDOW_NS
+        for source_file in sorted(source_files):
+            try:
+                stat_result = os.stat(source_file)
+            except OSError:
+                return None
+            if stat_result.st_mtime_ns >= trusted_before_ns:
+                return None
+            module_stamps.append((source_file, stat_result.st_mtime_ns, stat_result.st_size))
+
+        # Dump each item as its concrete model: the result's List[BrimleyFunction] field would
+        # serialize subclasses as the base type and drop template/SQL bodies and handlers
+        definitions = tuple(
+            "\n".join(item.model_dump_json() if isinstance(item, BaseModel) else repr(item) for item in items)
+            for items in (scan_result.functions, scan_result.entities, scan_result.diagnostics)
+        )
+        return definitions, tuple(module_stamps)
 
     def _scan(self) -> BrimleyScanResult:
         if not self.root_dir.exists():
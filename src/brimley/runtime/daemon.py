@@ -4,11 +4,13 @@ import json
 import os
 import socket
 import time
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel
 
 
 class DaemonState(str, Enum):
@@ -19,14 +21,52 @@ class DaemonState(str, Enum):
     STALE = "stale"
 
 
-class DaemonMetadata(BaseModel):
+def _require_int(payload: dict[str, Any], key: str) -> int:
+    value = payload.get(key)
+    # bool is an int subclass but never a valid pid/port
+    if type(value) is not int:
+        raise ValueError(f"'{key}' must be an integer, got {value!r}")
+    return value
+
+
+def _require_str(payload: dict[str, Any], key: str, default: str | None = None) -> str:
+    value = payload.get(key, default)
+    if not isinstance(value, str):
+        raise ValueError(f"'{key}' must be a string, got {value!r}")
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class DaemonMetadata:
     """Persisted daemon liveness metadata."""
 
-    pid: int = Field(gt=0)
-    port: int = Field(ge=1, le=65535)
+    pid: int
+    port: int
     started_at: str
     host: str = "127.0.0.1"
 
+    def __post_init__(self) -> None:
+        if self.pid <= 0:
+            raise ValueError(f"pid must be greater than 0, got {self.pid}")
+        if not 1 <= self.port <= 65535:
+            raise ValueError(f"port must be between 1 and 65535, got {self.port}")
+
+    @classmethod
+    def from_dict(cls, payload: Any) -> "DaemonMetadata":
+        """Validate a decoded JSON payload; raises ValueError when malformed."""
+        if not isinstance(payload, dict):
+            raise ValueError("Daemon metadata must be a JSON object.")
+        return cls(
+            pid=_require_int(payload, "pid"),
+            port=_require_int(payload, "port"),
+            started_at=_require_str(payload, "started_at"),
+            host=_require_str(payload, "host", "127.0.0.1"),
+        )
+
+    def to_json(self) -> str:
+        """Serialize to compact JSON."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
 
 class DaemonProbeResult(BaseModel):
     """Result payload from probing daemon metadata/liveness."""
@@ -37,12 +77,38 @@ class DaemonProbeResult(BaseModel):
     reason: str
 
 
-class ReplClientMetadata(BaseModel):
+# Metadata file path -> (stat fingerprint, parsed metadata); a matching stat skips read and validation
+_PROBE_CACHE: dict[str, tuple[tuple[int, int, int], "DaemonMetadata"]] = {}
+
+
+# pid -> (monotonic check time, alive); lifecycle transitions are slow relative to the TTL
+_ALIVE_CACHE: dict[int, tuple[float, bool]] = {}
+_ALIVE_CACHE_TTL_SECONDS = 0.05
+_ALIVE_CACHE_MAX_ENTRIES = 64
+
+
+@dataclass(frozen=True, slots=True)
+class ReplClientMetadata:
     """Persisted active REPL client metadata."""
 
-    pid: int = Field(gt=0)
+    pid: int
     attached_at: str
 
+    def __post_init__(self) -> None:
+        if self.pid <= 0:
+            raise ValueError(f"pid must be greater than 0, got {self.pid}")
+
+    @classmethod
+    def from_dict(cls, payload: Any) -> "ReplClientMetadata":
+        """Validate a decoded JSON payload; raises ValueError when malformed."""
+        if not isinstance(payload, dict):
+            raise ValueError("REPL client metadata must be a JSON object.")
+        return cls(pid=_require_int(payload, "pid"), attached_at=_require_str(payload, "attached_at"))
+
+    def to_json(self) -> str:
+        """Serialize to compact JSON."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
 
 def daemon_metadata_path(root_dir: Path) -> Path:
     """Return the daemon metadata file path for a project root."""
@@ -54,11 +120,53 @@ def repl_client_metadata_path(root_dir: Path) -> Path:
     return root_dir / ".brimley" / "repl_client.json"
 
 
+def _write_metadata_atomic(metadata_file: Path, payload: bytes) -> None:
+    """Write payload to a sibling temp file and rename it over metadata_file.
+
+    Concurrent probes see either the previous or the new file, never a partial write.
+    The file is 0o644 regardless of the process umask.
+    """
+    temp_file = metadata_file.with_name(f"{metadata_file.name}.{os.getpid()}.tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        # os.open's mode is masked by the umask; set it explicitly before publishing
+        os.chmod(temp_file, 0o644)
+        os.replace(temp_file, metadata_file)
+    except BaseException:
+        try:
+            os.unlink(temp_file)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _read_small(path: Path) -> bytes:
+    """Read a small metadata file with raw fd reads, skipping the text-IO layer."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 8192)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
 def write_daemon_metadata(root_dir: Path, metadata: DaemonMetadata) -> Path:
     """Persist daemon metadata for a project root."""
     metadata_file = daemon_metadata_path(root_dir)
     metadata_file.parent.mkdir(parents=True, exist_ok=True)
-    metadata_file.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
+    _write_metadata_atomic(metadata_file, metadata.to_json().encode("utf-8"))
+    # Rewrites can land within one mtime tick; never let this process probe its own stale entry
+    _PROBE_CACHE.pop(str(metadata_file), None)
     return metadata_file
 
 
@@ -97,39 +205,67 @@ def is_process_alive(pid: int) -> bool:
     if pid <= 0:
         return False
 
+    now = time.monotonic()
+    cached = _ALIVE_CACHE.get(pid)
+    if cached is not None and now - cached[0] < _ALIVE_CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
         os.kill(pid, 0)
     except ProcessLookupError:
-        return False
+        alive = False
     except PermissionError:
-        return True
+        alive = True
     except OSError:
-        return False
+        alive = False
+    else:
+        alive = True
 
-    return True
+    # Re-insert so dict order tracks recency, then evict the oldest entries
+    _ALIVE_CACHE.pop(pid, None)
+    _ALIVE_CACHE[pid] = (now, alive)
+    while len(_ALIVE_CACHE) > _ALIVE_CACHE_MAX_ENTRIES:
+        del _ALIVE_CACHE[next(iter(_ALIVE_CACHE))]
+    return alive
 
 
 def probe_daemon_state(root_dir: Path) -> DaemonProbeResult:
     """Classify daemon state for a root as absent, running, or stale."""
     metadata_file = daemon_metadata_path(root_dir)
-    if not metadata_file.exists():
+    cache_key = str(metadata_file)
+    try:
+        stat_result = os.stat(metadata_file)
+    except FileNotFoundError:
+        _PROBE_CACHE.pop(cache_key, None)
         return DaemonProbeResult(
             state=DaemonState.ABSENT,
             metadata=None,
             metadata_path=str(metadata_file),
             reason="Daemon metadata file not found.",
         )
+    except OSError:
+        stat_result = None
 
-    try:
-        payload = json.loads(metadata_file.read_text(encoding="utf-8"))
-        metadata = DaemonMetadata.model_validate(payload)
-    except (OSError, json.JSONDecodeError, ValidationError) as exc:
-        return DaemonProbeResult(
-            state=DaemonState.STALE,
-            metadata=None,
-            metadata_path=str(metadata_file),
-            reason=f"Invalid daemon metadata payload: {exc}",
-        )
+    fingerprint = (
+        (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino) if stat_result is not None else None
+    )
+    cached = _PROBE_CACHE.get(cache_key)
+    if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+        metadata = cached[1]
+    else:
+        try:
+            payload = json.loads(_read_small(metadata_file))
+            metadata = DaemonMetadata.from_dict(payload)
+        except (OSError, ValueError) as exc:
+            _PROBE_CACHE.pop(cache_key, None)
+            return DaemonProbeResult(
+                state=DaemonState.STALE,
+                metadata=None,
+                metadata_path=str(metadata_file),
+                reason=f"Invalid daemon metadata payload: {exc}",
+            )
+        if fingerprint is not None:
+            _PROBE_CACHE[cache_key] = (fingerprint, metadata)
 
     if not is_process_alive(metadata.pid):
         return DaemonProbeResult(
@@ -153,9 +289,7 @@ def recover_stale_daemon_metadata(root_dir: Path) -> bool:
     if probe.state != DaemonState.STALE:
         return False
 
-    metadata_file = Path(probe.metadata_path)
-    if metadata_file.exists():
-        metadata_file.unlink()
+    Path(probe.metadata_path).unlink(missing_ok=True)
     return True
 
 
@@ -164,25 +298,23 @@ def acquire_repl_client_slot(root_dir: Path) -> bool:
     metadata_file = repl_client_metadata_path(root_dir)
     metadata_file.parent.mkdir(parents=True, exist_ok=True)
 
-    if metadata_file.exists():
-        try:
-            payload = json.loads(metadata_file.read_text(encoding="utf-8"))
-            existing = ReplClientMetadata.model_validate(payload)
-            if is_process_alive(existing.pid):
-                return False
-        except (OSError, json.JSONDecodeError, ValidationError):
-            pass
+    # A missing slot file surfaces as FileNotFoundError and is treated like an unreadable one
+    try:
+        payload = json.loads(_read_small(metadata_file))
+        existing = ReplClientMetadata.from_dict(payload)
+        if is_process_alive(existing.pid):
+            return False
+    except (OSError, ValueError):
+        pass
 
     metadata = ReplClientMetadata(pid=os.getpid(), attached_at="active")
-    metadata_file.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
+    _write_metadata_atomic(metadata_file, metadata.to_json().encode("utf-8"))
     return True
 
 
 def release_repl_client_slot(root_dir: Path) -> None:
     """Release active REPL client slot metadata if present."""
-    metadata_file = repl_client_metadata_path(root_dir)
-    if metadata_file.exists():
-        metadata_file.unlink()
+    repl_client_metadata_path(root_dir).unlink(missing_ok=True)
 
 
 def shutdown_daemon_lifecycle(root_dir: Path) -> bool:
@@ -191,12 +323,11 @@ def shutdown_daemon_lifecycle(root_dir: Path) -> bool:
     daemon_file = daemon_metadata_path(root_dir)
     client_file = repl_client_metadata_path(root_dir)
 
-    if daemon_file.exists():
-        daemon_file.unlink()
-        removed = True
-
-    if client_file.exists():
-        client_file.unlink()
+    for metadata_file in (daemon_file, client_file):
+        try:
+            metadata_file.unlink()
+        except FileNotFoundError:
+            continue
         removed = True
 
     return removed
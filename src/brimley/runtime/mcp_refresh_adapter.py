@@ -30,36 +30,55 @@ class ProviderMCPRefreshManager:
         self.set_server = set_server
         self.server_factory = server_factory
         self._schema_signatures: dict[str, str] = {}
+        self._provider: BrimleyProvider | None = None
+        # Server and per-tool (description, function type) from the last registration, for the
+        # unchanged-tools shortcut; the type decides whether the registered wrapper is sync or async
+        self._registered_server: Any | None = None
+        self._tool_metadata: dict[str, tuple[str, str]] = {}
+        # (server, resolved reset callable or None), re-resolved when the server object changes
+        self._reset_callable: tuple[Any, Callable[[], Any] | None] | None = None
 
     def refresh(self) -> Any | None:
         """Refresh MCP tools for the external host server and return active server.
 
         Strategy order:
         1. If no current server, create/register tools via Brimley provider.
-        2. If server supports tool reset (`clear_tools` or `reset_tools`), refresh in place.
-        3. If server cannot reset but `server_factory` is provided, create and swap server.
-        4. Fallback: register tools onto existing server (best effort).
+        2. If the current server already carries identical tool schemas, descriptions and types, keep it
+           as-is; wrappers resolve functions by name at call time, so reloaded bodies need no re-registration.
+        3. If server supports tool reset (`clear_tools` or `reset_tools`), refresh in place.
+        4. If server cannot reset but `server_factory` is provided, create and swap server.
+        5. Fallback: register tools onto existing server (best effort).
         """
 
-        adapter = BrimleyProvider(registry=self.context.functions, context=self.context)
+        adapter = self._get_provider()
         tools = adapter.discover_tools()
         schema_signatures = adapter.get_tool_schema_signatures(tools)
         current_server = self.get_server()
 
         if not tools:
             self._schema_signatures = {}
+            self._registered_server = None
             return current_server
 
         if not adapter.is_fastmcp_available():
             raise RuntimeError("MCP tools found but 'fastmcp' is not installed. Install with: pip install fastmcp")
 
+        tool_metadata = {func.name: (adapter.get_tool_description(func), func.type) for func in tools}
+
         if current_server is None:
             next_server = adapter.register_tools()
             if next_server is not None:
                 self.set_server(next_server)
-            self._schema_signatures = schema_signatures
+            self._record_registration(next_server, schema_signatures, tool_metadata)
             return next_server
 
+        if (
+            current_server is self._registered_server
+            and schema_signatures == self._schema_signatures
+            and tool_metadata == self._tool_metadata
+        ):
+            return current_server
+
         if self._schema_signatures and schema_signatures != self._schema_signatures:
             if self.server_factory is None:
                 raise RuntimeError(
@@ -70,7 +89,7 @@ class ProviderMCPRefreshManager:
             refreshed = adapter.register_tools(mcp_server=next_server)
             if refreshed is not None:
                 self.set_server(refreshed)
-            self._schema_signatures = schema_signatures
+            self._record_registration(refreshed, schema_signatures, tool_metadata)
             return refreshed
 
         if self._supports_clear_tools(current_server):
@@ -78,7 +97,7 @@ class ProviderMCPRefreshManager:
             refreshed = adapter.register_tools(mcp_server=current_server)
             if refreshed is not None:
                 self.set_server(refreshed)
-            self._schema_signatures = schema_signatures
+            self._record_registration(refreshed, schema_signatures, tool_metadata)
             return refreshed
 
         if self.server_factory is not None:
@@ -86,28 +105,55 @@ class ProviderMCPRefreshManager:
             refreshed = adapter.register_tools(mcp_server=next_server)
             if refreshed is not None:
                 self.set_server(refreshed)
-            self._schema_signatures = schema_signatures
+            self._record_registration(refreshed, schema_signatures, tool_metadata)
             return refreshed
 
         refreshed = adapter.register_tools(mcp_server=current_server)
         if refreshed is not None:
             self.set_server(refreshed)
-        self._schema_signatures = schema_signatures
+        self._record_registration(refreshed, schema_signatures, tool_metadata)
         return refreshed
 
-    def _supports_clear_tools(self, server: Any) -> bool:
-        return callable(getattr(server, "clear_tools", None)) or callable(getattr(server, "reset_tools", None))
+    def _record_registration(
+        self,
+        server: Any | None,
+        schema_signatures: dict[str, str],
+        tool_metadata: dict[str, tuple[str, str]],
+    ) -> None:
+        self._registered_server = server
+        self._schema_signatures = schema_signatures
+        self._tool_metadata = tool_metadata
 
-    def _clear_tools(self, server: Any) -> None:
-        clear_tools = getattr(server, "clear_tools", None)
-        if callable(clear_tools):
-            clear_tools()
-            return
+    def _get_provider(self) -> BrimleyProvider:
+        """Return the provider reused across refreshes so its input-model cache survives reloads."""
+        if self._provider is None:
+            self._provider = BrimleyProvider(registry=self.context.functions, context=self.context)
+        else:
+            # Reloads swap in a fresh function registry; rebind rather than rebuild the provider
+            self._provider.registry = self.context.functions
+        return self._provider
 
-        reset_tools = getattr(server, "reset_tools", None)
-        if callable(reset_tools):
-            reset_tools()
+    def _supports_clear_tools(self, server: Any) -> bool:
+        return self._resolve_reset(server) is not None
 
+    def _clear_tools(self, server: Any) -> None:
+        reset = self._resolve_reset(server)
+        if reset is not None:
+            reset()
+
+    def _resolve_reset(self, server: Any) -> Callable[[], Any] | None:
+        """Return the server's tool-reset callable (`clear_tools`, else `reset_tools`), cached per server."""
+        cached = self._reset_callable
+        if cached is not None and cached[0] is server:
+            return cached[1]
+
+        reset = getattr(server, "clear_tools", None)
+        if not callable(reset):
+            reset = getattr(server, "reset_tools", None)
+            if not callable(reset):
+                reset = None
+        self._reset_callable = (server, reset)
+        return reset
 
 class ExternalMCPRefreshAdapter(ProviderMCPRefreshManager):
     """Compatibility shim for legacy adapter naming; provider manager is canonical."""
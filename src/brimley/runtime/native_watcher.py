@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Set
+
+from brimley.runtime.polling_watcher import PollingWatcher, _snapshot_bucket
+
+WatcherBackend = Literal["polling", "native"]
+
+logger = logging.getLogger(__name__)
+
+
+def is_native_watcher_available() -> bool:
+    """Check whether the optional watchdog package is installed."""
+    return importlib.util.find_spec("watchdog") is not None
+
+
+def create_watcher(
+    root_dir: Path,
+    backend: WatcherBackend = "polling",
+    interval_ms: int = 1000,
+    debounce_ms: int = 300,
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+) -> PollingWatcher:
+    """Build the file watcher for the requested backend.
+
+    `native` falls back to polling, with a logged warning, when watchdog is not installed or the root
+    is not an existing directory (an OS observer cannot be scheduled on a missing path).
+    """
+    watcher_cls = PollingWatcher
+    if backend == "native":
+        if not is_native_watcher_available():
+            logger.warning(
+                "auto_reload.backend is 'native' but 'watchdog' is not installed; falling back to polling. "
+                "Install with: pip install brimley[watchdog]"
+            )
+        elif not root_dir.is_dir():
+            logger.warning(
+                "auto_reload.backend is 'native' but %s is not an existing directory; falling back to polling.",
+                root_dir,
+            )
+        else:
+            watcher_cls = NativeWatcher
+
+    return watcher_cls(
+        root_dir=root_dir,
+        interval_ms=interval_ms,
+        debounce_ms=debounce_ms,
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+    )
+
+
+def _build_event_handler(callback: Callable[[Any], None]) -> Any:
+    """Create a watchdog event handler forwarding every event to `callback`."""
+    events_module = importlib.import_module("watchdog.events")
+
+    class _ForwardingHandler(events_module.FileSystemEventHandler):
+        def on_any_event(self, event: Any) -> None:
+            callback(event)
+
+    return _ForwardingHandler()
+
+
+class NativeWatcher(PollingWatcher):
+    """Event-driven watcher backed by watchdog's OS-native observers (inotify/FSEvents/ReadDirectoryChangesW).
+
+    Shares the polling watcher's filters, lifecycle and debounce contract, but changes are pushed by
+    the observer thread: poll() drains queued paths instead of walking the tree. Directory-level
+    events (a subtree created, moved or deleted) fall back to one full rescan on the next poll.
+    Network filesystems often deliver no native events; use the polling backend there.
+    """
+
+    __slots__ = ("_observer", "_event_lock", "_queued_changes", "_rescan_required")
+
+    def __init__(
+        self,
+        root_dir: Path,
+        interval_ms: int = 1000,
+        debounce_ms: int = 300,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+    ) -> None:
+        super().__init__(
+            root_dir=root_dir,
+            interval_ms=interval_ms,
+            debounce_ms=debounce_ms,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+        )
+        self._observer: Any | None = None
+        self._event_lock = threading.Lock()
+        # Root-relative path -> whether it exists after the latest event, in first-seen order
+        self._queued_changes: Dict[str, bool] = {}
+        self._rescan_required = False
+
+    def start(self) -> None:
+        """Start watcher lifecycle, take the initial snapshot and start the OS observer."""
+        super().start()
+        with self._event_lock:
+            self._queued_changes = {}
+            self._rescan_required = False
+
+        observers_module = importlib.import_module("watchdog.observers")
+        observer = observers_module.Observer()
+        observer.schedule(_build_event_handler(self._on_fs_event), str(self.root_dir), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+
+    def stop(self) -> None:
+        """Stop watcher lifecycle and the OS observer."""
+        super().stop()
+        observer = self._observer
+        self._observer = None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=1)
+
+    def _collect_changes(self) -> Set[str]:
+        with self._event_lock:
+            queued = self._queued_changes
+            rescan_required = self._rescan_required
+            self._queued_changes = {}
+            self._rescan_required = False
+
+        if rescan_required:
+            changed_paths = super()._collect_changes()
+            changed_paths.update(queued)
+            return changed_paths
+
+        snapshot = self._snapshot
+        root_prefix = self._root_prefix
+        for relative, exists in queued.items():
+            bucket_key = _snapshot_bucket(relative)
+            mtime_ns = None
+            if exists:
+                # Native events carry no mtime; store the real one so a later full rescan (after a
+                # directory event) does not report every file touched since start as changed again
+                try:
+                    mtime_ns = os.stat(root_prefix + relative).st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+            if mtime_ns is not None:
+                snapshot.setdefault(bucket_key, {})[relative] = mtime_ns
+            else:
+                bucket = snapshot.get(bucket_key)
+                if bucket is not None:
+                    bucket.pop(relative, None)
+        return set(queued)
+
+    def _on_fs_event(self, event: Any) -> None:
+        """Queue a watchdog event; runs on the observer thread."""
+        event_type = event.event_type
+        if event_type not in ("created", "modified", "deleted", "moved"):
+            # Open/close notifications carry no content change
+            return
+
+        if event.is_directory:
+            if event_type != "modified":
+                with self._event_lock:
+                    self._rescan_required = True
+            return
+
+        if event_type == "moved":
+            updates = ((event.src_path, False), (event.dest_path, True))
+        else:
+            updates = ((event.src_path, event_type != "deleted"),)
+
+        queued: List[tuple[str, bool]] = []
+        for path, exists in updates:
+            relative = self._relative_path(os.fsdecode(path))
+            if relative is not None and self._is_tracked_path(relative, relative.rpartition("/")[2]):
+                queued.append((relative, exists))
+
+        if queued:
+            with self._event_lock:
+                self._queued_changes.update(queued)
+
+    def _relative_path(self, path: str) -> Optional[str]:
+        root_prefix = self._root_prefix
+        if not path.startswith(root_prefix):
+            return None
+        relative = path[len(root_prefix):]
+        if os.sep != "/":
+            relative = relative.replace(os.sep, "/")
+        return relative
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import os
+import re
+import time
 from dataclasses import dataclass
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Pattern, Set, Tuple
 
+from brimley.runtime.constants import RACY_WINDOW_NS
 from brimley.runtime.reload_contracts import (
     WatcherEvent,
     WatcherState,
@@ -12,17 +16,84 @@ from brimley.runtime.reload_contracts import (
 )
 
 
-@dataclass(frozen=True)
+# fnmatch.fnmatch case-normalizes paths; that is a no-op on POSIX, so skip the calls there
+_NORMCASE_IS_IDENTITY = os.path.normcase("A") == "A"
+
+
+def _compile_patterns(patterns: List[str]) -> Optional[Pattern[str]]:
+    """Combine fnmatch patterns into one regex so each path is matched once, not once per pattern.
+
+    Patterns are case-normalized the way fnmatch.fnmatch does it.
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{translate(os.path.normcase(pattern))})" for pattern in patterns))
+
+
+# FILE_CHANGE then DEBOUNCE_WINDOW_OPEN, resolved once through the contract state machine so
+# opening a window costs one lookup; states missing here (other than DEBOUNCING) ignore changes
+_DEBOUNCE_ENTRY: Dict[WatcherState, WatcherState] = {
+    WatcherState.WATCHING: transition_watcher_state(
+        transition_watcher_state(WatcherState.WATCHING, WatcherEvent.FILE_CHANGE),
+        WatcherEvent.DEBOUNCE_WINDOW_OPEN,
+    ),
+}
+
+
+_EMPTY_BUCKET: Dict[str, int] = {}
+
+
+def _snapshot_bucket(relative_path: str) -> str:
+    """Snapshot bucket of a root-relative POSIX path: its top-level component, or "" at the root."""
+    head, separator, _ = relative_path.partition("/")
+    return head if separator else ""
+
+
+@dataclass(frozen=True, slots=True)
+class _DirListing:
+    """One directory's entries as of a given directory mtime."""
+
+    mtime_ns: int
+    subdirs: Tuple[str, ...]
+    # (root-relative POSIX path, absolute path) for tracked files only
+    files: Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
 class WatcherPollResult:
-    """Result from one watcher poll cycle."""
+    """Result from one watcher poll cycle.
+
+    `changed_paths` holds root-relative POSIX paths in the order changes were first detected;
+    paths detected in the same poll are sorted.
+    """
 
     should_reload: bool
-    changed_paths: List[str]
+    changed_paths: Tuple[str, ...]
+
+
+# Returned by every poll that does not trigger a reload; immutable, so one instance is shared
+_NO_RELOAD = WatcherPollResult(should_reload=False, changed_paths=())
 
 
 class PollingWatcher:
     """Polling-based file watcher with include/exclude filters and debounce logic."""
 
+    __slots__ = (
+        "root_dir",
+        "interval_ms",
+        "debounce_ms",
+        "include_patterns",
+        "exclude_patterns",
+        "_include_re",
+        "_exclude_re",
+        "state",
+        "_snapshot",
+        "_pending_changes",
+        "_last_change_at",
+        "_dir_listings",
+        "_root_prefix",
+    )
+
     def __init__(
         self,
         root_dir: Path,
@@ -36,15 +107,24 @@ class PollingWatcher:
         self.debounce_ms = debounce_ms
         self.include_patterns = include_patterns or ["*.py", "*.sql", "*.md", "*.yaml"]
         self.exclude_patterns = exclude_patterns or []
+        self._include_re = _compile_patterns(self.include_patterns)
+        self._exclude_re = _compile_patterns(self.exclude_patterns)
 
         self.state: WatcherState = WatcherState.STOPPED
-        self._snapshot: Dict[str, int] = {}
-        self._pending_changes: Set[str] = set()
+        # Top-level path component ("" for root files) -> {relative path: mtime_ns}
+        self._snapshot: Dict[str, Dict[str, int]] = {}
+        # Insertion-ordered set of changed paths awaiting the debounce window
+        self._pending_changes: Dict[str, None] = {}
         self._last_change_at: Optional[float] = None
+        # Directory path (with trailing separator for the root) -> listing from the previous snapshot
+        self._dir_listings: Dict[str, _DirListing] = {}
+        # Root path with a trailing separator, so entry paths slice straight to root-relative form
+        self._root_prefix = os.path.join(str(self.root_dir), "")
 
     def start(self) -> None:
         """Start watcher lifecycle and initialize file snapshot."""
         self.state = transition_watcher_state(self.state, WatcherEvent.START)
+        self._root_prefix = os.path.join(str(self.root_dir), "")
         self._snapshot = self._build_snapshot()
 
     def stop(self) -> None:
@@ -64,89 +144,156 @@ class PollingWatcher:
             raise RuntimeError("PollingWatcher is not started. Call start() before poll().")
 
         if self.state == WatcherState.RELOADING:
-            return WatcherPollResult(should_reload=False, changed_paths=[])
-
-        current_snapshot = self._build_snapshot()
-        changed_paths = self._detect_changes(self._snapshot, current_snapshot)
-        self._snapshot = current_snapshot
+            return _NO_RELOAD
 
+        changed_paths = self._collect_changes()
         if changed_paths:
-            self._pending_changes.update(changed_paths)
+            self._pending_changes.update(dict.fromkeys(sorted(changed_paths)))
             self._last_change_at = now
             self._enter_debounce_window()
-            return WatcherPollResult(should_reload=False, changed_paths=[])
+            return _NO_RELOAD
 
         if self.state == WatcherState.DEBOUNCING and self._last_change_at is not None:
             debounce_seconds = self.debounce_ms / 1000.0
             if (now - self._last_change_at) >= debounce_seconds:
                 self.state = transition_watcher_state(self.state, WatcherEvent.DEBOUNCE_ELAPSED)
-                paths = sorted(self._pending_changes)
-                self._pending_changes.clear()
+                paths = tuple(self._pending_changes)
+                self._pending_changes = {}
                 self._last_change_at = None
                 return WatcherPollResult(should_reload=True, changed_paths=paths)
 
-        return WatcherPollResult(should_reload=False, changed_paths=[])
+        return _NO_RELOAD
 
     def tracked_paths(self) -> Set[str]:
         """Return current tracked relative paths from the latest snapshot."""
-        return set(self._snapshot.keys())
+        return {path for bucket in self._snapshot.values() for path in bucket}
+
+    def _collect_changes(self) -> Set[str]:
+        """Return paths changed since the previous poll, advancing the stored snapshot."""
+        current_snapshot = self._build_snapshot()
+        changed_paths = self._detect_bucket_changes(self._snapshot, current_snapshot)
+        self._snapshot = current_snapshot
+        return changed_paths
 
     def _enter_debounce_window(self) -> None:
-        if self.state == WatcherState.WATCHING:
-            self.state = transition_watcher_state(self.state, WatcherEvent.FILE_CHANGE)
-            self.state = transition_watcher_state(self.state, WatcherEvent.DEBOUNCE_WINDOW_OPEN)
+        if self.state is WatcherState.DEBOUNCING:
+            # Window already open; the caller has moved _last_change_at, which extends it
             return
 
-        if self.state == WatcherState.DEBOUNCING:
-            self.state = transition_watcher_state(self.state, WatcherEvent.FILE_CHANGE)
-            self.state = transition_watcher_state(self.state, WatcherEvent.DEBOUNCE_WINDOW_OPEN)
-
-    def _build_snapshot(self) -> Dict[str, int]:
-        snapshot: Dict[str, int] = {}
-        if not self.root_dir.exists():
-            return snapshot
-
-        for path in self.root_dir.rglob("*"):
-            if not path.is_file():
+        next_state = _DEBOUNCE_ENTRY.get(self.state)
+        if next_state is not None:
+            self.state = next_state
+
+    def _build_snapshot(self) -> Dict[str, Dict[str, int]]:
+        snapshot: Dict[str, Dict[str, int]] = {}
+        root_prefix = self._root_prefix
+        root_prefix_len = len(root_prefix)
+        is_tracked = self._is_tracked_path
+        previous_listings = self._dir_listings
+        listings: Dict[str, _DirListing] = {}
+        # Directory mtimes this close to the scan may still change within the same timestamp tick
+        trusted_before_ns = time.time_ns() - RACY_WINDOW_NS
+
+        # Iterative walk. A directory's mtime moves whenever an entry is added, removed or renamed,
+        # so an unchanged directory reuses its previous listing and only its tracked files are
+        # re-stat'd for content edits; changed (or recently changed) directories are re-enumerated
+        # with os.scandir. Symlinked directories are not descended into.
+        pending_dirs = [root_prefix]
+        while pending_dirs:
+            dir_path = pending_dirs.pop()
+            try:
+                dir_mtime_ns = os.stat(dir_path).st_mtime_ns
+            except OSError:
+                # Root missing, or a directory vanished or became unreadable mid-walk
                 continue
 
-            relative = path.relative_to(self.root_dir).as_posix()
-            if not self._is_tracked_path(relative, path.name):
-                continue
+            listing = previous_listings.get(dir_path)
+            if listing is None or listing.mtime_ns != dir_mtime_ns or dir_mtime_ns >= trusted_before_ns:
+                listing = self._list_directory(dir_path, dir_mtime_ns, root_prefix_len, is_tracked)
+                if listing is None:
+                    continue
 
-            snapshot[relative] = path.stat().st_mtime_ns
+            listings[dir_path] = listing
+            pending_dirs.extend(listing.subdirs)
+            if not listing.files:
+                continue
 
+            # Every file under one top-level directory shares its bucket
+            bucket_key = dir_path[root_prefix_len:].partition(os.sep)[0]
+            bucket = snapshot.get(bucket_key)
+            if bucket is None:
+                bucket = snapshot[bucket_key] = {}
+            for relative, file_path in listing.files:
+                try:
+                    bucket[relative] = os.stat(file_path).st_mtime_ns
+                except OSError:
+                    continue
+
+        self._dir_listings = listings
         return snapshot
 
-    def _is_tracked_path(self, relative_path: str, filename: str) -> bool:
-        included = any(
-            fnmatch(relative_path, pattern) or fnmatch(filename, pattern)
-            for pattern in self.include_patterns
-        )
-        if not included:
-            return False
-
-        excluded = any(
-            fnmatch(relative_path, pattern) or fnmatch(filename, pattern)
-            for pattern in self.exclude_patterns
-        )
-        return not excluded
-
     @staticmethod
-    def _detect_changes(previous: Dict[str, int], current: Dict[str, int]) -> Set[str]:
-        changes: Set[str] = set()
+    def _list_directory(
+        dir_path: str,
+        dir_mtime_ns: int,
+        root_prefix_len: int,
+        is_tracked: Callable[[str, str], bool],
+    ) -> Optional[_DirListing]:
+        subdirs: List[str] = []
+        files: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+
+                    relative = entry.path[root_prefix_len:]
+                    if os.sep != "/":
+                        relative = relative.replace(os.sep, "/")
+                    if is_tracked(relative, entry.name):
+                        files.append((relative, entry.path))
+        except OSError:
+            return None
+
+        return _DirListing(mtime_ns=dir_mtime_ns, subdirs=tuple(subdirs), files=tuple(files))
 
-        previous_paths = set(previous.keys())
-        current_paths = set(current.keys())
+    def _is_tracked_path(self, relative_path: str, filename: str) -> bool:
+        if not _NORMCASE_IS_IDENTITY:
+            relative_path = os.path.normcase(relative_path)
+            filename = os.path.normcase(filename)
 
-        for added in current_paths - previous_paths:
-            changes.add(added)
+        include_re = self._include_re
+        if include_re is None or not (include_re.match(relative_path) or include_re.match(filename)):
+            return False
 
-        for removed in previous_paths - current_paths:
-            changes.add(removed)
+        exclude_re = self._exclude_re
+        return exclude_re is None or not (exclude_re.match(relative_path) or exclude_re.match(filename))
 
-        for existing in previous_paths & current_paths:
-            if previous[existing] != current[existing]:
-                changes.add(existing)
+    @classmethod
+    def _detect_bucket_changes(
+        cls,
+        previous: Dict[str, Dict[str, int]],
+        current: Dict[str, Dict[str, int]],
+    ) -> Set[str]:
+        changes: Set[str] = set()
+        for bucket_key in previous.keys() | current.keys():
+            previous_bucket = previous.get(bucket_key, _EMPTY_BUCKET)
+            current_bucket = current.get(bucket_key, _EMPTY_BUCKET)
+            # Untouched subtrees compare equal in one C-level pass and are skipped
+            if previous_bucket != current_bucket:
+                changes |= cls._detect_changes(previous_bucket, current_bucket)
+        return changes
 
+    @staticmethod
+    def _detect_changes(previous: Dict[str, int], current: Dict[str, int]) -> Set[str]:
+        # Key-view set operations run in C: added/removed paths in one step, then only
+        # paths present in both snapshots need an mtime comparison
+        changes: Set[str] = previous.keys() ^ current.keys()
+        changes.update(path for path in previous.keys() & current.keys() if previous[path] != current[path])
         return changes
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -45,19 +46,18 @@ class WatcherEvent(str, Enum):
     STOP = "stop"
 
 
-class DomainReloadInput(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DomainReloadInput:
     """Inputs used to evaluate if a domain swap is safe for this cycle."""
 
-    model_config = ConfigDict(extra="forbid")
-
-    diagnostics: List[BrimleyDiagnostic] = Field(default_factory=list)
+    diagnostics: List[BrimleyDiagnostic] = field(default_factory=list)
 
 
-class DomainSwapDecision(BaseModel):
+@dataclass(frozen=True, slots=True)
+class DomainSwapDecision:
     """Output policy decision for one domain in a reload cycle."""
 
-    model_config = ConfigDict(extra="forbid")
-
+    # Frozen so the policy can hand out shared, pre-built decisions
     can_swap: bool
     blocked_reason: str | None = None
 
@@ -108,10 +108,29 @@ def format_reload_command_message(result: ReloadCommandResult) -> str:
     )
 
 
+_BLOCKING_SEVERITIES = frozenset({"error", "critical"})
+
+
 def has_critical_diagnostics(diagnostics: List[BrimleyDiagnostic]) -> bool:
     """Returns True when diagnostics include severities that must block domain swap."""
 
-    return any(d.severity in {"error", "critical"} for d in diagnostics)
+    return any(d.severity in _BLOCKING_SEVERITIES for d in diagnostics)
+
+
+# The policy only ever produces these outcomes, so they are built once and shared
+_SWAP_ALLOWED = DomainSwapDecision(can_swap=True)
+_ENTITIES_CRITICAL = DomainSwapDecision(can_swap=False, blocked_reason="entities domain has critical diagnostics")
+_FUNCTIONS_UPSTREAM_BLOCKED = DomainSwapDecision(
+    can_swap=False,
+    blocked_reason="functions depend on successful entities domain",
+)
+_FUNCTIONS_CRITICAL = DomainSwapDecision(can_swap=False, blocked_reason="functions domain has critical diagnostics")
+_MCP_TOOLS_UPSTREAM_BLOCKED = DomainSwapDecision(
+    can_swap=False,
+    blocked_reason="mcp_tools depend on successful functions domain",
+)
+_MCP_TOOLS_CRITICAL = DomainSwapDecision(can_swap=False, blocked_reason="mcp_tools domain has critical diagnostics")
+_EMPTY_DOMAIN_INPUT = DomainReloadInput()
 
 
 def evaluate_domain_swap_policy(
@@ -131,46 +150,52 @@ def evaluate_domain_swap_policy(
       and dependencies are satisfied.
     """
 
-    decisions: Dict[ReloadDomain, DomainSwapDecision] = {}
+    # Enum member access goes through EnumType attribute lookup; resolve each domain once
+    entities = ReloadDomain.ENTITIES
+    functions = ReloadDomain.FUNCTIONS
+    mcp_tools = ReloadDomain.MCP_TOOLS
 
-    entities_input = domain_inputs.get(ReloadDomain.ENTITIES, DomainReloadInput())
+    entities_input = domain_inputs.get(entities, _EMPTY_DOMAIN_INPUT)
     if has_critical_diagnostics(entities_input.diagnostics):
-        decisions[ReloadDomain.ENTITIES] = DomainSwapDecision(
-            can_swap=False,
-            blocked_reason="entities domain has critical diagnostics",
-        )
+        entities_decision = _ENTITIES_CRITICAL
     else:
-        decisions[ReloadDomain.ENTITIES] = DomainSwapDecision(can_swap=True)
+        entities_decision = _SWAP_ALLOWED
 
-    functions_input = domain_inputs.get(ReloadDomain.FUNCTIONS, DomainReloadInput())
-    if not decisions[ReloadDomain.ENTITIES].can_swap:
-        decisions[ReloadDomain.FUNCTIONS] = DomainSwapDecision(
-            can_swap=False,
-            blocked_reason="functions depend on successful entities domain",
-        )
+    functions_input = domain_inputs.get(functions, _EMPTY_DOMAIN_INPUT)
+    if not entities_decision.can_swap:
+        functions_decision = _FUNCTIONS_UPSTREAM_BLOCKED
     elif has_critical_diagnostics(functions_input.diagnostics):
-        decisions[ReloadDomain.FUNCTIONS] = DomainSwapDecision(
-            can_swap=False,
-            blocked_reason="functions domain has critical diagnostics",
-        )
+        functions_decision = _FUNCTIONS_CRITICAL
     else:
-        decisions[ReloadDomain.FUNCTIONS] = DomainSwapDecision(can_swap=True)
+        functions_decision = _SWAP_ALLOWED
 
-    mcp_input = domain_inputs.get(ReloadDomain.MCP_TOOLS, DomainReloadInput())
-    if not decisions[ReloadDomain.FUNCTIONS].can_swap:
-        decisions[ReloadDomain.MCP_TOOLS] = DomainSwapDecision(
-            can_swap=False,
-            blocked_reason="mcp_tools depend on successful functions domain",
-        )
+    mcp_input = domain_inputs.get(mcp_tools, _EMPTY_DOMAIN_INPUT)
+    if not functions_decision.can_swap:
+        mcp_decision = _MCP_TOOLS_UPSTREAM_BLOCKED
     elif has_critical_diagnostics(mcp_input.diagnostics):
-        decisions[ReloadDomain.MCP_TOOLS] = DomainSwapDecision(
-            can_swap=False,
-            blocked_reason="mcp_tools domain has critical diagnostics",
-        )
+        mcp_decision = _MCP_TOOLS_CRITICAL
     else:
-        decisions[ReloadDomain.MCP_TOOLS] = DomainSwapDecision(can_swap=True)
+        mcp_decision = _SWAP_ALLOWED
 
-    return decisions
+    return {
+        entities: entities_decision,
+        functions: functions_decision,
+        mcp_tools: mcp_decision,
+    }
+
+
+# (current state, event) -> next state; STOP is valid from any state and handled separately
+_WATCHER_TRANSITIONS: Dict[Tuple[WatcherState, WatcherEvent], WatcherState] = {
+    (WatcherState.STOPPED, WatcherEvent.START): WatcherState.WATCHING,
+    (WatcherState.WATCHING, WatcherEvent.FILE_CHANGE): WatcherState.CHANGE_DETECTED,
+    (WatcherState.CHANGE_DETECTED, WatcherEvent.DEBOUNCE_WINDOW_OPEN): WatcherState.DEBOUNCING,
+    (WatcherState.DEBOUNCING, WatcherEvent.FILE_CHANGE): WatcherState.CHANGE_DETECTED,
+    (WatcherState.DEBOUNCING, WatcherEvent.DEBOUNCE_ELAPSED): WatcherState.RELOADING,
+    (WatcherState.RELOADING, WatcherEvent.RELOAD_SUCCESS): WatcherState.WATCHING,
+    (WatcherState.RELOADING, WatcherEvent.RELOAD_FAILURE): WatcherState.WATCHING,
+}
+
+_WATCHER_STATES = frozenset(WatcherState)
 
 
 def transition_watcher_state(current: WatcherState, event: WatcherEvent) -> WatcherState:
@@ -183,31 +208,10 @@ def transition_watcher_state(current: WatcherState, event: WatcherEvent) -> Watc
     if event == WatcherEvent.STOP:
         return WatcherState.STOPPED
 
-    if current == WatcherState.STOPPED:
-        if event == WatcherEvent.START:
-            return WatcherState.WATCHING
-        raise ValueError(f"Invalid watcher transition: {current} -> {event}")
-
-    if current == WatcherState.WATCHING:
-        if event == WatcherEvent.FILE_CHANGE:
-            return WatcherState.CHANGE_DETECTED
-        raise ValueError(f"Invalid watcher transition: {current} -> {event}")
-
-    if current == WatcherState.CHANGE_DETECTED:
-        if event == WatcherEvent.DEBOUNCE_WINDOW_OPEN:
-            return WatcherState.DEBOUNCING
-        raise ValueError(f"Invalid watcher transition: {current} -> {event}")
-
-    if current == WatcherState.DEBOUNCING:
-        if event == WatcherEvent.FILE_CHANGE:
-            return WatcherState.CHANGE_DETECTED
-        if event == WatcherEvent.DEBOUNCE_ELAPSED:
-            return WatcherState.RELOADING
-        raise ValueError(f"Invalid watcher transition: {current} -> {event}")
-
-    if current == WatcherState.RELOADING:
-        if event in {WatcherEvent.RELOAD_SUCCESS, WatcherEvent.RELOAD_FAILURE}:
-            return WatcherState.WATCHING
-        raise ValueError(f"Invalid watcher transition: {current} -> {event}")
-
-    raise ValueError(f"Unknown watcher state: {current}")
+    next_state = _WATCHER_TRANSITIONS.get((current, event))
+    if next_state is not None:
+        return next_state
+
+    if current not in _WATCHER_STATES:
+        raise ValueError(f"Unknown watcher state: {current}")
+    raise ValueError(f"Invalid watcher transition: {current} -> {event}")
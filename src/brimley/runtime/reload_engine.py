@@ -1,29 +1,207 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
-from dataclasses import dataclass
+import ast
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, replace
+from graphlib import CycleError, TopologicalSorter
 import importlib
 import linecache
+import os
 from pathlib import Path
 import sys
-from typing import Dict, List
+import time
+from types import MappingProxyType, ModuleType
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Set, Tuple
 
 from brimley.core.context import BrimleyContext
 from brimley.core.entity import Entity
 from brimley.core.models import BrimleyFunction
 from brimley.core.registry import Registry
 from brimley.discovery.scanner import BrimleyScanResult
+from brimley.execution.python_runner import invalidate_module_index
+from brimley.runtime.constants import RACY_WINDOW_NS
 from brimley.runtime.reload_contracts import (
-    RELOAD_DOMAIN_ORDER,
     DomainReloadInput,
     ReloadDomain,
     ReloadSummary,
     evaluate_domain_swap_policy,
-    has_critical_diagnostics,
 )
 from brimley.utils.diagnostics import BrimleyDiagnostic
 
 
+# (st_mtime_ns, st_size) of a module's source file
+_SourceStamp = Tuple[int, int]
+
+_INSTALLED_PACKAGE_DIRS = frozenset({"site-packages", "dist-packages"})
+
+# Canonical id prefix of functions (see brimley.core.naming.build_canonical_id)
+_FUNCTION_ID_PREFIX = "function:"
+
+# Upper bound on threads reloading independent modules of one dependency layer
+_MAX_RELOAD_WORKERS = 8
+
+# context.app settings that may point at a directory handler modules import from
+_IMPORT_ROOT_KEYS = ("root_dir", "project_root", "root", "scan_root")
+
+# Diagnostics from files with these suffixes belong to the entities domain
+_ENTITY_SUFFIXES = frozenset({".yaml", ".yml"})
+
+
+def _module_source_stamp(module: ModuleType) -> _SourceStamp | None:
+    source = getattr(module, "__file__", None)
+    if not isinstance(source, str):
+        return None
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _parse_imports(module_name: str, source: str) -> FrozenSet[str]:
+    """Absolute names of every module an `import` / `from ... import` in `source` could refer to."""
+    try:
+        with open(source, "rb") as handle:
+            tree = ast.parse(handle.read(), filename=source)
+    except (OSError, SyntaxError, ValueError):
+        return frozenset()
+
+    is_package = os.path.basename(source) == "__init__.py"
+    package_parts = module_name.split(".") if is_package else module_name.split(".")[:-1]
+    imported: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imported.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if node.level - 1 > len(package_parts):
+                    continue
+                base_parts = package_parts[: len(package_parts) - (node.level - 1)]
+                if node.module:
+                    base_parts = [*base_parts, node.module]
+                base = ".".join(base_parts)
+            else:
+                base = node.module or ""
+            if not base:
+                continue
+            imported.add(base)
+            # `from pkg import mod` may name a submodule rather than an attribute
+            imported.update(f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
+    return frozenset(imported)
+
+
+class _ModuleDependencyGraph:
+    """Import edges between project modules, parsed from source with `ast`.
+
+    Parsed imports are cached per source file and reused while its stamp is unchanged, so only
+    edited files are re-parsed between reload cycles.
+    """
+
+    def __init__(self) -> None:
+        self._imports: Dict[str, Tuple[_SourceStamp, FrozenSet[str]]] = {}
+
+    def dependencies(self, sources: Dict[str, Tuple[str, _SourceStamp]]) -> Dict[str, Set[str]]:
+        """Map each module in `sources` (name -> (file, stamp)) to the modules in `sources` it imports."""
+        parsed: Dict[str, Tuple[_SourceStamp, FrozenSet[str]]] = {}
+        dependencies: Dict[str, Set[str]] = {}
+        for module_name, (source, stamp) in sources.items():
+            cached = self._imports.get(source)
+            if cached is None or cached[0] != stamp:
+                cached = (stamp, _parse_imports(module_name, source))
+            parsed[source] = cached
+            dependencies[module_name] = {name for name in cached[1] if name in sources and name != module_name}
+
+        # Files no longer backing a loaded module drop out of the cache
+        self._imports = parsed
+        return dependencies
+
+
+def _dependents_closure(changed: Iterable[str], dependencies: Dict[str, Set[str]]) -> Set[str]:
+    """`changed` plus every module that transitively imports one of them."""
+    dependents: Dict[str, List[str]] = {}
+    for module_name, imports in dependencies.items():
+        for imported in imports:
+            dependents.setdefault(imported, []).append(module_name)
+
+    closure = set(changed)
+    pending = list(closure)
+    while pending:
+        for dependent in dependents.get(pending.pop(), ()):
+            if dependent not in closure:
+                closure.add(dependent)
+                pending.append(dependent)
+    return closure
+
+
+def _topological_layers(modules: Set[str], dependencies: Dict[str, Set[str]]) -> List[List[str]]:
+    """Group `modules` into layers, each importing only modules from earlier layers.
+
+    Modules within a layer are independent of each other. Import cycles fall back to one module
+    per layer in name order.
+    """
+    sorter: TopologicalSorter[str] = TopologicalSorter()
+    for module_name in sorted(modules):
+        sorter.add(module_name, *sorted(dependencies.get(module_name, set()) & modules))
+    try:
+        sorter.prepare()
+    except CycleError:
+        return [[module_name] for module_name in sorted(modules)]
+
+    layers: List[List[str]] = []
+    while sorter.is_active():
+        layer = sorted(sorter.get_ready())
+        sorter.done(*layer)
+        layers.append(layer)
+    return layers
+
+
+def _topological_order(modules: Set[str], dependencies: Dict[str, Set[str]]) -> List[str]:
+    """Order `modules` so each follows the modules it imports; import cycles fall back to name order."""
+    return [module_name for layer in _topological_layers(modules, dependencies) for module_name in layer]
+
+
+def _unchanged_prior(previous: Registry[BrimleyFunction], function: BrimleyFunction) -> BrimleyFunction:
+    """The registered object from `previous` when it has exactly `function`'s definition, else `function`."""
+    try:
+        prior = previous.get(function.name)
+    except KeyError:
+        # New, or quarantined after a failed reload: take the fresh definition
+        return function
+    # Field values only: private compiled caches on the prior object must not defeat the match
+    if type(prior) is type(function) and prior.__dict__ == function.__dict__:
+        return prior
+    return function
+
+
+def _module_reload_diagnostic(module: ModuleType, error: Exception) -> BrimleyDiagnostic:
+    return BrimleyDiagnostic(
+        file_path=getattr(module, "__file__", None) or module.__name__,
+        error_code="ERR_MODULE_RELOAD",
+        severity="warning",
+        message=f"Module '{module.__name__}' failed to reload and keeps its previous code: {error!r}",
+        suggestion="Fix the module's top-level code, or use @function(reload=False) for its handlers.",
+    )
+
+
+def _domain_order(graph: Mapping[ReloadDomain, Iterable[ReloadDomain]]) -> Tuple[ReloadDomain, ...]:
+    sorter: TopologicalSorter[ReloadDomain] = TopologicalSorter()
+    for domain, upstream in graph.items():
+        sorter.add(domain, *upstream)
+    return tuple(sorter.static_order())
+
+
+# Reload domain -> domains it depends on
+_DEPENDENCY_GRAPH: Mapping[ReloadDomain, Tuple[ReloadDomain, ...]] = MappingProxyType(
+    {
+        ReloadDomain.ENTITIES: (),
+        ReloadDomain.FUNCTIONS: (ReloadDomain.ENTITIES,),
+        ReloadDomain.MCP_TOOLS: (ReloadDomain.FUNCTIONS,),
+    }
+)
+_RELOAD_ORDER = _domain_order(_DEPENDENCY_GRAPH)
+
+
 @dataclass(frozen=True)
 class ReloadPartitions:
     """Partitioned discovery artifacts for one reload cycle."""
@@ -47,42 +225,50 @@ class PartitionedReloadEngine:
 
     BUILTIN_ENTITY_NAMES = ("ContentBlock", "PromptMessage")
 
+    def __init__(self) -> None:
+        # Module name -> (source stamp, trusted) as of its last reload or first sighting
+        self._module_stamps: Dict[str, Tuple[_SourceStamp, bool]] = {}
+        # Wall-clock start of the previous rehydration cycle, to judge helpers first seen since then
+        self._last_cycle_started_ns: int | None = None
+        # Modules that failed to reload during the latest rehydration cycle (they keep their old code)
+        self._module_reload_diagnostics: List[BrimleyDiagnostic] = []
+        self._module_graph = _ModuleDependencyGraph()
+        # Domains in dependency order, each paired with the step that swaps it in. The built-in
+        # graph is static, so its order is shared; subclasses overriding the graph get their own
+        if type(self).dependency_graph is PartitionedReloadEngine.dependency_graph:
+            self._ordered_domains: Tuple[ReloadDomain, ...] = _RELOAD_ORDER
+        else:
+            self._ordered_domains = _domain_order(self.dependency_graph())
+        self._domain_apply: Dict[ReloadDomain, Callable[[BrimleyContext, ReloadPartitions], None]] = {
+            ReloadDomain.ENTITIES: self._apply_entities_domain,
+            ReloadDomain.FUNCTIONS: self._apply_functions_domain,
+            ReloadDomain.MCP_TOOLS: self._apply_mcp_tools_domain,
+        }
+        # (raw root setting values, resolved import roots); only kept while every configured root exists
+        self._import_roots_cache: Tuple[Tuple[object, ...], List[str]] | None = None
+
     def dependency_graph(self) -> Dict[ReloadDomain, List[ReloadDomain]]:
         """Return dependency graph for reload domains."""
 
-        return {
-            ReloadDomain.ENTITIES: [],
-            ReloadDomain.FUNCTIONS: [ReloadDomain.ENTITIES],
-            ReloadDomain.MCP_TOOLS: [ReloadDomain.FUNCTIONS],
-        }
+        return {domain: list(upstream) for domain, upstream in _DEPENDENCY_GRAPH.items()}
 
     def partition_scan_result(self, scan_result: BrimleyScanResult) -> ReloadPartitions:
         """Partition scan output into entities, functions, and MCP tool domains."""
 
-        mcp_tools = [
-            func
-            for func in scan_result.functions
-            if getattr(getattr(func, "mcp", None), "type", None) == "tool"
-        ]
+        functions = list(scan_result.functions)
+        # `mcp is not None` is BrimleyFunction.is_mcp_tool, inlined to skip a property call per function
         return ReloadPartitions(
             entities=list(scan_result.entities),
-            functions=list(scan_result.functions),
-            mcp_tools=mcp_tools,
+            functions=functions,
+            mcp_tools=[func for func in functions if func.mcp is not None],
         )
 
     def apply_successful_reload(self, context: BrimleyContext, partitions: ReloadPartitions) -> ReloadSummary:
         """Apply reload swaps in dependency order for a successful cycle."""
 
-        for domain in RELOAD_DOMAIN_ORDER:
-            if domain == ReloadDomain.ENTITIES:
-                context.entities = self._build_entities_registry(context, partitions.entities)
-            elif domain == ReloadDomain.FUNCTIONS:
-                self._rehydrate_python_modules(context, partitions.functions)
-                context.functions = self._build_functions_registry(partitions.functions)
-            elif domain == ReloadDomain.MCP_TOOLS:
-                # Phase 1 pipeline: tool domain is derived and summarized here.
-                # Actual MCP refresh orchestration is implemented in a later phase.
-                pass
+        domain_apply = self._domain_apply
+        for domain in self._ordered_domains:
+            domain_apply[domain](context, partitions)
 
         return ReloadSummary(
             entities=len(context.entities),
@@ -90,9 +276,23 @@ class PartitionedReloadEngine:
             tools=len(partitions.mcp_tools),
         )
 
+    def _apply_entities_domain(self, context: BrimleyContext, partitions: ReloadPartitions) -> None:
+        context.entities = self._build_entities_registry(context, partitions.entities)
+
+    def _apply_functions_domain(self, context: BrimleyContext, partitions: ReloadPartitions) -> None:
+        self._rehydrate_python_modules(context, partitions.functions)
+        context.functions = self._build_functions_registry(partitions.functions, context.functions)
+
+    def _apply_mcp_tools_domain(self, context: BrimleyContext, partitions: ReloadPartitions) -> None:
+        # Phase 1 pipeline: tool domain is derived and summarized here.
+        # Actual MCP refresh orchestration is implemented in a later phase.
+        return None
+
     def apply_reload_with_policy(self, context: BrimleyContext, scan_result: BrimleyScanResult) -> ReloadApplicationResult:
         """Apply partitioned reload with domain-specific swap/rollback decisions."""
 
+        # Handler modules may have moved or appeared; runners rebuild their file index lazily
+        invalidate_module_index()
         partitions = self.partition_scan_result(scan_result)
         diagnostics_by_domain = self._classify_diagnostics(scan_result.diagnostics)
 
@@ -107,16 +307,18 @@ class PartitionedReloadEngine:
         if decisions[ReloadDomain.ENTITIES].can_swap:
             context.entities = self._build_entities_registry(context, partitions.entities)
 
-        functions_has_critical = has_critical_diagnostics(diagnostics_by_domain[ReloadDomain.FUNCTIONS])
+        # With entities swappable, the policy only blocks functions for their own critical
+        # diagnostics, so the decisions already answer that without rescanning the list
         function_partial_swap = (
             not decisions[ReloadDomain.FUNCTIONS].can_swap
             and decisions[ReloadDomain.ENTITIES].can_swap
-            and functions_has_critical
         )
 
+        module_reload_diagnostics: List[BrimleyDiagnostic] = []
         if decisions[ReloadDomain.FUNCTIONS].can_swap or function_partial_swap:
             self._rehydrate_python_modules(context, partitions.functions)
-            next_functions = self._build_functions_registry(partitions.functions)
+            module_reload_diagnostics = self._module_reload_diagnostics
+            next_functions = self._build_functions_registry(partitions.functions, context.functions)
             if function_partial_swap:
                 for name, reason in self._quarantined_function_reasons(
                     context,
@@ -136,9 +338,12 @@ class PartitionedReloadEngine:
         blocked_domains = [domain for domain, decision in decisions.items() if not decision.can_swap]
 
         labeled_diagnostics: List[BrimleyDiagnostic] = []
-        for domain in RELOAD_DOMAIN_ORDER:
-            labeled_diagnostics.extend(self._label_domain_diagnostics(domain, diagnostics_by_domain[domain]))
-            if not decisions[domain].can_swap and not diagnostics_by_domain[domain]:
+        for domain in self._ordered_domains:
+            domain_diagnostics = diagnostics_by_domain[domain]
+            labeled_diagnostics.extend(self._label_domain_diagnostics(domain, domain_diagnostics))
+            if domain is ReloadDomain.FUNCTIONS:
+                labeled_diagnostics.extend(self._label_domain_diagnostics(domain, module_reload_diagnostics))
+            if not decisions[domain].can_swap and not domain_diagnostics:
                 labeled_diagnostics.append(
                     BrimleyDiagnostic(
                         file_path="<runtime>",
@@ -170,15 +375,34 @@ class PartitionedReloadEngine:
         next_entities.register_all(entities)
         return next_entities
 
-    def _build_functions_registry(self, functions: List[BrimleyFunction]) -> Registry[BrimleyFunction]:
+    def _build_functions_registry(
+        self,
+        functions: List[BrimleyFunction],
+        previous: Registry[BrimleyFunction] | None = None,
+    ) -> Registry[BrimleyFunction]:
+        """Build the next function registry, keeping `previous` objects for unchanged definitions.
+
+        A rescan parses every file into fresh objects; carrying over an identical previous object
+        keeps its compiled SQL statement or template across reloads. Return plans are still
+        rebuilt, since they are bound to the entity registry that every cycle replaces.
+        """
         next_functions: Registry[BrimleyFunction] = Registry()
+        if previous is not None and len(previous):
+            functions = [_unchanged_prior(previous, function) for function in functions]
         next_functions.register_all(functions)
         return next_functions
 
     def _rehydrate_python_modules(self, context: BrimleyContext, functions: List[BrimleyFunction]) -> None:
-        """Reload discovered Python modules for reload-enabled handlers."""
+        """Reload changed Python modules for reload-enabled handlers, dependencies first.
+
+        Handler modules and the project modules they import form a dependency graph. Each cycle
+        only modules whose source changed since the last cycle, plus every module that
+        (transitively) imports one of them, are reloaded, in topological order so a handler
+        re-executes against already-reloaded helpers.
+        """
         module_reload_policy: Dict[str, bool] = {}
         import_roots = self._collect_import_roots(context)
+        self._module_reload_diagnostics = []
 
         for function in functions:
             if getattr(function, "type", None) != "python_function":
@@ -192,110 +416,246 @@ class PartitionedReloadEngine:
             should_reload = bool(getattr(function, "reload", True))
             module_reload_policy[module_name] = module_reload_policy.get(module_name, False) or should_reload
 
+        if not any(module_reload_policy.values()):
+            # Nothing is reload-enabled: skip the finder-cache walk and the linecache sweep
+            return
+
+        cycle_started_ns = time.time_ns()
         importlib.invalidate_caches()
+        reloaded = False
 
-        for module_name, should_reload in module_reload_policy.items():
-            if not should_reload:
-                continue
+        # sys.path is patched once for the whole cycle: imports, helper discovery and reloads
+        with self._temporary_sys_path(import_roots) if import_roots else nullcontext():
+            modules: Dict[str, ModuleType] = {}
+            for module_name, should_reload in module_reload_policy.items():
+                if not should_reload:
+                    continue
+                try:
+                    modules[module_name] = importlib.import_module(module_name)
+                except Exception:
+                    continue
 
-            try:
-                if import_roots:
-                    with self._temporary_sys_path(import_roots):
-                        module = importlib.import_module(module_name)
-                        self._remove_cached_bytecode(module)
-                        importlib.reload(module)
-                else:
-                    module = importlib.import_module(module_name)
-                    self._remove_cached_bytecode(module)
-                    importlib.reload(module)
-            except Exception:
-                continue
+            # Helpers are only tracked for dependency edges; reload-disabled handlers are never reloaded
+            helpers = {
+                name: module
+                for name, module in self._loaded_project_modules(import_roots).items()
+                if name not in module_reload_policy
+            }
+            modules.update(helpers)
+
+            stamps = {name: _module_source_stamp(module) for name, module in modules.items()}
+            changed = {
+                name
+                for name, stamp in stamps.items()
+                if self._source_changed(name, stamp, baseline_only=name in helpers)
+            }
+
+            if changed:
+                sources = {
+                    name: (module.__file__, stamp)
+                    for name, module in modules.items()
+                    if (stamp := stamps[name]) is not None
+                }
+                dependencies = self._module_graph.dependencies(sources)
+                for layer in _topological_layers(_dependents_closure(changed, dependencies), dependencies):
+                    layer_modules = [modules[module_name] for module_name in layer]
+                    if len(layer) == 1:
+                        errors = [self._reload_module(layer_modules[0])]
+                    else:
+                        # Modules in one layer never import each other; overlap their source reads
+                        # and bytecode writes. sys.path is already patched for the whole cycle.
+                        with ThreadPoolExecutor(max_workers=min(_MAX_RELOAD_WORKERS, len(layer))) as executor:
+                            errors = list(executor.map(self._reload_module, layer_modules))
+                        # Top-level code may need the calling thread (signal handlers, some event
+                        # loop or GUI setup): retry failures serially here before reporting them
+                        errors = [
+                            self._reload_module(module) if error is not None else None
+                            for module, error in zip(layer_modules, errors)
+                        ]
+
+                    for module_name, module, error in zip(layer, layer_modules, errors):
+                        if error is not None:
+                            self._module_reload_diagnostics.append(_module_reload_diagnostic(module, error))
+                            continue
+                        reloaded = True
+                        # Record the stamp taken before the reload: one stat per module per cycle, and a
+                        # write landing mid-reload still differs from it on the next cycle
+                        self._record_source_stamp(module_name, stamps[module_name])
+
+        self._last_cycle_started_ns = cycle_started_ns
+        if reloaded:
+            linecache.checkcache()
+
+    def _reload_module(self, module: ModuleType) -> Exception | None:
+        """Reload one module from source; returns the exception when it failed to import."""
+        try:
+            self._remove_cached_bytecode(module)
+            importlib.reload(module)
+        except Exception as exc:
+            return exc
+        return None
+
+    def _source_changed(self, module_name: str, stamp: _SourceStamp | None, baseline_only: bool) -> bool:
+        """Whether a module's source differs from the stamp recorded at its last reload.
+
+        Modules without a readable source always count as changed. Unseen helper modules
+        (`baseline_only`) record a baseline; they count as changed only when their source was
+        modified after the previous cycle started, since a helper imported lazily in between may
+        have been edited after it was loaded.
+        """
+        if stamp is None:
+            return True
+
+        recorded = self._module_stamps.get(module_name)
+        if recorded is None:
+            if not baseline_only:
+                return True
+            self._record_source_stamp(module_name, stamp)
+            previous_cycle_ns = self._last_cycle_started_ns
+            # Coarse filesystem timestamps can land slightly before the edit; err towards reloading
+            return previous_cycle_ns is not None and stamp[0] >= previous_cycle_ns - RACY_WINDOW_NS
+
+        recorded_stamp, trusted = recorded
+        return not trusted or recorded_stamp != stamp
+
+    def _record_source_stamp(self, module_name: str, stamp: _SourceStamp | None) -> None:
+        if stamp is None:
+            self._module_stamps.pop(module_name, None)
+            return
+        # A source modified this recently may change again within the same timestamp tick
+        trusted = stamp[0] < time.time_ns() - RACY_WINDOW_NS
+        self._module_stamps[module_name] = (stamp, trusted)
+
+    def project_module_sources(self, context: BrimleyContext) -> List[str]:
+        """Source files of the loaded project modules (handlers and the helpers they import).
+
+        Any of these changing can make a reload cycle rehydrate modules, so hosts that skip
+        unchanged cycles must take them into account.
+        """
+        modules = self._loaded_project_modules(self._collect_import_roots(context))
+        return sorted({module.__file__ for module in modules.values()})
+
+    def _loaded_project_modules(self, import_roots: List[str]) -> Dict[str, ModuleType]:
+        """Return already-imported pure-Python modules whose source lives under an import root."""
+        if not import_roots:
+            return {}
 
-        linecache.checkcache()
+        prefixes = tuple(os.path.join(root, "") for root in import_roots)
+        project_modules: Dict[str, ModuleType] = {}
+        for name, module in list(sys.modules.items()):
+            source = getattr(module, "__file__", None)
+            if (
+                not isinstance(source, str)
+                or not source.endswith(".py")
+                or not source.startswith(prefixes)
+                or name == "__main__"
+                or getattr(module, "__spec__", None) is None
+            ):
+                continue
+            # Virtualenvs often live inside the project root; installed packages are not project code
+            if _INSTALLED_PACKAGE_DIRS.intersection(source.split(os.sep)):
+                continue
+            project_modules[name] = module
+        return project_modules
 
     def _remove_cached_bytecode(self, module: object) -> None:
         cached_path = getattr(module, "__cached__", None)
         if not isinstance(cached_path, str):
             return
 
+        # unlink reports a missing file itself; checking exists() first would add a stat per module
         try:
-            cached_file = Path(cached_path)
-            if cached_file.exists():
-                cached_file.unlink()
-        except Exception:
+            os.unlink(cached_path)
+        except OSError:
             return
 
     def _collect_import_roots(self, context: BrimleyContext) -> List[str]:
-        roots: List[str] = []
         if not isinstance(context.app, dict):
-            return roots
+            return []
+
+        raw_values = tuple(context.app.get(key) for key in _IMPORT_ROOT_KEYS)
+        cached = self._import_roots_cache
+        if cached is not None and cached[0] == raw_values:
+            return list(cached[1])
 
-        for key in ("root_dir", "project_root", "root", "scan_root"):
-            value = context.app.get(key)
+        # Insertion-ordered set: several settings commonly point at the same directory
+        unique_roots: Dict[str, None] = {}
+        all_exist = True
+        for value in raw_values:
             if value is None:
                 continue
             path = Path(value).expanduser().resolve()
-            path_str = str(path)
-            if path.exists() and path_str not in roots:
-                roots.append(path_str)
+            if path.exists():
+                unique_roots[str(path)] = None
+            else:
+                all_exist = False
+        roots = list(unique_roots)
 
-        return roots
+        # The settings rarely change between cycles; a missing root is re-resolved until it appears
+        self._import_roots_cache = (raw_values, roots) if all_exist else None
+        return list(roots)
 
     @contextmanager
     def _temporary_sys_path(self, roots: List[str]):
-        inserted: List[str] = []
-        for root in reversed(roots):
-            if root not in sys.path:
-                sys.path.insert(0, root)
-                inserted.append(root)
+        existing = set(sys.path)
+        inserted = [root for root in roots if root not in existing]
+        if not inserted:
+            yield
+            return
 
+        # One slice insert and, normally, one slice delete instead of a list shift per root
+        sys.path[:0] = inserted
         try:
             yield
         finally:
-            for root in inserted:
-                try:
-                    sys.path.remove(root)
-                except ValueError:
-                    continue
+            count = len(inserted)
+            if sys.path[:count] == inserted:
+                del sys.path[:count]
+            else:
+                # Imported code reordered sys.path; remove just our entries and keep its changes
+                for root in inserted:
+                    try:
+                        sys.path.remove(root)
+                    except ValueError:
+                        continue
 
     def _count_current_tools(self, context: BrimleyContext) -> int:
-        return sum(1 for func in context.functions if getattr(getattr(func, "mcp", None), "type", None) == "tool")
+        return sum(func.mcp is not None for func in context.functions)
 
     def _classify_diagnostics(
         self, diagnostics: List[BrimleyDiagnostic]
     ) -> Dict[ReloadDomain, List[BrimleyDiagnostic]]:
-        by_domain: Dict[ReloadDomain, List[BrimleyDiagnostic]] = {
-            ReloadDomain.ENTITIES: [],
-            ReloadDomain.FUNCTIONS: [],
-            ReloadDomain.MCP_TOOLS: [],
-        }
+        entity_diagnostics: List[BrimleyDiagnostic] = []
+        function_diagnostics: List[BrimleyDiagnostic] = []
+        # Same rule as _domain_for_path, inlined with bound locals since it runs per diagnostic
+        append_entity = entity_diagnostics.append
+        append_function = function_diagnostics.append
+        splitext = os.path.splitext
 
         for diag in diagnostics:
-            domain = self._domain_for_path(diag.file_path)
-            by_domain[domain].append(diag)
+            if splitext(diag.file_path)[1].lower() in _ENTITY_SUFFIXES:
+                append_entity(diag)
+            else:
+                append_function(diag)
 
-        return by_domain
+        return {
+            ReloadDomain.ENTITIES: entity_diagnostics,
+            ReloadDomain.FUNCTIONS: function_diagnostics,
+            ReloadDomain.MCP_TOOLS: [],
+        }
 
     def _domain_for_path(self, file_path: str) -> ReloadDomain:
-        suffix = Path(file_path).suffix.lower()
-        if suffix in {".yaml", ".yml"}:
+        # splitext matches Path.suffix (dotfiles have no suffix) without building a Path
+        if os.path.splitext(file_path)[1].lower() in _ENTITY_SUFFIXES:
             return ReloadDomain.ENTITIES
         return ReloadDomain.FUNCTIONS
 
     def _label_domain_diagnostics(
         self, domain: ReloadDomain, diagnostics: List[BrimleyDiagnostic]
-    ) -> List[BrimleyDiagnostic]:
-        return [
-            BrimleyDiagnostic(
-                file_path=diag.file_path,
-                error_code=diag.error_code,
-                severity=diag.severity,
-                message=f"[{domain.value}] {diag.message}",
-                suggestion=diag.suggestion,
-                line_number=diag.line_number,
-            )
-            for diag in diagnostics
-        ]
+    ) -> Iterator[BrimleyDiagnostic]:
+        # Lazy so callers extend their own list without an intermediate one per domain
+        prefix = f"[{domain.value}] "
+        return (replace(diag, message=prefix + diag.message) for diag in diagnostics)
 
     def _quarantined_function_reasons(
         self,
@@ -309,15 +669,17 @@ class PartitionedReloadEngine:
 
         quarantined: Dict[str, str] = {}
         for function in context.functions:
-            canonical_id = getattr(function, "canonical_id", None)
-            if not isinstance(canonical_id, str) or not canonical_id.startswith("function:"):
+            # Functions that survived into the next registry are never quarantined; check that first
+            if function.name in next_functions:
                 continue
 
-            _, function_path, _ = canonical_id.split(":", 2)
-            if function_path.lower() not in relative_diag_paths:
+            canonical_id = getattr(function, "canonical_id", None)
+            if not isinstance(canonical_id, str) or not canonical_id.startswith(_FUNCTION_ID_PREFIX):
                 continue
 
-            if function.name in next_functions:
+            # <kind>:<path>:<symbol>; an id without a symbol part is malformed and names no file
+            function_path, separator, _ = canonical_id[len(_FUNCTION_ID_PREFIX):].partition(":")
+            if not separator or function_path.lower() not in relative_diag_paths:
                 continue
 
             quarantined[function.name] = "changed object failed validation during reload"
@@ -336,14 +698,21 @@ class PartitionedReloadEngine:
         if not isinstance(root_dir_value, str):
             return set()
 
-        root_path = Path(root_dir_value).expanduser().resolve()
+        root_path = os.path.realpath(os.path.expanduser(root_dir_value))
+        root_prefix = os.path.join(root_path, "")
         relative_paths: set[str] = set()
-        for diag in diagnostics:
+        # Many diagnostics usually point at a few files; resolve each distinct path once
+        for file_path in {diag.file_path for diag in diagnostics}:
             try:
-                diag_path = Path(diag.file_path).expanduser().resolve()
-                relative = diag_path.relative_to(root_path).as_posix().lower()
-                relative_paths.add(relative)
-            except Exception:
+                diag_path = os.path.realpath(os.path.expanduser(file_path))
+            except (OSError, TypeError, ValueError):
+                continue
+            if not diag_path.startswith(root_prefix):
+                # Outside the root (or the root itself), so there is no project-relative path
                 continue
+            relative = diag_path[len(root_prefix):]
+            if os.sep != "/":
+                relative = relative.replace(os.sep, "/")
+            relative_paths.add(relative.lower())
 
         return relative_paths
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import io
-import json
 import socket
 import socketserver
 import threading
@@ -32,44 +31,57 @@ def send_repl_rpc_command(
     command: str,
     timeout_seconds: float = 5.0,
 ) -> ReplRPCResponse:
-    request = ReplRPCRequest(command=command)
-    payload = request.model_dump_json() + "\n"
+    payload = ReplRPCRequest(command=command).model_dump_json().encode("utf-8") + b"\n"
 
     with socket.create_connection((host, port), timeout=timeout_seconds) as sock:
-        sock.sendall(payload.encode("utf-8"))
-        sock_file = sock.makefile("rb")
-        line = sock_file.readline()
+        sock.sendall(payload)
+        line = _recv_line(sock)
 
     if not line:
         return ReplRPCResponse(ok=False, continue_session=True, error="No response from daemon.")
 
     try:
-        response_payload = json.loads(line.decode("utf-8"))
-        return ReplRPCResponse.model_validate(response_payload)
+        # Parse and validate in one pass inside pydantic-core instead of json.loads + model_validate
+        return ReplRPCResponse.model_validate_json(line)
     except Exception as exc:
         return ReplRPCResponse(ok=False, continue_session=True, error=f"Invalid daemon response: {exc}")
 
 
+def _recv_line(sock: socket.socket) -> bytes:
+    """Read one newline-terminated message straight off the socket (one message per connection)."""
+    chunks: list[bytes] = []
+    while True:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        newline = chunk.find(b"\n")
+        if newline != -1:
+            chunks.append(chunk[: newline + 1])
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @dataclass
 class _ReplRPCContext:
     handle: Callable[[str], ReplRPCResponse]
 
 
-class _ReplRPCHandler(socketserver.StreamRequestHandler):
+class _ReplRPCHandler(socketserver.BaseRequestHandler):
+    # Plain request handler: each connection carries a single line, so no buffered file wrappers
     def handle(self) -> None:
         context = self.server.rpc_context
-        line = self.rfile.readline()
+        line = _recv_line(self.request)
         if not line:
             return
 
         try:
-            request_payload = json.loads(line.decode("utf-8"))
-            request = ReplRPCRequest.model_validate(request_payload)
+            request = ReplRPCRequest.model_validate_json(line)
             response = context.handle(request.command)
         except Exception as exc:
             response = ReplRPCResponse(ok=False, continue_session=True, error=str(exc))
 
-        self.wfile.write((response.model_dump_json() + "\n").encode("utf-8"))
+        self.request.sendall(response.model_dump_json().encode("utf-8") + b"\n")
 
 
 class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
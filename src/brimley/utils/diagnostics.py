@@ -1,9 +1,13 @@
-from typing import Optional
-from pydantic import BaseModel
+from dataclasses import dataclass, fields
+from typing import Any, Mapping, Optional
 
-class BrimleyDiagnostic(BaseModel):
+@dataclass(frozen=True, slots=True)
+class BrimleyDiagnostic:
     """
     Standardized error reporting object for discovery and registration issues.
+
+    Built from trusted values in the scanner and reload hot paths, so it is a plain frozen
+    dataclass; use `from_dict` for untrusted payloads. Pydantic models still accept it as a field.
     """
     file_path: str
     error_code: str
@@ -12,12 +16,45 @@ class BrimleyDiagnostic(BaseModel):
     suggestion: Optional[str] = None
     line_number: Optional[int] = None
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "BrimleyDiagnostic":
+        """
+        Build a diagnostic from external input, checking field names and types.
+        """
+        unknown = set(data) - _DIAGNOSTIC_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown diagnostic fields: {', '.join(sorted(unknown))}")
+
+        for name in ("file_path", "error_code", "message"):
+            if not isinstance(data.get(name), str):
+                raise ValueError(f"Diagnostic field '{name}' must be a string.")
+        severity = data.get("severity", "error")
+        if not isinstance(severity, str):
+            raise ValueError("Diagnostic field 'severity' must be a string.")
+        suggestion = data.get("suggestion")
+        if suggestion is not None and not isinstance(suggestion, str):
+            raise ValueError("Diagnostic field 'suggestion' must be a string or null.")
+        line_number = data.get("line_number")
+        if line_number is not None and (isinstance(line_number, bool) or not isinstance(line_number, int)):
+            raise ValueError("Diagnostic field 'line_number' must be an integer or null.")
+
+        return cls(
+            file_path=data["file_path"],
+            error_code=data["error_code"],
+            message=data["message"],
+            severity=severity,
+            suggestion=suggestion,
+            line_number=line_number,
+        )
+
     def __str__(self) -> str:
         loc = f"{self.file_path}"
         if self.line_number:
             loc += f":{self.line_number}"
         return f"[{self.error_code}] {self.message} (at {loc})"
 
+_DIAGNOSTIC_FIELDS = frozenset(f.name for f in fields(BrimleyDiagnostic))
+
 class BrimleyExecutionError(Exception):
     """
     Exception raised during function execution, providing context about 
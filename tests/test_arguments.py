@@ -159,3 +159,17 @@ def test_resolve_from_context_missing_path(context):
     
     with pytest.raises(ValueError, match="Context path 'app.missing.field' not found"):
         ArgumentResolver.resolve(func, {}, context)
+
+
+def test_resolve_returns_already_resolved_arguments_unchanged():
+    func = BrimleyFunction(
+        name="test",
+        type="sql_function",
+        return_shape="void",
+        arguments={"inline": {"count": "int"}},
+    )
+    context = BrimleyContext()
+
+    resolved = ArgumentResolver.resolve(func, {"count": "3"}, context)
+    assert resolved == {"count": 3}
+    assert ArgumentResolver.resolve(func, resolved, context) is resolved
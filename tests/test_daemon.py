@@ -1,5 +1,8 @@
+import json
 import os
 
+import pytest
+
 from brimley.runtime.daemon import (
     DaemonMetadata,
     DaemonState,
@@ -161,3 +164,115 @@ def test_wait_for_daemon_running_returns_running_probe(tmp_path):
     assert probe.state == DaemonState.RUNNING
     assert probe.metadata is not None
     assert probe.metadata.pid == os.getpid()
+
+
+def test_probe_daemon_state_reuses_parsed_metadata_until_file_changes(tmp_path):
+    write_daemon_metadata(
+        tmp_path,
+        DaemonMetadata(pid=os.getpid(), port=8123, started_at="2026-02-25T00:00:00Z"),
+    )
+
+    first = probe_daemon_state(tmp_path)
+    second = probe_daemon_state(tmp_path)
+    assert second.metadata is first.metadata
+
+    write_daemon_metadata(
+        tmp_path,
+        DaemonMetadata(pid=os.getpid(), port=8124, started_at="2026-02-25T00:00:01Z"),
+    )
+    updated = probe_daemon_state(tmp_path)
+    assert updated.metadata is not first.metadata
+    assert updated.metadata.port == 8124
+
+
+def test_write_daemon_metadata_replaces_file_without_leaving_temp_files(tmp_path):
+    metadata_file = write_daemon_metadata(
+        tmp_path,
+        DaemonMetadata(pid=os.getpid(), port=8123, started_at="2026-02-25T00:00:00Z"),
+    )
+    write_daemon_metadata(
+        tmp_path,
+        DaemonMetadata(pid=os.getpid(), port=8124, started_at="2026-02-25T00:00:00Z"),
+    )
+
+    assert [path.name for path in metadata_file.parent.iterdir()] == ["daemon.json"]
+    assert DaemonMetadata.from_dict(json.loads(metadata_file.read_bytes())).port == 8124
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_write_daemon_metadata_mode_ignores_umask(tmp_path):
+    previous_umask = os.umask(0o077)
+    try:
+        metadata_file = write_daemon_metadata(
+            tmp_path,
+            DaemonMetadata(pid=os.getpid(), port=8123, started_at="2026-02-25T00:00:00Z"),
+        )
+    finally:
+        os.umask(previous_umask)
+
+    assert metadata_file.stat().st_mode & 0o777 == 0o644
+
+
+def test_is_process_alive_caches_result_for_short_ttl(monkeypatch):
+    from brimley.runtime import daemon
+
+    calls: list[int] = []
+    clock = {"now": 100.0}
+
+    def fake_kill(pid, signal):
+        calls.append(pid)
+
+    daemon._ALIVE_CACHE.clear()
+    monkeypatch.setattr("brimley.runtime.daemon.os.kill", fake_kill)
+    monkeypatch.setattr("brimley.runtime.daemon.time.monotonic", lambda: clock["now"])
+
+    assert daemon.is_process_alive(4242) is True
+    assert daemon.is_process_alive(4242) is True
+    assert calls == [4242]
+
+    clock["now"] += 1.0
+    assert daemon.is_process_alive(4242) is True
+    assert calls == [4242, 4242]
+    daemon._ALIVE_CACHE.clear()
+
+
+def test_daemon_metadata_from_dict_rejects_malformed_payloads():
+    assert DaemonMetadata.from_dict({"pid": 7, "port": 80, "started_at": "now"}).host == "127.0.0.1"
+
+    for payload in (
+        [],
+        {"pid": "7", "port": 80, "started_at": "now"},
+        {"pid": True, "port": 80, "started_at": "now"},
+        {"pid": 0, "port": 80, "started_at": "now"},
+        {"pid": 7, "port": 70000, "started_at": "now"},
+        {"pid": 7, "port": 80},
+    ):
+        with pytest.raises(ValueError):
+            DaemonMetadata.from_dict(payload)
+
+
+def test_probe_daemon_state_marks_out_of_range_pid_stale(tmp_path):
+    metadata_file = daemon_metadata_path(tmp_path)
+    metadata_file.parent.mkdir(parents=True, exist_ok=True)
+    metadata_file.write_text(json.dumps({"pid": -1, "port": 8123, "started_at": "now"}))
+
+    probe = probe_daemon_state(tmp_path)
+
+    assert probe.state == DaemonState.STALE
+    assert probe.metadata is None
+
+
+def test_lifecycle_cleanup_tolerates_missing_metadata(tmp_path):
+    release_repl_client_slot(tmp_path)
+
+    assert shutdown_daemon_lifecycle(tmp_path) is False
+
+
+def test_read_small_reads_entire_file(tmp_path):
+    from brimley.runtime.daemon import _read_small
+
+    payload = b"x" * 20000
+    path = tmp_path / "payload.json"
+    path.write_bytes(payload)
+
+    assert _read_small(path) == payload
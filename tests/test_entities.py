@@ -76,3 +76,24 @@ def test_brimley_diagnostic_structure():
     str_repr = str(diag)
     assert "ERR_TEST" in str_repr
     assert "/tmp/test.sql" in str_repr
+
+
+def test_brimley_diagnostic_is_frozen_and_slotted():
+    diag = BrimleyDiagnostic(file_path="a.sql", error_code="ERR_TEST", message="bad")
+
+    assert not hasattr(diag, "__dict__")
+    with pytest.raises(AttributeError):
+        diag.message = "changed"
+
+def test_brimley_diagnostic_from_dict_checks_types():
+    diag = BrimleyDiagnostic.from_dict(
+        {"file_path": "a.sql", "error_code": "ERR_TEST", "message": "bad", "line_number": 3}
+    )
+    assert diag == BrimleyDiagnostic(file_path="a.sql", error_code="ERR_TEST", message="bad", line_number=3)
+
+    with pytest.raises(ValueError, match="line_number"):
+        BrimleyDiagnostic.from_dict({"file_path": "a.sql", "error_code": "E", "message": "m", "line_number": "3"})
+    with pytest.raises(ValueError, match="message"):
+        BrimleyDiagnostic.from_dict({"file_path": "a.sql", "error_code": "E"})
+    with pytest.raises(ValueError, match="Unknown diagnostic fields: extra"):
+        BrimleyDiagnostic.from_dict({"file_path": "a.sql", "error_code": "E", "message": "m", "extra": 1})
@@ -86,4 +86,46 @@ def test_jinja_missing_variable(runner, context):
     )
     # Default jinja behavior is non-strict
     result = runner.run(func, {}, context) # missing 'missing' arg
-    assert result == "Hi "
\ No newline at end of file
+    assert result == "Hi "
+
+def test_jinja_static_template_matches_rendered_output(runner, context):
+    for body in ["Plain text", "Plain text\n", "Two lines\n\n", "Windows\r\nline"]:
+        func = TemplateFunction(
+            name="static",
+            type="template_function",
+            return_shape="string",
+            template_body=body,
+        )
+        expected = runner.env.from_string(body).render(args={})
+        assert runner.run(func, {}, context) == expected
+
+
+def test_jinja_static_template_skips_render(runner, context):
+    func = TemplateFunction(
+        name="static",
+        type="template_function",
+        return_shape="string",
+        template_body="No placeholders here",
+    )
+
+    runner.run(func, {}, context)
+    assert func._compiled_template[2] == "No placeholders here"
+
+
+def test_jinja_template_is_compiled_once_per_function(runner, context):
+    func = TemplateFunction(
+        name="greet",
+        type="template_function",
+        return_shape="string",
+        template_body="Hi {{ args.name }}",
+    )
+
+    assert runner.run(func, {"name": "Ann"}, context) == "Hi Ann"
+    template = func._compiled_template[2]
+    assert runner.run(func, {"name": "Bo"}, context) == "Hi Bo"
+    assert func._compiled_template[2] is template
+
+    func.template_body = "Hello {{ args.name }}"
+    assert runner.run(func, {"name": "Bo"}, context) == "Hello Bo"
+    assert func._compiled_template[2] is not template
+    assert not hasattr(runner, "_compiled")
@@ -1,7 +1,7 @@
 import pytest
 import sys
 from typing import Annotated
-from brimley.execution.python_runner import PythonRunner
+from brimley.execution.python_runner import PythonRunner, invalidate_module_index
 from brimley.core.models import PythonFunction
 from brimley.core.context import BrimleyContext
 from brimley import AppState, Config
@@ -331,3 +331,200 @@ async def test_python_runner_returns_awaitable_when_loop_active(context):
     assert hasattr(maybe_awaitable, "__await__")
     result = await maybe_awaitable
     assert result == {"prompt": "hello", "mcp_ctx_id": id(runtime_mcp_ctx)}
+
+
+def test_python_runner_evaluates_handler_annotations_once(context, monkeypatch):
+    import brimley.execution.python_runner as python_runner_module
+
+    calls = {"count": 0}
+    original_get_annotations = python_runner_module.inspect.get_annotations
+
+    def counting_get_annotations(obj, **kwargs):
+        if kwargs.get("eval_str"):
+            calls["count"] += 1
+        return original_get_annotations(obj, **kwargs)
+
+    monkeypatch.setattr(python_runner_module.inspect, "get_annotations", counting_get_annotations)
+
+    def cached_handler(name: str, ctx: BrimleyContext):
+        return name
+
+    runner = MockPythonRunner({"test.cached": cached_handler})
+    func = PythonFunction(
+        name="cached_test",
+        type="python_function",
+        return_shape="string",
+        handler="test.cached",
+    )
+
+    assert runner.run(func, {"name": "a"}, context) == "a"
+    assert runner.run(func, {"name": "b"}, context) == "b"
+    assert calls["count"] == 1
+
+
+def test_python_runner_builds_sig_plan_with_parallel_layout():
+    from brimley.execution.python_runner import (
+        _TAG_APP_STATE,
+        _TAG_BRIMLEY_CONTEXT,
+        _TAG_CONFIG,
+        _TAG_CONNECTION,
+        _TAG_PLAIN,
+        _sig_plan_for,
+    )
+
+    def planned(
+        name: str,
+        ctx: BrimleyContext,
+        db: Annotated[Connection, "default"],
+        start: Annotated[float, AppState("start_time")],
+        proj: Annotated[str, Config("app_name")],
+        limit: int = 10,
+    ):
+        return name
+
+    plan = _sig_plan_for(planned)
+
+    assert plan.names == ("name", "ctx", "db", "start", "proj", "limit")
+    assert plan.tags == (
+        _TAG_PLAIN,
+        _TAG_BRIMLEY_CONTEXT,
+        _TAG_CONNECTION,
+        _TAG_APP_STATE,
+        _TAG_CONFIG,
+        _TAG_PLAIN,
+    )
+    assert plan.keys == (None, None, "default", "start_time", "app_name", None)
+    assert plan.defaults[-1] == 10
+    assert plan.is_coro is False
+    assert _sig_plan_for(planned) is plan
+
+
+def test_python_runner_sig_plan_dies_with_handler():
+    import gc
+
+    from brimley.execution.python_runner import _SIG_PLANS, _sig_plan_for
+
+    def failing_hints(value: "MissingType"):
+        return value
+
+    plan = _sig_plan_for(failing_hints)
+    assert plan.names == ("value",)
+    assert failing_hints in _SIG_PLANS
+
+    del failing_hints
+    gc.collect()
+    assert all(cached is not plan for cached in _SIG_PLANS.values())
+
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, value: int):
+            return value
+
+    assert _sig_plan_for(Unhashable()).names == ("value",)
+
+
+def test_python_runner_caches_resolved_module_and_pins_import_root(tmp_path, monkeypatch):
+    module_name = "external_cached_module"
+    (tmp_path / f"{module_name}.py").write_text(
+        "def double(value: int) -> int:\n"
+        "    return value * 2\n"
+    )
+
+    sys.modules.pop(module_name, None)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+
+    runner = PythonRunner()
+    context = BrimleyContext()
+    context.app["root_dir"] = str(tmp_path)
+
+    func = PythonFunction(
+        name="double",
+        type="python_function",
+        return_shape="int",
+        handler=f"{module_name}.double",
+    )
+
+    assert runner.run(func, {"value": 2}, context) == 4
+    assert str(tmp_path.resolve()) in sys.path
+
+    def fail_collect(*args, **kwargs):
+        raise AssertionError("import roots should not be recollected for a cached module")
+
+    monkeypatch.setattr(runner, "_collect_import_roots", fail_collect)
+    assert runner.run(func, {"value": 5}, context) == 10
+
+    sys.modules.pop(module_name, None)
+
+
+def test_python_runner_discovers_nested_module_roots_from_cached_index(tmp_path, monkeypatch):
+    nested_dir = tmp_path / "functions" / "billing"
+    nested_dir.mkdir(parents=True)
+    (nested_dir / "invoice_totals.py").write_text("VALUE = 1\n")
+
+    runner = PythonRunner()
+    root = str(tmp_path)
+
+    assert runner._discover_module_roots("invoice_totals", [root]) == [str(nested_dir.resolve())]
+
+    def fail_walk(*args, **kwargs):
+        raise AssertionError("module index should be reused")
+
+    monkeypatch.setattr("brimley.execution.python_runner.os.walk", fail_walk)
+    assert runner._discover_module_roots("invoice_totals", [root]) == [str(nested_dir.resolve())]
+
+    assert runner._discover_module_roots("missing_module", [root]) == []
+
+    monkeypatch.undo()
+    (tmp_path / "functions" / "late_module.py").write_text("VALUE = 2\n")
+    assert runner._discover_module_roots("late_module", [root]) == []
+
+    invalidate_module_index()
+    assert runner._discover_module_roots("late_module", [root]) == [str((tmp_path / "functions").resolve())]
+
+
+def test_python_runner_calls_path_only_loader_once(context):
+    calls = []
+
+    def handler(name: str):
+        return name
+
+    runner = PythonRunner()
+
+    def path_only_loader(handler_path: str):
+        calls.append(handler_path)
+        return handler
+
+    runner._load_handler = path_only_loader  # type: ignore[method-assign]
+
+    func = PythonFunction(
+        name="path_only",
+        type="python_function",
+        return_shape="string",
+        handler="test.path_only",
+    )
+
+    assert runner.run(func, {"name": "Alice"}, context) == "Alice"
+    assert calls == ["test.path_only"]
+
+
+def test_python_runner_looks_up_sig_plan_once_per_call(context, monkeypatch):
+    import brimley.execution.python_runner as python_runner_module
+
+    lookups = []
+    original_sig_plan_for = python_runner_module._sig_plan_for
+
+    def counting_sig_plan_for(handler):
+        lookups.append(handler)
+        return original_sig_plan_for(handler)
+
+    monkeypatch.setattr(python_runner_module, "_sig_plan_for", counting_sig_plan_for)
+
+    def sync_handler(name: str, ctx: BrimleyContext):
+        return name
+
+    runner = MockPythonRunner({"test.sync": sync_handler})
+    func = PythonFunction(name="sync_test", type="python_function", return_shape="string", handler="test.sync")
+
+    assert runner.run(func, {"name": "a"}, context) == "a"
+    assert lookups == [sync_handler]
@@ -129,3 +129,74 @@ def test_sql_execution_missing_connection(runner):
     
     with pytest.raises(RuntimeError, match="Database connection 'missing' not found"):
         runner.run(func, {}, context)
+
+
+def test_sql_execution_streams_list_shapes_in_batches(runner, context, monkeypatch):
+    import brimley.execution.sql_runner as sql_runner_module
+
+    monkeypatch.setattr(sql_runner_module, "STREAM_BATCH_SIZE", 1)
+    with context.databases["default"].connect() as conn:
+        conn.execute(text("INSERT INTO users (id, name, email) VALUES (3, 'Carol', 'carol@example.com')"))
+        conn.commit()
+
+    func = SqlFunction(
+        name="get_users",
+        type="sql_function",
+        return_shape="User[]",
+        sql_body="SELECT id, name FROM users ORDER BY id"
+    )
+
+    result = runner.run(func, {}, context)
+
+    assert [user.name for user in result] == ["Alice", "Bob", "Carol"]
+
+
+def test_sql_statement_is_compiled_once_per_function(runner, context):
+    func = SqlFunction(
+        name="get_users",
+        type="sql_function",
+        return_shape="User[]",
+        sql_body="SELECT id, name FROM users"
+    )
+
+    runner.run(func, {}, context)
+    stmt = func._compiled_stmt[1]
+    runner.run(func, {}, context)
+    assert func._compiled_stmt[1] is stmt
+
+    func.sql_body = "SELECT id, name FROM users WHERE id = 1"
+    assert len(runner.run(func, {}, context)) == 1
+    assert func._compiled_stmt[1] is not stmt
+
+
+def test_sql_execution_streams_only_row_queries(runner, context, monkeypatch):
+    from sqlalchemy.engine import Connection
+
+    streamed = []
+    original = Connection.execution_options
+
+    def recording_options(self, **opts):
+        if opts.get("stream_results"):
+            streamed.append(opts)
+        return original(self, **opts)
+
+    monkeypatch.setattr(Connection, "execution_options", recording_options)
+
+    insert = SqlFunction(
+        name="add_user",
+        type="sql_function",
+        return_shape="dict[]",
+        sql_body="-- new user\nINSERT INTO users (id, name, email) VALUES (:id, :name, :email)",
+        arguments={"inline": {"id": "int", "name": "string", "email": "string"}},
+    )
+    assert runner.run(insert, {"id": 3, "name": "Carol", "email": "carol@example.com"}, context) == [{"rows_affected": 1}]
+    assert streamed == []
+
+    select = SqlFunction(
+        name="get_users",
+        type="sql_function",
+        return_shape="User[]",
+        sql_body="/* all */ SELECT id, name FROM users ORDER BY id",
+    )
+    assert [user.name for user in runner.run(select, {}, context)] == ["Alice", "Bob", "Carol"]
+    assert len(streamed) == 1
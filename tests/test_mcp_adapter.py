@@ -2,6 +2,7 @@ from brimley.core.context import BrimleyContext
 from brimley.core.models import TemplateFunction
 from brimley.mcp.adapter import BrimleyMCPAdapter
 import inspect
+import pytest
 
 
 class _FakeMCPServer:
@@ -63,6 +64,26 @@ def test_discover_tools_filters_only_mcp_tool_functions():
     assert [tool.name for tool in tools] == ["hello_tool"]
 
 
+def test_discover_tools_sees_mcp_blocks_reassigned_after_registration():
+    context = BrimleyContext()
+    func = TemplateFunction(
+        name="hello",
+        type="template_function",
+        return_shape="string",
+        template_body="Hello",
+    )
+    context.functions.register(func)
+    adapter = BrimleyMCPAdapter(registry=context.functions, context=context)
+
+    assert adapter.discover_tools() == []
+
+    func.mcp = {"type": "tool"}
+    assert [tool.name for tool in adapter.discover_tools()] == ["hello"]
+
+    func.mcp = None
+    assert adapter.discover_tools() == []
+
+
 def test_build_tool_input_model_excludes_from_context_arguments():
     context = BrimleyContext()
     func = TemplateFunction(
@@ -493,3 +514,162 @@ def test_get_tool_schema_signatures_changes_when_argument_schema_changes():
     assert initial.keys() == {"hello_tool"}
     assert updated.keys() == {"hello_tool"}
     assert initial["hello_tool"] != updated["hello_tool"]
+
+
+def test_build_tool_input_model_is_cached_per_argument_definition():
+    context = BrimleyContext()
+    func = TemplateFunction(
+        name="hello",
+        type="template_function",
+        return_shape="string",
+        template_body="Hello",
+        mcp={"type": "tool"},
+        arguments={"inline": {"name": {"type": "string"}}},
+    )
+
+    adapter = BrimleyMCPAdapter(registry=context.functions, context=context)
+    first = adapter.build_tool_input_model(func)
+
+    assert adapter.build_tool_input_model(func) is first
+
+    reloaded = func.model_copy(update={"arguments": {"inline": {"name": {"type": "string"}}}})
+    assert adapter.build_tool_input_model(reloaded) is first
+
+    changed = func.model_copy(update={"arguments": {"inline": {"name": {"type": "int"}}}})
+    assert adapter.build_tool_input_model(changed) is not first
+
+
+def test_create_tool_wrapper_exposes_model_fields_as_signature():
+    context = BrimleyContext()
+    func = TemplateFunction(
+        name="hello",
+        type="template_function",
+        return_shape="string",
+        template_body="Hello {{ args.name }}",
+        mcp={"type": "tool"},
+        arguments={"inline": {"name": "string", "count": {"type": "int", "default": 2}}},
+    )
+
+    adapter = BrimleyMCPAdapter(registry=context.functions, context=context)
+    context.functions.register(func)
+    wrapper = adapter.create_tool_wrapper(func)
+    parameters = inspect.signature(wrapper).parameters
+
+    assert list(parameters) == ["name", "count", "ctx"]
+    assert parameters["name"].annotation is str
+    assert parameters["name"].default is inspect.Parameter.empty
+    assert parameters["count"].default == 2
+    assert wrapper.__name__ == "hello"
+
+    with pytest.raises(TypeError, match="unexpected keyword"):
+        wrapper(name="Dev", bogus=1)
+
+
+def test_fastmcp_classes_are_resolved_once_per_adapter(monkeypatch):
+    context = BrimleyContext()
+    adapter = BrimleyMCPAdapter(registry=context.functions, context=context)
+    imports: list[str] = []
+
+    class FakeFastMCP:
+        pass
+
+    class FakeModule:
+        FastMCP = FakeFastMCP
+
+    def fake_import(name):
+        imports.append(name)
+        return FakeModule()
+
+    monkeypatch.setattr("brimley.mcp.fastmcp_provider.importlib.util.find_spec", lambda _: object())
+    monkeypatch.setattr("brimley.mcp.fastmcp_provider.importlib.import_module", fake_import)
+
+    assert adapter.require_fastmcp() is FakeFastMCP
+    assert adapter.require_fastmcp() is FakeFastMCP
+    assert adapter._resolve_fastmcp_context_type() is adapter._resolve_fastmcp_context_type()
+    assert imports == ["fastmcp", "fastmcp.server.context"]
+
+
+def test_input_model_name_is_camel_cased_and_memoized():
+    from brimley.mcp.fastmcp_provider import _input_model_name
+
+    assert _input_model_name("hello_world") == "HelloWorldMCPInput"
+    assert _input_model_name("v2_lookup") == "V2LookupMCPInput"
+    assert _input_model_name("hello_world") is _input_model_name("hello_world")
+
+
+def test_get_tool_schema_signatures_generates_schema_once_per_model(monkeypatch):
+    context = BrimleyContext()
+    func = TemplateFunction(
+        name="hello",
+        type="template_function",
+        return_shape="string",
+        template_body="Hello",
+        mcp={"type": "tool"},
+        arguments={"inline": {"name": {"type": "string"}}},
+    )
+    context.functions.register(func)
+    adapter = BrimleyMCPAdapter(registry=context.functions, context=context)
+
+    input_model = adapter.build_tool_input_model(func)
+    calls = []
+    original = input_model.model_json_schema
+
+    def counting_schema(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(input_model, "model_json_schema", counting_schema)
+
+    first = adapter.get_tool_schema_signatures()
+    assert adapter.get_tool_schema_signatures() == first
+    assert len(calls) == 1
+
+
+def test_canonical_json_is_sorted_compact_and_handles_wide_ints():
+    from brimley.mcp import fastmcp_provider
+
+    payload = {"tool": "hello", "input_schema": {"b": 1, "a": [2, 3], "max": 2**70}}
+
+    assert fastmcp_provider._canonical_json(payload) == (
+        '{"input_schema":{"a":[2,3],"b":1,"max":1180591620717411303424},"tool":"hello"}'
+    )
+
+
+def test_create_tool_object_is_reused_until_tool_shape_changes(monkeypatch):
+    context = BrimleyContext()
+    func = TemplateFunction(
+        name="hello",
+        type="template_function",
+        return_shape="string",
+        template_body="Hello {{ args.name }}",
+        mcp={"type": "tool"},
+        arguments={"inline": {"name": {"type": "string"}}},
+    )
+    context.functions.register(func)
+    adapter = BrimleyMCPAdapter(registry=context.functions, context=context)
+
+    class FakeToolsModule:
+        class Tool:
+            @classmethod
+            def from_function(cls, fn, name=None, description=None, **kwargs):
+                tool = cls()
+                tool.name = name
+                tool.description = description
+                tool.fn = fn
+                return tool
+
+    class FakeModule:
+        tools = FakeToolsModule
+
+    monkeypatch.setattr("brimley.mcp.fastmcp_provider.importlib.import_module", lambda name: FakeModule() if name == "fastmcp" else __import__(name))
+
+    tool = adapter.create_tool_object(func)
+    assert adapter.create_tool_object(func.model_copy()) is tool
+
+    func.description = "Greets"
+    described = adapter.create_tool_object(func)
+    assert described is not tool
+    assert described.description == "Greets"
+
+    func.arguments = {"inline": {"name": {"type": "int"}}}
+    assert adapter.create_tool_object(func) is not described
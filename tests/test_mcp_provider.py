@@ -163,3 +163,24 @@ async def test_python_tool_wrapper_is_async_and_awaits_dispatcher_result():
     assert captured["function_name"] == "agent_tool"
     assert captured["tool_args"] == {"prompt": "hello"}
     assert captured["runtime_injections"] == {"mcp_context": mcp_ctx}
+
+
+def test_discover_tools_reuses_index_until_registry_changes():
+    context = BrimleyContext()
+    context.functions.register(
+        TemplateFunction(name="tool_a", type="template_function", return_shape="string", template_body="a", mcp={"type": "tool"})
+    )
+    context.functions.register(
+        TemplateFunction(name="plain", type="template_function", return_shape="string", template_body="p")
+    )
+    provider = BrimleyProvider(registry=context.functions, context=context)
+
+    assert [func.name for func in provider.discover_tools()] == ["tool_a"]
+    cached = provider._discovered_tools
+    provider.discover_tools()
+    assert provider._discovered_tools is cached
+
+    context.functions.register(
+        TemplateFunction(name="tool_b", type="template_function", return_shape="string", template_body="b", mcp={"type": "tool"})
+    )
+    assert [func.name for func in provider.discover_tools()] == ["tool_a", "tool_b"]
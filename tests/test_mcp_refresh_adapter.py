@@ -2,7 +2,10 @@ import pytest
 
 from brimley.core.context import BrimleyContext
 from brimley.core.models import TemplateFunction
-from brimley.runtime.mcp_refresh_adapter import ExternalMCPRefreshAdapter, ProviderMCPRefreshManager
+from brimley.runtime.mcp_refresh_adapter import (
+    ExternalMCPRefreshAdapter,
+    ProviderMCPRefreshManager,
+)
 
 
 class _HostServer:
@@ -255,3 +258,79 @@ def test_external_mcp_refresh_raises_client_action_required_when_schema_changes_
 
 def test_external_refresh_adapter_is_compatibility_shim():
     assert issubclass(ExternalMCPRefreshAdapter, ProviderMCPRefreshManager)
+
+
+def test_external_mcp_refresh_reuses_input_models_across_reloads(monkeypatch):
+    _mock_fastmcp(monkeypatch)
+
+    context = BrimleyContext()
+    _register_tool_function(context)
+    state = {"server": _HostServerWithClear()}
+
+    manager = ProviderMCPRefreshManager(
+        context=context,
+        get_server=lambda: state["server"],
+        set_server=lambda server: state.__setitem__("server", server),
+    )
+    manager.refresh()
+    provider = manager._provider
+    model = provider.build_tool_input_model(context.functions.get("hello_tool"))
+
+    context.functions = type(context.functions)()
+    _register_tool_function(context)
+    manager.refresh()
+
+    assert manager._provider is provider
+    assert provider.registry is context.functions
+    assert provider.build_tool_input_model(context.functions.get("hello_tool")) is model
+
+
+def test_external_mcp_refresh_skips_reregistration_when_tools_are_unchanged(monkeypatch):
+    _mock_fastmcp(monkeypatch)
+
+    context = BrimleyContext()
+    _register_tool_function(context)
+    server = _HostServerWithClear()
+    state = {"server": server}
+
+    manager = ProviderMCPRefreshManager(
+        context=context,
+        get_server=lambda: state["server"],
+        set_server=lambda next_server: state.__setitem__("server", next_server),
+    )
+
+    manager.refresh()
+    registered_tool = server.tools[0]
+    assert manager.refresh() is server
+    assert server.clear_calls == 1
+    assert server.tools == [registered_tool]
+
+    context.functions.get("hello_tool").description = "Says hello"
+    manager.refresh()
+    assert server.clear_calls == 2
+    assert server.tools[0].description == "Says hello"
+
+
+def test_refresh_manager_resolves_reset_callable_once_per_server() -> None:
+    context = BrimleyContext()
+
+    class _ResetOnlyServer(_HostServer):
+        def __init__(self) -> None:
+            super().__init__()
+            self.reset_calls = 0
+
+        def reset_tools(self) -> None:
+            self.reset_calls += 1
+
+    manager = ProviderMCPRefreshManager(context=context, get_server=lambda: None, set_server=lambda _server: None)
+    server = _ResetOnlyServer()
+
+    assert manager._supports_clear_tools(server) is True
+    cached = manager._reset_callable
+    manager._clear_tools(server)
+    assert manager._reset_callable is cached
+    assert server.reset_calls == 1
+
+    plain_server = _HostServer()
+    assert manager._supports_clear_tools(plain_server) is False
+    assert manager._reset_callable[0] is plain_server
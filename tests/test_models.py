@@ -7,6 +7,7 @@ from brimley.core.models import (
     SqlFunction, 
     TemplateFunction,
     AutoReloadSettings,
+    MCPConfig,
     normalize_type_expression,
 )
 from brimley.core.entity import PromptMessage
@@ -239,3 +240,13 @@ def test_normalize_type_expression_rejects_unions_and_nested_lists():
 def test_normalize_type_expression_rejects_open_containers_by_default():
     with pytest.raises(ValueError, match="Unsupported open container type"):
         normalize_type_expression("dict")
+
+
+def test_brimley_function_mcp_tool_flags_follow_mcp_block():
+    func = TemplateFunction(name="hello", type="template_function", return_shape="string", template_body="Hi")
+    assert func.is_mcp_tool is False
+    assert func.mcp_description is None
+
+    func.mcp = MCPConfig(type="tool", description="Greets")
+    assert func.is_mcp_tool is True
+    assert func.mcp_description == "Greets"
@@ -0,0 +1,147 @@
+import logging
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from brimley.runtime import native_watcher
+from brimley.runtime.native_watcher import NativeWatcher, create_watcher
+from brimley.runtime.polling_watcher import PollingWatcher
+from brimley.runtime.reload_contracts import WatcherState
+
+
+def _event(event_type: str, src_path: Path, dest_path: Path | None = None, is_directory: bool = False):
+    return SimpleNamespace(
+        event_type=event_type,
+        src_path=str(src_path),
+        dest_path=str(dest_path) if dest_path is not None else "",
+        is_directory=is_directory,
+    )
+
+
+def _watching(root: Path) -> NativeWatcher:
+    # Drive the event queue directly; start() would also schedule a real OS observer
+    watcher = NativeWatcher(root_dir=root, debounce_ms=100)
+    watcher.state = WatcherState.WATCHING
+    return watcher
+
+
+def test_create_watcher_uses_polling_by_default(tmp_path: Path):
+    watcher = create_watcher(tmp_path, include_patterns=["*.sql"])
+
+    assert type(watcher) is PollingWatcher
+    assert watcher.include_patterns == ["*.sql"]
+
+
+def test_create_watcher_falls_back_to_polling_without_watchdog(tmp_path: Path, monkeypatch, caplog):
+    monkeypatch.setattr(native_watcher, "is_native_watcher_available", lambda: False)
+
+    with caplog.at_level(logging.WARNING, logger=native_watcher.__name__):
+        assert type(create_watcher(tmp_path, backend="native")) is PollingWatcher
+
+    assert "'watchdog' is not installed; falling back to polling" in caplog.text
+
+
+def test_create_watcher_falls_back_to_polling_for_missing_root(tmp_path: Path, monkeypatch, caplog):
+    monkeypatch.setattr(native_watcher, "is_native_watcher_available", lambda: True)
+
+    with caplog.at_level(logging.WARNING, logger=native_watcher.__name__):
+        assert type(create_watcher(tmp_path / "missing", backend="native")) is PollingWatcher
+    assert "is not an existing directory; falling back to polling" in caplog.text
+
+    caplog.clear()
+    assert type(create_watcher(tmp_path, backend="native")) is NativeWatcher
+    assert type(create_watcher(tmp_path)) is PollingWatcher
+    assert caplog.text == ""
+
+
+def test_native_watcher_debounces_queued_events(tmp_path: Path):
+    watcher = _watching(tmp_path)
+    for name in ("a.py", "b.py", "notes.txt", "c.py"):
+        (tmp_path / name).write_text("x = 1")
+
+    watcher._on_fs_event(_event("modified", tmp_path / "b.py"))
+    watcher._on_fs_event(_event("created", tmp_path / "a.py"))
+    watcher._on_fs_event(_event("modified", tmp_path / "notes.txt"))
+    watcher._on_fs_event(_event("closed", tmp_path / "c.py"))
+
+    assert watcher.poll(now=0.0).should_reload is False
+    assert watcher.state == WatcherState.DEBOUNCING
+    assert watcher.tracked_paths() == {"a.py", "b.py"}
+
+    ready = watcher.poll(now=0.2)
+    assert ready.should_reload is True
+    assert ready.changed_paths == ("a.py", "b.py")
+
+
+def test_native_watcher_tracks_moves_and_deletes(tmp_path: Path):
+    watcher = _watching(tmp_path)
+    watcher._snapshot = {"": {"old.py": 1, "gone.sql": 1}}
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "new.py").write_text("x = 1")
+
+    watcher._on_fs_event(_event("moved", tmp_path / "old.py", tmp_path / "pkg" / "new.py"))
+    watcher._on_fs_event(_event("deleted", tmp_path / "gone.sql"))
+    watcher.poll(now=0.0)
+
+    assert watcher.tracked_paths() == {"pkg/new.py"}
+    assert watcher.poll(now=0.2).changed_paths == ("gone.sql", "old.py", "pkg/new.py")
+
+
+def test_native_watcher_rescans_after_directory_events(tmp_path: Path):
+    watcher = _watching(tmp_path)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1")
+
+    watcher._on_fs_event(_event("modified", tmp_path / "pkg", is_directory=True))
+    assert watcher.poll(now=0.0).should_reload is False
+    assert watcher.state == WatcherState.WATCHING
+
+    watcher._on_fs_event(_event("moved", tmp_path / "elsewhere", tmp_path / "pkg", is_directory=True))
+    watcher.poll(now=0.0)
+
+    assert watcher.tracked_paths() == {"pkg/mod.py"}
+    assert watcher.poll(now=0.2).changed_paths == ("pkg/mod.py",)
+
+
+def test_native_watcher_records_real_mtimes_so_rescans_stay_quiet(tmp_path: Path):
+    watcher = _watching(tmp_path)
+    (tmp_path / "pkg").mkdir()
+    module_file = tmp_path / "pkg" / "mod.py"
+    module_file.write_text("x = 1")
+
+    watcher._on_fs_event(_event("created", module_file))
+    watcher.poll(now=0.0)
+    assert watcher.poll(now=0.2).changed_paths == ("pkg/mod.py",)
+    watcher.complete_reload(success=True)
+    assert watcher._snapshot["pkg"]["pkg/mod.py"] == os.stat(module_file).st_mtime_ns
+
+    # A directory event forces a full rescan, which must match the stored mtimes
+    watcher._on_fs_event(_event("created", tmp_path / "empty", is_directory=True))
+    assert watcher.poll(now=1.0).should_reload is False
+    assert watcher.state == WatcherState.WATCHING
+
+
+def test_native_watcher_detects_real_file_change(tmp_path: Path):
+    pytest.importorskip("watchdog")
+
+    watcher = create_watcher(tmp_path, backend="native", debounce_ms=0)
+    assert isinstance(watcher, NativeWatcher)
+    watcher.start()
+    try:
+        (tmp_path / "hello.py").write_text("print('hello')")
+
+        deadline = time.monotonic() + 5
+        result = watcher.poll(now=time.monotonic())
+        while not result.should_reload and time.monotonic() < deadline:
+            time.sleep(0.05)
+            result = watcher.poll(now=time.monotonic())
+
+        assert result.should_reload is True
+        assert result.changed_paths == ("hello.py",)
+    finally:
+        watcher.stop()
+
+    assert watcher.state == WatcherState.STOPPED
@@ -15,3 +15,14 @@ def test_pyproject_declares_fastmcp_optional_dependency_and_extra():
     extras = payload["tool"]["poetry"]["extras"]
     assert "fastmcp" in extras
     assert "fastmcp" in extras["fastmcp"]
+
+
+def test_pyproject_declares_watchdog_optional_dependency_and_extra():
+    pyproject_path = Path(__file__).resolve().parents[1] / "pyproject.toml"
+    payload = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+
+    watchdog_dep = payload["tool"]["poetry"]["dependencies"]["watchdog"]
+
+    assert isinstance(watchdog_dep, dict)
+    assert watchdog_dep["optional"] is True
+    assert "watchdog" in payload["tool"]["poetry"]["extras"]["watchdog"]
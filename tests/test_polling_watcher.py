@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from brimley.runtime.polling_watcher import PollingWatcher
+from brimley.runtime.polling_watcher import PollingWatcher, WatcherPollResult
 from brimley.runtime.reload_contracts import WatcherState
 
 
@@ -30,7 +30,7 @@ def test_polling_watcher_debounces_changes_until_window_elapses(tmp_path: Path):
 
     first_poll = watcher.poll(now=0.10)
     assert first_poll.should_reload is False
-    assert first_poll.changed_paths == []
+    assert first_poll.changed_paths == ()
     assert watcher.state == WatcherState.DEBOUNCING
 
     second_poll = watcher.poll(now=0.25)
@@ -38,7 +38,7 @@ def test_polling_watcher_debounces_changes_until_window_elapses(tmp_path: Path):
 
     final_poll = watcher.poll(now=0.35)
     assert final_poll.should_reload is True
-    assert final_poll.changed_paths == ["hello.py"]
+    assert final_poll.changed_paths == ("hello.py",)
     assert watcher.state == WatcherState.RELOADING
 
     watcher.complete_reload(success=True)
@@ -59,7 +59,7 @@ def test_polling_watcher_detects_deleted_files(tmp_path: Path):
 
     ready = watcher.poll(now=1.2)
     assert ready.should_reload is True
-    assert ready.changed_paths == ["gone.py"]
+    assert ready.changed_paths == ("gone.py",)
 
 
 def test_polling_watcher_detects_updated_files(tmp_path: Path):
@@ -76,7 +76,7 @@ def test_polling_watcher_detects_updated_files(tmp_path: Path):
 
     ready = watcher.poll(now=1.2)
     assert ready.should_reload is True
-    assert ready.changed_paths == ["edit.py"]
+    assert ready.changed_paths == ("edit.py",)
 
 
 def test_polling_watcher_burst_changes_reset_debounce_window(tmp_path: Path):
@@ -100,4 +100,164 @@ def test_polling_watcher_burst_changes_reset_debounce_window(tmp_path: Path):
 
     ready = watcher.poll(now=0.45)
     assert ready.should_reload is True
-    assert ready.changed_paths == ["first.py", "second.py"]
+    assert ready.changed_paths == ("first.py", "second.py")
+
+
+def test_polling_watcher_snapshot_uses_posix_relative_paths_for_nested_files(tmp_path: Path):
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (nested / "deep.sql").write_text("select 1")
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1")
+
+    watcher = PollingWatcher(root_dir=tmp_path)
+    watcher.start()
+
+    assert watcher.tracked_paths() == {"pkg/mod.py", "pkg/sub/deep.sql"}
+
+
+def test_polling_watcher_snapshot_is_empty_for_missing_root(tmp_path: Path):
+    watcher = PollingWatcher(root_dir=tmp_path / "missing")
+    watcher.start()
+
+    assert watcher.tracked_paths() == set()
+
+
+def test_polling_watcher_combined_patterns_match_like_fnmatch(tmp_path: Path):
+    from fnmatch import fnmatch
+
+    include = ["*.py", "docs/*.md"]
+    exclude = [".venv/*", "*_test.py"]
+    watcher = PollingWatcher(root_dir=tmp_path, include_patterns=include, exclude_patterns=exclude)
+
+    for relative in ["a.py", "pkg/b.py", "docs/readme.md", "notes.md", ".venv/x.py", "pkg/c_test.py", "d.sql"]:
+        filename = relative.rsplit("/", 1)[-1]
+        expected = any(fnmatch(relative, p) or fnmatch(filename, p) for p in include) and not any(
+            fnmatch(relative, p) or fnmatch(filename, p) for p in exclude
+        )
+        assert watcher._is_tracked_path(relative, filename) is expected, relative
+
+
+def test_polling_watcher_detect_changes_reports_added_removed_and_modified():
+    previous = {"same.py": 1, "edited.py": 1, "removed.py": 1}
+    current = {"same.py": 1, "edited.py": 2, "added.py": 1}
+
+    assert PollingWatcher._detect_changes(previous, current) == {"edited.py", "removed.py", "added.py"}
+
+
+def test_polling_watcher_reuses_listing_of_unchanged_directories(tmp_path: Path, monkeypatch):
+    import os
+
+    from brimley.runtime import polling_watcher
+
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    module = pkg / "mod.py"
+    module.write_text("x = 1")
+    old = 1_000_000_000
+    for path in (module, pkg, tmp_path):
+        os.utime(path, ns=(old, old))
+
+    watcher = PollingWatcher(root_dir=tmp_path, debounce_ms=0)
+    watcher.start()
+
+    scanned: list[str] = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(polling_watcher.os, "scandir", lambda path: scanned.append(path) or real_scandir(path))
+
+    os.utime(module, ns=(old + 1, old + 1))
+    watcher.poll(now=0.0)
+    assert scanned == []
+    assert watcher.poll(now=1.0).changed_paths == ("pkg/mod.py",)
+
+    watcher.complete_reload(success=True)
+    (pkg / "new.py").write_text("y = 2")
+    watcher.poll(now=2.0)
+    assert scanned == [str(pkg)]
+    assert "pkg/new.py" in watcher.tracked_paths()
+
+
+def test_polling_watcher_reports_changes_in_detection_order(tmp_path: Path):
+    watcher = PollingWatcher(root_dir=tmp_path, debounce_ms=200)
+    watcher.start()
+
+    (tmp_path / "zeta.py").write_text("z = 1")
+    watcher.poll(now=0.10)
+
+    (tmp_path / "beta.py").write_text("b = 1")
+    (tmp_path / "alpha.py").write_text("a = 1")
+    (tmp_path / "zeta.py").write_text("z = 2 # edited again")
+    watcher.poll(now=0.20)
+
+    ready = watcher.poll(now=0.45)
+    assert ready.should_reload is True
+    assert ready.changed_paths == ("zeta.py", "alpha.py", "beta.py")
+
+
+def test_polling_watcher_and_poll_result_use_slots(tmp_path: Path):
+    watcher = PollingWatcher(root_dir=tmp_path)
+    result = WatcherPollResult(should_reload=False, changed_paths=())
+
+    assert not hasattr(watcher, "__dict__")
+    assert not hasattr(result, "__dict__")
+
+
+def test_debounce_entry_table_matches_contract_transitions():
+    from brimley.runtime.polling_watcher import _DEBOUNCE_ENTRY
+
+    assert _DEBOUNCE_ENTRY == {WatcherState.WATCHING: WatcherState.DEBOUNCING}
+
+
+def test_changes_while_debouncing_extend_window_without_transitions(tmp_path: Path, monkeypatch):
+    from brimley.runtime import polling_watcher
+
+    watcher = PollingWatcher(root_dir=tmp_path, debounce_ms=200)
+    watcher.start()
+    (tmp_path / "a.py").write_text("a = 1")
+    watcher.poll(now=0.1)
+    assert watcher.state == WatcherState.DEBOUNCING
+
+    def fail_transition(*_args):
+        raise AssertionError("no transition expected while debouncing")
+
+    monkeypatch.setattr(polling_watcher, "transition_watcher_state", fail_transition)
+    (tmp_path / "b.py").write_text("b = 1")
+    assert watcher.poll(now=0.25).should_reload is False
+    assert watcher.state == WatcherState.DEBOUNCING
+    monkeypatch.undo()
+
+    assert watcher.poll(now=0.35).should_reload is False
+    assert watcher.poll(now=0.45).changed_paths == ("a.py", "b.py")
+
+
+def test_polling_watcher_snapshot_is_bucketed_by_top_level_directory(tmp_path: Path):
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "deep.sql").write_text("select 1")
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "util.py").write_text("y = 1")
+    (tmp_path / "root.py").write_text("x = 1")
+
+    watcher = PollingWatcher(root_dir=tmp_path)
+    watcher.start()
+
+    assert {key: set(bucket) for key, bucket in watcher._snapshot.items()} == {
+        "": {"root.py"},
+        "pkg": {"pkg/sub/deep.sql"},
+        "lib": {"lib/util.py"},
+    }
+
+
+def test_polling_watcher_bucket_diff_covers_added_and_removed_buckets():
+    previous = {"": {"a.py": 1}, "pkg": {"pkg/m.py": 1}, "old": {"old/x.py": 1}}
+    current = {"": {"a.py": 1}, "pkg": {"pkg/m.py": 2}, "new": {"new/y.py": 1}}
+
+    assert PollingWatcher._detect_bucket_changes(previous, current) == {"pkg/m.py", "old/x.py", "new/y.py"}
+
+
+def test_polling_watcher_quiet_polls_share_one_result(tmp_path: Path):
+    watcher = PollingWatcher(root_dir=tmp_path)
+    watcher.start()
+
+    first = watcher.poll(now=0.1)
+    assert first.should_reload is False
+    assert first.changed_paths == ()
+    assert watcher.poll(now=0.2) is first
@@ -76,3 +76,27 @@ def test_registry_quarantined_name_raises_clear_error_on_get():
     assert "hello" in reg
     with pytest.raises(KeyError, match="quarantined"):
         reg.get("hello")
+
+
+def test_registry_generation_changes_on_register():
+    registry = Registry()
+    start = registry.generation
+
+    registry.register(MockFunction(name="a"))
+    assert registry.generation == start + 1
+
+    with pytest.raises(ValueError):
+        registry.register(MockFunction(name="a"))
+    assert registry.generation == start + 1
+
+
+def test_registry_generation_changes_on_alias_and_quarantine():
+    registry = Registry()
+    registry.register(MockFunction(name="a"))
+    start = registry.generation
+
+    registry.register_alias("b", "a")
+    assert registry.generation == start + 1
+
+    registry.mark_quarantined("a", "boom")
+    assert registry.generation == start + 2
@@ -436,3 +436,429 @@ def test_reload_engine_quarantines_changed_broken_function_without_stale_fallbac
     assert "hello" in context.functions
     with pytest.raises(KeyError, match="quarantined"):
         context.functions.get("hello")
+
+
+def test_reload_engine_reloads_changed_modules_and_dependents_in_dependency_order(tmp_path, monkeypatch):
+    import importlib
+    import os
+    import sys
+    import time
+
+    (tmp_path / "dagmod_helpers.py").write_text("VALUE = 1\n")
+    (tmp_path / "dagmod_handlers.py").write_text("from dagmod_helpers import VALUE\n\ndef handle():\n    return VALUE\n")
+    (tmp_path / "dagmod_other.py").write_text("def other():\n    return 0\n")
+    settled = time.time() - 10
+    for name in ("dagmod_helpers.py", "dagmod_handlers.py", "dagmod_other.py"):
+        os.utime(tmp_path / name, (settled, settled))
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    context = BrimleyContext()
+    context.app["root_dir"] = str(tmp_path)
+    functions = [
+        PythonFunction(name="f1", type="python_function", handler="dagmod_handlers.handle", return_shape="int"),
+        PythonFunction(name="f2", type="python_function", handler="dagmod_other.other", return_shape="int"),
+    ]
+
+    reloaded: list[str] = []
+    real_reload = importlib.reload
+
+    def tracking_reload(module):
+        reloaded.append(module.__name__)
+        return real_reload(module)
+
+    monkeypatch.setattr(importlib, "reload", tracking_reload)
+    engine = PartitionedReloadEngine()
+    try:
+        engine._rehydrate_python_modules(context, functions)
+        assert sorted(reloaded) == ["dagmod_handlers", "dagmod_other"]
+
+        reloaded.clear()
+        engine._rehydrate_python_modules(context, functions)
+        assert reloaded == []
+
+        (tmp_path / "dagmod_helpers.py").write_text("VALUE = 2\n")
+        edited = time.time() - 5
+        os.utime(tmp_path / "dagmod_helpers.py", (edited, edited))
+        engine._rehydrate_python_modules(context, functions)
+
+        assert reloaded == ["dagmod_helpers", "dagmod_handlers"]
+        assert sys.modules["dagmod_handlers"].handle() == 2
+    finally:
+        for name in ("dagmod_helpers", "dagmod_handlers", "dagmod_other"):
+            sys.modules.pop(name, None)
+
+
+def test_module_topological_order_puts_imports_first_and_tolerates_cycles():
+    from brimley.runtime.reload_engine import _dependents_closure, _topological_order
+
+    dependencies = {"app": {"svc"}, "svc": {"util"}, "util": set(), "cli": {"app"}}
+    assert _dependents_closure({"svc"}, dependencies) == {"svc", "app", "cli"}
+    assert _topological_order({"svc", "app", "cli"}, dependencies) == ["svc", "app", "cli"]
+    assert _topological_order({"a", "b"}, {"a": {"b"}, "b": {"a"}}) == ["a", "b"]
+
+
+def test_module_topological_layers_group_independent_modules():
+    from brimley.runtime.reload_engine import _topological_layers
+
+    dependencies = {"app": {"svc", "db"}, "svc": {"util"}, "db": {"util"}, "util": set()}
+    assert _topological_layers({"app", "svc", "db", "util"}, dependencies) == [["util"], ["db", "svc"], ["app"]]
+    assert _topological_layers({"a", "b"}, {"a": {"b"}, "b": {"a"}}) == [["a"], ["b"]]
+
+
+def test_reload_engine_reloads_independent_modules_of_a_layer_concurrently(tmp_path, monkeypatch):
+    import importlib
+    import sys
+    import threading
+
+    (tmp_path / "layermod_left.py").write_text("VALUE = 1\n")
+    (tmp_path / "layermod_right.py").write_text("VALUE = 2\n")
+    (tmp_path / "layermod_top.py").write_text(
+        "from layermod_left import VALUE as LEFT\nfrom layermod_right import VALUE as RIGHT\n"
+    )
+    context = BrimleyContext()
+    context.app["root_dir"] = str(tmp_path)
+    functions = [
+        PythonFunction(name=name, type="python_function", handler=f"{name}.run", return_shape="int")
+        for name in ("layermod_left", "layermod_right", "layermod_top")
+    ]
+
+    # Both leaf reloads must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+    reloaded: list[str] = []
+    real_reload = importlib.reload
+
+    def tracking_reload(module):
+        if module.__name__ != "layermod_top":
+            barrier.wait()
+        reloaded.append(module.__name__)
+        return real_reload(module)
+
+    monkeypatch.setattr(importlib, "reload", tracking_reload)
+    try:
+        PartitionedReloadEngine()._rehydrate_python_modules(context, functions)
+    finally:
+        for name in ("layermod_left", "layermod_right", "layermod_top"):
+            sys.modules.pop(name, None)
+
+    assert sorted(reloaded[:2]) == ["layermod_left", "layermod_right"]
+    assert reloaded[2] == "layermod_top"
+
+
+def test_reload_engine_orders_domains_topologically():
+    from brimley.runtime.reload_contracts import RELOAD_DOMAIN_ORDER
+
+    engine = PartitionedReloadEngine()
+
+    assert engine._ordered_domains == tuple(RELOAD_DOMAIN_ORDER)
+    assert set(engine._domain_apply) == set(RELOAD_DOMAIN_ORDER)
+
+
+def test_reload_engine_shares_static_domain_order_unless_graph_is_overridden():
+    from brimley.runtime.reload_engine import _RELOAD_ORDER
+
+    class McpFirstEngine(PartitionedReloadEngine):
+        def dependency_graph(self):
+            return {
+                ReloadDomain.MCP_TOOLS: [],
+                ReloadDomain.ENTITIES: [ReloadDomain.MCP_TOOLS],
+                ReloadDomain.FUNCTIONS: [ReloadDomain.ENTITIES],
+            }
+
+    assert PartitionedReloadEngine()._ordered_domains is _RELOAD_ORDER
+    assert McpFirstEngine()._ordered_domains == (
+        ReloadDomain.MCP_TOOLS,
+        ReloadDomain.ENTITIES,
+        ReloadDomain.FUNCTIONS,
+    )
+
+
+def test_reload_engine_diagnostic_relative_paths_skip_outside_root(tmp_path):
+    engine = PartitionedReloadEngine()
+    root = tmp_path / "project"
+    (root / "pkg").mkdir(parents=True)
+    context = BrimleyContext()
+    context.app["root_dir"] = str(root)
+
+    def diag(path):
+        return BrimleyDiagnostic(file_path=str(path), error_code="ERR_PARSE", message="bad")
+
+    relative = engine._diagnostic_relative_paths(
+        context,
+        [
+            diag(root / "pkg" / "Tools.py"),
+            diag(root / "pkg" / "Tools.py"),
+            diag(root / "pkg" / ".." / "main.sql"),
+            diag(tmp_path / "outside.py"),
+        ],
+    )
+
+    assert relative == {"pkg/tools.py", "main.sql"}
+
+
+def test_reload_engine_domain_for_path_uses_file_suffix():
+    engine = PartitionedReloadEngine()
+
+    assert engine._domain_for_path("models/Customer.YML") == ReloadDomain.ENTITIES
+    assert engine._domain_for_path("models/customer.yaml") == ReloadDomain.ENTITIES
+    assert engine._domain_for_path("functions/hello.sql") == ReloadDomain.FUNCTIONS
+    assert engine._domain_for_path("config.yaml.d/hello.py") == ReloadDomain.FUNCTIONS
+    assert engine._domain_for_path("models/.yaml") == ReloadDomain.FUNCTIONS
+
+
+def test_reload_engine_skips_cache_invalidation_without_reload_enabled_modules(monkeypatch):
+    engine = PartitionedReloadEngine()
+    calls: list[str] = []
+
+    monkeypatch.setattr("brimley.runtime.reload_engine.importlib.invalidate_caches", lambda: calls.append("invalidate"))
+    monkeypatch.setattr("brimley.runtime.reload_engine.linecache.checkcache", lambda: calls.append("checkcache"))
+
+    functions = [
+        PythonFunction(
+            name="pinned",
+            type="python_function",
+            handler="pkg.pinned.run",
+            return_shape="void",
+            reload=False,
+        ),
+    ]
+
+    engine._rehydrate_python_modules(BrimleyContext(), functions)
+    engine._rehydrate_python_modules(BrimleyContext(), [])
+
+    assert calls == []
+
+
+def test_reload_engine_removes_cached_bytecode_when_present(tmp_path):
+    engine = PartitionedReloadEngine()
+    cached = tmp_path / "mod.cpython-311.pyc"
+    cached.write_bytes(b"")
+    module = ModuleType("mod")
+    module.__cached__ = str(cached)
+
+    engine._remove_cached_bytecode(module)
+    assert not cached.exists()
+
+    # Already gone, or never written (e.g. PYTHONDONTWRITEBYTECODE): nothing to do
+    engine._remove_cached_bytecode(module)
+    engine._remove_cached_bytecode(ModuleType("builtin_like"))
+
+
+def test_reload_engine_classifies_diagnostics_by_domain_in_order():
+    engine = PartitionedReloadEngine()
+    diagnostics = [
+        BrimleyDiagnostic(file_path=path, error_code="ERR_PARSE", message="bad")
+        for path in ("a.sql", "models/b.yaml", "c.py", "models/d.YML")
+    ]
+
+    by_domain = engine._classify_diagnostics(diagnostics)
+
+    assert [d.file_path for d in by_domain[ReloadDomain.ENTITIES]] == ["models/b.yaml", "models/d.YML"]
+    assert [d.file_path for d in by_domain[ReloadDomain.FUNCTIONS]] == ["a.sql", "c.py"]
+    assert by_domain[ReloadDomain.MCP_TOOLS] == []
+
+
+def test_reload_engine_caches_import_roots_until_settings_change(tmp_path, monkeypatch):
+    engine = PartitionedReloadEngine()
+    context = BrimleyContext()
+    later = tmp_path / "later"
+    root, later_root = str(tmp_path.resolve()), str(later.resolve())
+    context.app["root_dir"] = str(tmp_path)
+    context.app["scan_root"] = str(later)
+
+    # A configured root that does not exist yet is re-resolved on the next cycle
+    assert engine._collect_import_roots(context) == [root]
+    later.mkdir()
+    assert engine._collect_import_roots(context) == [root, later_root]
+
+    def fail_resolve(self, *args, **kwargs):
+        raise AssertionError("import roots should come from the cache")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(type(tmp_path), "resolve", fail_resolve)
+        assert engine._collect_import_roots(context) == [root, later_root]
+
+    context.app["scan_root"] = None
+    assert engine._collect_import_roots(context) == [root]
+
+
+def test_reload_engine_temporary_sys_path_prepends_missing_roots_once(monkeypatch):
+    import sys
+
+    engine = PartitionedReloadEngine()
+    monkeypatch.setattr(sys, "path", ["/existing", "/lib"])
+
+    with engine._temporary_sys_path(["/a", "/existing", "/b"]):
+        assert sys.path == ["/a", "/b", "/existing", "/lib"]
+    assert sys.path == ["/existing", "/lib"]
+
+    with engine._temporary_sys_path(["/a"]):
+        sys.path.insert(0, "/added-by-module")
+    assert sys.path == ["/added-by-module", "/existing", "/lib"]
+
+
+def test_reload_engine_patches_sys_path_once_per_rehydration_cycle(tmp_path, monkeypatch):
+    import sys
+
+    for name in ("oncepath_a", "oncepath_b"):
+        (tmp_path / f"{name}.py").write_text("def run():\n    return 1\n")
+    context = BrimleyContext()
+    context.app["root_dir"] = str(tmp_path)
+    functions = [
+        PythonFunction(name=name, type="python_function", handler=f"{name}.run", return_shape="int")
+        for name in ("oncepath_a", "oncepath_b")
+    ]
+
+    engine = PartitionedReloadEngine()
+    entered: list[list[str]] = []
+    real_temporary_sys_path = engine._temporary_sys_path
+
+    def counting_temporary_sys_path(roots):
+        entered.append(list(roots))
+        return real_temporary_sys_path(roots)
+
+    monkeypatch.setattr(engine, "_temporary_sys_path", counting_temporary_sys_path)
+    try:
+        engine._rehydrate_python_modules(context, functions)
+    finally:
+        for name in ("oncepath_a", "oncepath_b"):
+            sys.modules.pop(name, None)
+
+    assert entered == [[str(tmp_path.resolve())]]
+    assert str(tmp_path.resolve()) not in sys.path
+
+
+def test_reload_engine_deduplicates_import_roots_in_setting_order(tmp_path):
+    engine = PartitionedReloadEngine()
+    context = BrimleyContext()
+    (tmp_path / "src").mkdir()
+    context.app.update(
+        {"root_dir": str(tmp_path), "project_root": str(tmp_path / "src"), "root": str(tmp_path / "src" / "..")}
+    )
+
+    assert engine._collect_import_roots(context) == [str(tmp_path.resolve()), str((tmp_path / "src").resolve())]
+
+
+def test_reload_engine_quarantine_matches_canonical_id_paths_case_insensitively():
+    from brimley.core.registry import Registry
+
+    context = BrimleyContext()
+    context.app["root_dir"] = "/project"
+    for name, canonical_id in (
+        ("mixed", "function:Funcs/Hello.md:mixed"),
+        ("malformed", "function:funcs/hello.md"),
+        ("entity_like", "entity:funcs/hello.md:entity_like"),
+    ):
+        context.functions.register(
+            TemplateFunction(
+                name=name,
+                type="template_function",
+                return_shape="string",
+                template_body="body",
+                canonical_id=canonical_id,
+            )
+        )
+    diagnostics = [BrimleyDiagnostic(file_path="/project/funcs/hello.md", error_code="ERR_PARSE", message="bad")]
+
+    reasons = PartitionedReloadEngine()._quarantined_function_reasons(context, Registry(), diagnostics)
+
+    assert list(reasons) == ["mixed"]
+
+
+def test_reload_engine_keeps_unchanged_function_objects_across_reloads():
+    def template(name: str, body: str) -> TemplateFunction:
+        return TemplateFunction(name=name, type="template_function", return_shape="string", template_body=body)
+
+    context = BrimleyContext()
+    engine = PartitionedReloadEngine()
+    engine.apply_reload_with_policy(
+        context, BrimleyScanResult(functions=[template("same", "hello"), template("edited", "v1")])
+    )
+    same = context.functions.get("same")
+    edited = context.functions.get("edited")
+    same._compiled_template = object()  # compiled state must not prevent the match
+
+    engine.apply_reload_with_policy(
+        context,
+        BrimleyScanResult(functions=[template("same", "hello"), template("edited", "v2"), template("new", "x")]),
+    )
+
+    assert context.functions.get("same") is same
+    assert context.functions.get("edited") is not edited
+    assert context.functions.get("edited").template_body == "v2"
+    assert "new" in context.functions
+
+
+def test_reload_engine_reloads_lazily_imported_helper_edited_since_previous_cycle(tmp_path, monkeypatch):
+    import os
+    import sys
+    import time
+
+    (tmp_path / "lz_helpers.py").write_text("VALUE = 1\n")
+    (tmp_path / "lz_handler.py").write_text("def handle():\n    import lz_helpers\n    return lz_helpers.VALUE\n")
+    settled = time.time() - 60
+    for name in ("lz_helpers.py", "lz_handler.py"):
+        os.utime(tmp_path / name, (settled, settled))
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    context = BrimleyContext()
+    context.app["root_dir"] = str(tmp_path)
+    functions = [PythonFunction(name="lz", type="python_function", handler="lz_handler.handle", return_shape="int")]
+    engine = PartitionedReloadEngine()
+    try:
+        engine._rehydrate_python_modules(context, functions)
+        assert "lz_helpers" not in sys.modules
+        assert sys.modules["lz_handler"].handle() == 1
+
+        # Imported between cycles, then edited before the next one
+        (tmp_path / "lz_helpers.py").write_text("VALUE = 2\n")
+        engine._rehydrate_python_modules(context, functions)
+
+        assert sys.modules["lz_handler"].handle() == 2
+    finally:
+        for name in ("lz_helpers", "lz_handler"):
+            sys.modules.pop(name, None)
+
+
+def test_reload_engine_retries_thread_bound_reloads_and_reports_failures(tmp_path, monkeypatch):
+    import sys
+
+    (tmp_path / "tb_signal.py").write_text(
+        "import signal\nsignal.signal(signal.SIGTERM, signal.getsignal(signal.SIGTERM))\n"
+        "def run():\n    return 1\n"
+    )
+    (tmp_path / "tb_plain.py").write_text("def run():\n    return 1\n")
+    (tmp_path / "tb_broken.py").write_text("def run():\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    context = BrimleyContext()
+    context.app["root_dir"] = str(tmp_path)
+    functions = [
+        PythonFunction(name=name, type="python_function", handler=f"{name}.run", return_shape="int")
+        for name in ("tb_signal", "tb_plain", "tb_broken")
+    ]
+    engine = PartitionedReloadEngine()
+    try:
+        import tb_broken  # noqa: F401  (imported while still valid)
+
+        (tmp_path / "tb_broken.py").write_text("raise RuntimeError('boom')\n")
+        result = engine.apply_reload_with_policy(context, BrimleyScanResult(functions=functions))
+    finally:
+        for name in ("tb_signal", "tb_plain", "tb_broken"):
+            sys.modules.pop(name, None)
+
+    # signal.signal only works on the main thread: the pool attempt fails, the serial retry succeeds
+    reload_diagnostics = [d for d in result.diagnostics if d.error_code == "ERR_MODULE_RELOAD"]
+    assert [d.file_path for d in reload_diagnostics] == [str(tmp_path / "tb_broken.py")]
+    assert reload_diagnostics[0].severity == "warning"
+    assert reload_diagnostics[0].message.startswith("[functions] Module 'tb_broken' failed to reload")
+    assert "boom" in reload_diagnostics[0].message
+    assert result.blocked_domains == []
+
+
+def test_reload_engine_drops_python_module_index_each_cycle(tmp_path):
+    from brimley.execution import python_runner
+
+    python_runner._MODULE_INDEX[str(tmp_path)] = {"stale": [str(tmp_path)]}
+
+    PartitionedReloadEngine().apply_reload_with_policy(BrimleyContext(), BrimleyScanResult())
+
+    assert str(tmp_path) not in python_runner._MODULE_INDEX
@@ -1508,3 +1508,95 @@ Hello
     assert any("reload success" in message.lower() for _, message in logs)
 
     repl.stop_auto_reload()
+
+
+def test_repl_reuses_mcp_adapter_across_reloads(tmp_path):
+    from brimley.core.registry import Registry
+
+    repl = BrimleyREPL(tmp_path, mcp_enabled_override=True)
+
+    adapter = repl._get_mcp_adapter()
+    repl.context.functions = Registry()
+
+    assert repl._get_mcp_adapter() is adapter
+    assert adapter.registry is repl.context.functions
+
+
+def test_repl_reset_rebuilds_mcp_adapter_for_new_context(tmp_path, monkeypatch):
+    repl = BrimleyREPL(tmp_path, mcp_enabled_override=False)
+    adapter = repl._get_mcp_adapter()
+
+    monkeypatch.setattr("brimley.cli.repl.sys.stdin.isatty", lambda: True)
+    inputs = iter(["reset", "/quit"])
+    monkeypatch.setattr(repl.prompt_session, "prompt", lambda *_args, **_kwargs: next(inputs))
+    monkeypatch.setattr(repl, "load", lambda: None)
+    monkeypatch.setattr(repl, "_shutdown_mcp_server", lambda: None)
+
+    repl.start()
+
+    rebuilt = repl._get_mcp_adapter()
+    assert rebuilt is not adapter
+    assert rebuilt.context is repl.context
+
+
+def test_repl_reload_skips_reregistration_when_tools_unchanged(tmp_path, monkeypatch):
+    repl = BrimleyREPL(tmp_path, mcp_enabled_override=True)
+
+    class FakeServer:
+        def __init__(self):
+            self.clear_calls = 0
+
+        def clear_tools(self):
+            self.clear_calls += 1
+
+    fake_server = FakeServer()
+    repl.mcp_server = fake_server
+    tool_state = {"description": "Say hello"}
+    calls = {"register": 0}
+
+    class FakeTool:
+        name = "hello_tool"
+        type = "template_function"
+
+    class FakeAdapter:
+        def __init__(self, registry, context):
+            pass
+
+        def discover_tools(self):
+            return [FakeTool()]
+
+        def is_fastmcp_available(self):
+            return True
+
+        def get_tool_schema_signatures(self, tools=None):
+            return {"hello_tool": "v1"}
+
+        def get_tool_description(self, func):
+            return tool_state["description"]
+
+        def register_tools(self, mcp_server=None):
+            calls["register"] += 1
+            return mcp_server
+
+    monkeypatch.setattr("brimley.cli.repl.BrimleyMCPAdapter", FakeAdapter)
+    monkeypatch.setattr(
+        repl.reload_engine,
+        "apply_reload_with_policy",
+        lambda _context, _scan: ReloadApplicationResult(
+            summary=ReloadSummary(functions=1, entities=len(repl.context.entities), tools=1),
+            blocked_domains=[],
+            diagnostics=[],
+        ),
+    )
+
+    repl._run_reload_cycle()
+    assert calls["register"] == 1
+
+    repl._run_reload_cycle()
+    assert calls["register"] == 1
+    assert fake_server.clear_calls == 1
+
+    tool_state["description"] = "Say hello politely"
+    repl._run_reload_cycle()
+    assert calls["register"] == 2
+    assert fake_server.clear_calls == 2
@@ -59,3 +59,62 @@ def test_repl_rpc_quit_request_stops_daemon():
 
     thread.join(timeout=1)
     assert not thread.is_alive()
+
+
+def test_repl_rpc_reports_invalid_requests_and_responses():
+    import socket
+    import socketserver
+
+    host = "127.0.0.1"
+    port = allocate_ephemeral_port(host=host)
+    daemon = ReplRPCDaemon(host=host, port=port, repl_session=FakeReplSession())
+
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    time.sleep(0.05)
+    with socket.create_connection((host, port), timeout=5) as sock:
+        sock.sendall(b'{"cmd": "hello"}\n')
+        reply = sock.makefile("rb").readline()
+
+    assert b'"ok":false' in reply
+    assert b"command" in reply
+
+    daemon.shutdown()
+    thread.join(timeout=1)
+
+    class GarbageHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            self.rfile.readline()
+            self.wfile.write(b"not json\n")
+
+    garbage_port = allocate_ephemeral_port(host=host)
+    server = socketserver.TCPServer((host, garbage_port), GarbageHandler)
+    garbage_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    garbage_thread.start()
+    try:
+        response = send_repl_rpc_command(host, garbage_port, "hello")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.ok is False
+    assert response.error.startswith("Invalid daemon response:")
+
+
+def test_repl_rpc_recv_line_reassembles_chunks_and_stops_at_newline():
+    import socket
+
+    from brimley.runtime.repl_rpc import _recv_line
+
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(b'{"command": ')
+        left.sendall(b'"hello"}\ntrailing')
+        left.shutdown(socket.SHUT_WR)
+        assert _recv_line(right) == b'{"command": "hello"}\n'
+
+    left, right = socket.socketpair()
+    with left, right:
+        left.close()
+        assert _recv_line(right) == b""
@@ -105,6 +105,20 @@ def test_map_strict_single_fails_on_multiple_rows(context):
     with pytest.raises(BrimleyExecutionError, match="Expected single row"):
         ResultMapper.map_result(raw, func, context)
 
+def test_map_empty_rows_for_single_shape_skip_type_resolution(context):
+    func = BrimleyFunction(name="test", type="sql_function", return_shape="UnknownEntity")
+    assert ResultMapper.map_result([], func, context) is None
+
+    ref = BrimleyFunction(name="test", type="sql_function", return_shape={"entity_ref": "UnknownEntity"})
+    assert ResultMapper.map_result([], ref, context) is None
+
+    with pytest.raises(KeyError, match="UnknownEntity"):
+        ResultMapper.map_result([{"id": 1}], func, context)
+
+    listed = BrimleyFunction(name="test", type="sql_function", return_shape="UnknownEntity[]")
+    with pytest.raises(KeyError, match="UnknownEntity"):
+        ResultMapper.map_result([], listed, context)
+
 def test_map_missing_fields_raises_validation_error(context):
     func = BrimleyFunction(name="test_func", type="sql_function", return_shape="MockUser")
     raw = {"id": 1} # Missing 'username'
@@ -156,3 +170,94 @@ def test_map_rejects_union_return_shape(context):
 
     with pytest.raises(BrimleyExecutionError, match="Union types are not supported"):
         ResultMapper.map_result("hello", func, context)
+
+
+def test_map_reuses_cached_type_adapter(context):
+    from brimley.execution.result_mapper import _get_adapter
+
+    func = BrimleyFunction(name="test", type="sql_function", return_shape="MockUser[]")
+    ResultMapper.map_result([{"id": 1, "username": "alice"}], func, context)
+    adapter = _get_adapter(MockUser, True)
+
+    ResultMapper.map_result([{"id": 2, "username": "bob"}], func, context)
+    assert _get_adapter(MockUser, True) is adapter
+
+
+def test_shorthand_parse_is_memoized():
+    from brimley.execution.result_mapper import _parse_shorthand
+
+    assert _parse_shorthand("List[MockUser]") == ("MockUser[]", True, "MockUser")
+    assert _parse_shorthand("List[MockUser]") is _parse_shorthand("List[MockUser]")
+    assert _parse_shorthand("integer") == ("int", False, "int")
+
+
+def test_return_plan_is_compiled_once_and_rebuilt_for_new_registry(context):
+    from brimley.core.registry import Registry
+
+    func = BrimleyFunction(name="test", type="sql_function", return_shape="MockUser[]")
+    ResultMapper.map_result([{"id": 1, "username": "alice"}], func, context)
+    plan = func._return_plan
+    assert plan.kind == "shorthand"
+    assert plan.is_list is True
+    assert plan.target_type is MockUser
+
+    ResultMapper.map_result([{"id": 2, "username": "bob"}], func, context)
+    assert func._return_plan is plan
+
+    context.entities = Registry()
+    context.entities.register(MockUser)  # type: ignore
+    ResultMapper.map_result([{"id": 3, "username": "carol"}], func, context)
+    assert func._return_plan is not plan
+    assert func._return_plan.entities is context.entities
+
+
+def test_inline_model_is_built_once_per_plan(context):
+    func = BrimleyFunction(
+        name="test",
+        type="sql_function",
+        return_shape={"inline": {"count": "int", "status": "string"}},
+    )
+
+    assert ResultMapper.map_result({"count": 1, "status": "a"}, func, context) == {"count": 1, "status": "a"}
+    model = func._return_plan.dynamic_model
+
+    assert ResultMapper.map_result({"count": 2, "status": "b"}, func, context) == {"count": 2, "status": "b"}
+    assert func._return_plan.dynamic_model is model
+
+
+def test_inline_shape_with_entity_field_returns_plain_dicts(context):
+    func = BrimleyFunction(
+        name="test",
+        type="sql_function",
+        return_shape={"inline": {"owner": "MockUser", "count": "int"}},
+    )
+
+    result = ResultMapper.map_result({"owner": {"id": 1, "username": "alice"}, "count": 3}, func, context)
+    assert result["owner"] == {"name": None, "id": 1, "username": "alice", "email": None}
+    assert result["count"] == 3
+
+
+def test_scalar_fast_path_matches_adapter_semantics(context):
+    int_func = BrimleyFunction(name="test", type="sql_function", return_shape="int")
+    assert ResultMapper.map_result(7, int_func, context) == 7
+    assert ResultMapper.map_result([7], int_func, context) == 7
+    assert ResultMapper.map_result(True, int_func, context) == 1
+    assert type(ResultMapper.map_result(True, int_func, context)) is int
+
+    float_func = BrimleyFunction(name="test", type="sql_function", return_shape="float")
+    assert type(ResultMapper.map_result(3, float_func, context)) is float
+    assert int_func._return_plan.scalar_type is int
+
+
+def test_inline_shape_rejects_multiple_rows_like_single_shorthand(context):
+    func = BrimleyFunction(
+        name="test",
+        type="sql_function",
+        return_shape={"inline": {"count": "int", "status": "string"}},
+    )
+
+    assert ResultMapper.map_result([], func, context) is None
+    assert ResultMapper.map_result([{"count": "1", "status": "a"}], func, context) == {"count": 1, "status": "a"}
+
+    with pytest.raises(BrimleyExecutionError, match="Expected single row for inline return shape, but got 2 rows"):
+        ResultMapper.map_result([{"count": 1, "status": "a"}, {"count": 2, "status": "b"}], func, context)
@@ -1,3 +1,6 @@
+import os
+import sys
+import time
 from pathlib import Path
 import pytest
 
@@ -283,3 +286,174 @@ def calc() -> int:
     assert execute_function_by_name(runtime.context, "calc", {}) == 2
 
     runtime.stop_auto_reload()
+
+
+def test_runtime_controller_resolves_root_dir_once(tmp_path, monkeypatch):
+    _write_config(tmp_path)
+    monkeypatch.chdir(tmp_path.parent)
+
+    controller = BrimleyRuntimeController(root_dir=Path(tmp_path.name))
+
+    assert controller.root_dir == tmp_path.resolve()
+    assert controller.root_dir.is_absolute()
+    assert controller.context.app["root_dir"] == str(controller.root_dir)
+
+
+def test_runtime_controller_watch_loop_keeps_deadline_cadence(tmp_path, monkeypatch):
+    _write_config(tmp_path)
+    controller = BrimleyRuntimeController(root_dir=tmp_path)
+    controller.auto_reload_watcher = object()  # type: ignore[assignment]
+
+    clock = {"now": 0.0}
+    poll_durations = iter([0.03, 0.25, 0.01])
+    waits: list[float] = []
+
+    def fake_poll_once(now):
+        clock["now"] += next(poll_durations)
+
+    def fake_wait(timeout):
+        waits.append(round(timeout, 6))
+        clock["now"] += timeout
+        if len(waits) == 3:
+            controller._stop_event.set()
+        return controller._stop_event.is_set()
+
+    monkeypatch.setattr("brimley.runtime.controller.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr(controller, "poll_once", fake_poll_once)
+    monkeypatch.setattr(controller._stop_event, "wait", fake_wait)
+
+    controller._watch_loop()
+
+    # 100ms interval: a 30ms poll waits the remainder, an overrun waits a full interval
+    assert waits == [0.07, 0.1, 0.09]
+
+
+def test_runtime_reload_cycle_short_circuits_when_scan_is_unchanged(tmp_path: Path, monkeypatch):
+    _write_config(tmp_path)
+    _write_tool(tmp_path / "hello.md", body="Hello V1", valid=True)
+
+    refresh_calls = {"count": 0}
+    runtime = BrimleyRuntimeController(
+        tmp_path,
+        mcp_refresh=lambda: refresh_calls.__setitem__("count", refresh_calls["count"] + 1),
+    )
+    first_result = runtime.load_initial()
+    functions = runtime.context.functions
+
+    def fail_apply(*args, **kwargs):
+        raise AssertionError("unchanged scan should not be re-applied")
+
+    monkeypatch.setattr(runtime.reload_engine, "apply_reload_with_policy", fail_apply)
+    (tmp_path / "notes.txt").write_text("unrelated")
+
+    assert runtime.run_reload_cycle() is first_result
+    assert runtime.context.functions is functions
+    assert refresh_calls["count"] == 1
+
+    monkeypatch.undo()
+    _write_tool(tmp_path / "hello.md", body="Hello V2", valid=True)
+    assert runtime.run_reload_cycle() is not first_result
+    assert refresh_calls["count"] == 2
+
+
+def test_runtime_reload_cycle_reloads_when_python_handler_source_changes(tmp_path: Path, monkeypatch):
+    _write_config(tmp_path)
+    module_file = tmp_path / "greeter_tool.py"
+    module_file.write_text(
+        """
+from brimley import function
+
+@function
+def greet() -> str:
+    return "v1"
+"""
+    )
+    settled = time.time() - 60
+    os.utime(module_file, (settled, settled))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "greeter_tool", raising=False)
+
+    runtime = BrimleyRuntimeController(tmp_path)
+    runtime.load_initial()
+    # Handler sources are located through sys.modules, so the cycle that first imports them is never cached
+    assert runtime._last_scan_fingerprint is None
+    runtime.run_reload_cycle()
+    fingerprint = runtime._last_scan_fingerprint
+    assert fingerprint is not None
+    assert [stamp[0] for stamp in fingerprint[1]] == [str(module_file)]
+
+    module_file.write_text(module_file.read_text().replace('"v1"', '"v2"'))
+    edited = time.time() - 30
+    os.utime(module_file, (edited, edited))
+    runtime.run_reload_cycle()
+
+    assert runtime._last_scan_fingerprint != fingerprint
+    assert sys.modules["greeter_tool"].greet() == "v2"
+
+
+def test_runtime_reload_cycle_never_caches_recently_modified_handler_sources(tmp_path: Path, monkeypatch):
+    _write_config(tmp_path)
+    module_file = tmp_path / "racy_tool.py"
+    module_file.write_text(
+        """
+from brimley import function
+
+@function
+def greet() -> str:
+    return "v1"
+"""
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "racy_tool", raising=False)
+
+    runtime = BrimleyRuntimeController(tmp_path)
+    runtime.load_initial()
+    runtime.run_reload_cycle()
+    # Modified within the racy window: a later same-size edit could keep (mtime, size)
+    assert runtime._last_scan_fingerprint is None
+
+    # Same size and the very same mtime, as a coarse-timestamp filesystem would report
+    original = os.stat(module_file)
+    module_file.write_text(module_file.read_text().replace('"v1"', '"v2"'))
+    os.utime(module_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+    assert os.stat(module_file).st_size == original.st_size
+
+    runtime.run_reload_cycle()
+
+    assert sys.modules["racy_tool"].greet() == "v2"
+
+
+def test_runtime_reload_cycle_reloads_handler_when_imported_helper_changes(tmp_path: Path, monkeypatch):
+    _write_config(tmp_path)
+    helper_file = tmp_path / "calc_helpers.py"
+    helper_file.write_text("VALUE = 1\n")
+    (tmp_path / "calc.py").write_text(
+        """
+import calc_helpers
+from brimley import function
+
+@function
+def calc() -> int:
+    return calc_helpers.VALUE
+"""
+    )
+    settled = time.time() - 60
+    for path in (helper_file, tmp_path / "calc.py"):
+        os.utime(path, (settled, settled))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("calc", "calc_helpers"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    runtime = BrimleyRuntimeController(tmp_path)
+    runtime.load_initial()
+    runtime.run_reload_cycle()
+    assert runtime._last_scan_fingerprint is not None
+    assert sys.modules["calc"].calc() == 1
+
+    # Same size, older than any racy window: only the helper's mtime tells the edit apart
+    helper_file.write_text("VALUE = 2\n")
+    edited = time.time() - 30
+    os.utime(helper_file, (edited, edited))
+
+    assert runtime.run_reload_cycle().status == ReloadCommandStatus.SUCCESS
+    assert sys.modules["calc"].calc() == 2
@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from brimley.runtime.reload_contracts import (
@@ -98,3 +100,22 @@ def test_watcher_state_machine_failure_returns_to_watching():
 def test_watcher_state_machine_invalid_transition_raises():
     with pytest.raises(ValueError):
         transition_watcher_state(WatcherState.WATCHING, WatcherEvent.RELOAD_SUCCESS)
+
+
+def test_watcher_state_machine_accepts_raw_values_and_reports_unknown_state():
+    assert transition_watcher_state("stopped", "start") is WatcherState.WATCHING
+    assert transition_watcher_state(WatcherState.RELOADING, WatcherEvent.STOP) is WatcherState.STOPPED
+
+    with pytest.raises(ValueError, match="Invalid watcher transition"):
+        transition_watcher_state(WatcherState.CHANGE_DETECTED, WatcherEvent.FILE_CHANGE)
+    with pytest.raises(ValueError, match="Unknown watcher state"):
+        transition_watcher_state("paused", WatcherEvent.START)
+
+
+def test_domain_swap_policy_returns_shared_frozen_decisions():
+    first = evaluate_domain_swap_policy({})
+    second = evaluate_domain_swap_policy({})
+
+    assert first[ReloadDomain.ENTITIES] is second[ReloadDomain.MCP_TOOLS]
+    with pytest.raises(FrozenInstanceError):
+        first[ReloadDomain.ENTITIES].can_swap = False